@@ -1,19 +1,39 @@
 """Async core API - AsyncDatabase and AsyncTable classes built on SQLAlchemy async."""
 from __future__ import annotations
 
+import asyncio
+import json
+import sys
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
+from functools import partial
+from typing import Any, AsyncIterator, Callable
 
-from sqlalchemy import MetaData, delete, insert, select, update, func
+from sqlalchemy import Integer, JSON, MetaData, TextClause, bindparam, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from .connection import AsyncConnectionPool, create_pool_config
-from .exceptions import ReadOnlyError, QueryError, TableNotFoundError
-from .query import FilterBuilder
+from .connection import ASYNC_POOL_DEFAULTS, AsyncConnectionPool, create_pool_config, resolve_url
+from .exceptions import ConnectionError, ReadOnlyError, QueryError, SchemaError, TableNotFoundError
+from .query import FilterBuilder, is_streamable, text_clause
+from .rows import iter_dicts
 from .schema import AsyncSchemaManager
-from .types import PrimaryKeyConfig, PrimaryKeyType, TypeInference
+from .types import PrimaryKeyConfig, PrimaryKeyType, TypeInference, default_pk_config
+from .upsert import prepare_upsert, returning_column
 from .validators import ReadOnlyValidator
 
+# Minimum batch size for the PostgreSQL COPY fast-path in insert_many().
+# Smaller batches use a regular INSERT to avoid COPY setup cost.
+COPY_THRESHOLD = 100
+
+# Rows fetched per batch when streaming Database.query() results
+QUERY_STREAM_SIZE = 1000
+
+# Max statements kept per table in the statement cache
+STMT_CACHE_SIZE = 256
+
+# Compiled SQL kept per engine (SQLAlchemy default is 500, which a few busy
+# tables with many filter shapes can cycle through)
+QUERY_CACHE_SIZE = 2000
+
 
 class AsyncDatabase:
     """
@@ -31,6 +51,19 @@ class AsyncDatabase:
         >>> await db.close()
     """
 
+    __slots__ = (
+        '_engine',
+        '_metadata',
+        '_schema',
+        '_pool',
+        '_read_only',
+        '_ensure_schema',
+        '_pk_config',
+        '_text_index_prefix',
+        '_tables',
+        '_closed',
+    )
+
     def __init__(
         self,
         engine: AsyncEngine,
@@ -61,9 +94,10 @@ class AsyncDatabase:
         self._pool = pool
         self._read_only = read_only
         self._ensure_schema = ensure_schema
-        self._pk_config = pk_config or PrimaryKeyConfig()
+        self._pk_config = pk_config or default_pk_config()
         self._text_index_prefix = text_index_prefix
         self._tables: dict[str, 'AsyncTable'] = {}
+        self._closed = False
 
     @classmethod
     async def connect(
@@ -72,12 +106,16 @@ class AsyncDatabase:
         read_only: bool = False,
         ensure_schema: bool = True,
         schema: str | None = None,
-        pool_size: int = 5,
-        max_overflow: int = 10,
+        pool_size: int = ASYNC_POOL_DEFAULTS['pool_size'],
+        max_overflow: int = ASYNC_POOL_DEFAULTS['max_overflow'],
+        pool_recycle: int = ASYNC_POOL_DEFAULTS['pool_recycle'],
         primary_key_type: str | PrimaryKeyType = PrimaryKeyType.INTEGER,
         primary_key_column: str = 'id',
         pk_config: PrimaryKeyConfig | None = None,
         text_index_prefix: int = 255,
+        pre_ping: bool = False,
+        pool_timeout: float = ASYNC_POOL_DEFAULTS['pool_timeout'],
+        reflection_cache_ttl: float = 0,
         **engine_kwargs,
     ) -> 'AsyncDatabase':
         """
@@ -88,13 +126,22 @@ class AsyncDatabase:
             read_only: If True, only SELECT queries allowed
             ensure_schema: If True, auto-create tables/columns
             schema: Database schema name (optional)
-            pool_size: Connection pool size (default: 5)
-            max_overflow: Max connections beyond pool_size (default: 10)
+            pool_size: Connection pool size (default: 20)
+            max_overflow: Max connections beyond pool_size (default: 40)
+            pool_recycle: Recycle connections after N seconds (default: 300)
             primary_key_type: Type of primary key for auto-created tables
                              ('integer', 'uuid', or PrimaryKeyType enum)
             primary_key_column: Name of primary key column (default: 'id')
             pk_config: Advanced PK configuration (overrides primary_key_type/column)
             text_index_prefix: Prefix length for TEXT column indexes in MySQL/MariaDB (default: 255)
+            pre_ping: Test connections with a round trip on every checkout
+                      (default: False)
+            pool_timeout: Seconds to wait for a free connection before
+                          raising (default: 10.0)
+            reflection_cache_ttl: If set, keep the reflected schema in
+                                  $XDG_CACHE_HOME/dbset for this many seconds
+                                  and load it on connect instead of
+                                  reflecting (default: 0 - disabled)
             **engine_kwargs: Additional arguments for create_async_engine
 
         Returns:
@@ -130,8 +177,11 @@ class AsyncDatabase:
             ...     max_overflow=20
             ... )
         """
+        # Validate URL and switch to a matching driver up front
+        url = resolve_url(url, async_driver=True)
+
         # Create engine config
-        engine_config = {**engine_kwargs}
+        engine_config = {'query_cache_size': QUERY_CACHE_SIZE, **engine_kwargs}
 
         # Only apply pool config for non-SQLite databases
         # (SQLite uses SingletonThreadPool which doesn't accept these params)
@@ -139,6 +189,9 @@ class AsyncDatabase:
             pool_config = create_pool_config(
                 pool_size=pool_size,
                 max_overflow=max_overflow,
+                pool_recycle=pool_recycle,
+                pre_ping=pre_ping,
+                pool_timeout=pool_timeout,
             )
             engine_config.update(pool_config)
 
@@ -148,18 +201,25 @@ class AsyncDatabase:
         # Create metadata
         metadata = MetaData(schema=schema)
 
-        # Create schema manager
-        schema_manager = AsyncSchemaManager(engine, metadata, schema)
-
         # Create connection pool
         pool = AsyncConnectionPool(engine)
 
+        # Create schema manager
+        schema_manager = AsyncSchemaManager(
+            engine, metadata, schema, pool=pool, cache_ttl=reflection_cache_ttl
+        )
+
+        # Warm up: open the first pooled connection and load the schema now,
+        # so connection problems surface here rather than on the first query
+        try:
+            await schema_manager.reflect()
+        except SchemaError as e:
+            await engine.dispose()
+            raise ConnectionError(f"Failed to connect to database: {e}")
+
         # Create primary key config
         if pk_config is None:
-            pk_config = PrimaryKeyConfig(
-                pk_type=primary_key_type,
-                column_name=primary_key_column
-            )
+            pk_config = default_pk_config(primary_key_type, primary_key_column)
 
         return cls(
             engine=engine,
@@ -187,8 +247,12 @@ class AsyncDatabase:
             >>> await users.insert({'name': 'John'})
         """
         # Return cached table if exists
-        if table_name in self._tables:
-            return self._tables[table_name]
+        table = self._tables.get(table_name)
+        if table is not None:
+            return table
+
+        # Intern name so later lookups hit the identity fast path
+        table_name = sys.intern(table_name)
 
         # Create new table wrapper
         table = AsyncTable(
@@ -201,24 +265,31 @@ class AsyncDatabase:
             text_index_prefix=self._text_index_prefix,
         )
 
-        # Cache it
-        self._tables[table_name] = table
+        # Reuse table reflected at connect time, so the first access to
+        # .table does not reflect again
+        table._table = self._schema.reflected_table(table_name)
 
-        return table
+        # Cache it; setdefault keeps the first wrapper if another thread
+        # created one for the same name in the meantime
+        return self._tables.setdefault(table_name, table)
 
     async def query(
         self,
         sql: str | Any,
+        _stream: bool = True,
         **params,
     ) -> AsyncIterator[dict]:
         """
         Execute raw SQL query or SQLAlchemy statement.
 
         Accepts both raw SQL strings and SQLAlchemy select() statements
-        for advanced queries.
+        for advanced queries. SELECT and WITH queries are streamed with a
+        server-side cursor in batches of QUERY_STREAM_SIZE rows; other
+        statements (e.g. UPDATE ... RETURNING) are fetched in one go.
 
         Args:
             sql: SQL string or SQLAlchemy statement
+            _stream: If False, fetch all rows at once instead of streaming
             **params: Query parameters for raw SQL
 
         Yields:
@@ -242,38 +313,242 @@ class AsyncDatabase:
         if self._read_only and isinstance(sql, str):
             ReadOnlyValidator.validate_sql(sql)
 
-        async with self._pool.connect() as conn:
-            if isinstance(sql, str):
-                # Raw SQL string
-                result = await conn.execute(sql, params)
-            else:
-                # SQLAlchemy statement
-                result = await conn.execute(sql)
+        # Raw SQL strings must be wrapped in text() to be executable;
+        # parsed ones are cached per string
+        stmt = text_clause(sql) if isinstance(sql, str) else sql
+
+        async with self._pool.acquire() as conn:
+            if not (_stream and is_streamable(stmt)):
+                for row in iter_dicts(await conn.execute(stmt, params)):
+                    yield row
+                return
+
+            stmt = stmt.execution_options(yield_per=QUERY_STREAM_SIZE)
+            result = await conn.stream(stmt, params)
+
+            # Yield rows as dicts, batch by batch
+            keys = tuple(result.keys())
+            async for partition in result.partitions():
+                for row in partition:
+                    yield dict(zip(keys, row))
+
+    async def execute_many(
+        self,
+        sql: str | Any,
+        rows: list[dict[str, Any]],
+    ) -> int:
+        """
+        Execute one statement for many parameter sets (executemany).
+
+        All parameter sets go to the driver in a single executemany call
+        within one transaction, so bulk UPDATE/DELETE/INSERT statements
+        skip the per-row table API. INSERTs are batched into multi-row
+        VALUES by SQLAlchemy where the dialect supports it.
+
+        Args:
+            sql: SQL string with :name parameters, or SQLAlchemy statement
+            rows: List of parameter dictionaries
+
+        Returns:
+            Number of parameter sets executed
+
+        Raises:
+            ReadOnlyError: If in read-only mode
+
+        Examples:
+            >>> await db.execute_many(
+            ...     "UPDATE users SET score = :score WHERE id = :id",
+            ...     [{'id': 1, 'score': 10}, {'id': 2, 'score': 20}],
+            ... )
+            2
+        """
+        if self._read_only:
+            raise ReadOnlyError("execute_many not allowed in read-only mode")
+
+        if not rows:
+            return 0
+
+        stmt = text_clause(sql) if isinstance(sql, str) else sql
+        async with self._pool.acquire() as conn:
+            await conn.execute(stmt, rows)
+        return len(rows)
+
+    async def gather_queries(
+        self,
+        statements: list[str | Any],
+    ) -> list[list[dict]]:
+        """
+        Execute several independent queries concurrently.
+
+        Each statement runs on its own pooled connection and all of them
+        are awaited with asyncio.gather(), so N round-trips overlap instead
+        of being paid one after another. asyncpg does not allow concurrent
+        operations on a single connection, hence one connection per
+        statement. On SQLite, and inside transaction(), the statements run
+        sequentially on one connection.
+
+        Args:
+            statements: SQL strings or SQLAlchemy statements (no parameters)
+
+        Returns:
+            List of result lists, in the same order as statements
+
+        Raises:
+            ReadOnlyError: If a write query is given in read-only mode
+
+        Examples:
+            >>> users, orders = await db.gather_queries([
+            ...     "SELECT * FROM users",
+            ...     select(orders_table).where(orders_table.c.total > 100),
+            ... ])
+        """
+        statements = [text_clause(s) if isinstance(s, str) else s for s in statements]
+        if self._read_only:
+            for stmt in statements:
+                if isinstance(stmt, TextClause):
+                    ReadOnlyValidator.validate_sql(stmt.text)
+
+        async def fetch(conn, stmt) -> list[dict]:
+            result = await conn.execute(stmt)
+            return list(iter_dicts(result))
+
+        if self._engine.dialect.name == 'sqlite' or self._pool.current is not None:
+            async with self._pool.acquire() as conn:
+                return [await fetch(conn, stmt) for stmt in statements]
 
-            # Yield rows as dicts
-            for row in result:
-                yield dict(row._mapping)
+        async def run(stmt) -> list[dict]:
+            async with self._pool.acquire() as conn:
+                return await fetch(conn, stmt)
+
+        return list(await asyncio.gather(*(run(stmt) for stmt in statements)))
 
     @asynccontextmanager
-    async def transaction(self):
+    async def transaction(self, batch: bool = False, chunk_size: int = 1000):
         """
         Start explicit transaction context.
 
         All operations within the context will be committed together
         or rolled back on exception.
 
+        With batch=True the block gets an AsyncBulkInserter instead of the
+        connection: rows passed to its insert() are buffered per table and
+        written as multi-row INSERTs (every chunk_size rows, and before
+        commit), so N inserts cost a few round-trips instead of N. Call
+        its flush() to make buffered rows visible to queries in the block.
+
+        Args:
+            batch: If True, yield an AsyncBulkInserter bound to the transaction
+            chunk_size: Number of buffered rows per table that triggers a
+                        write (batch mode only)
+
+        Yields:
+            Connection inside the transaction, or AsyncBulkInserter if batch=True
+
         Examples:
             >>> async with db.transaction():
             ...     await db['users'].insert({'name': 'Alice'})
             ...     await db['orders'].insert({'user_id': 1, 'total': 100})
             ...     # Both committed together
+
+            >>> # Buffer inserts, one multi-row INSERT per table on commit
+            >>> async with db.transaction(batch=True) as tx:
+            ...     for row in rows:
+            ...         await tx.insert('users', row)
         """
         if self._read_only:
             raise ReadOnlyError("Transactions not allowed in read-only mode")
 
+        changed: set[str] = set()
+        try:
+            with self._schema.track_ddl() as changed:
+                async with self._pool.transaction() as conn:
+                    if not batch:
+                        yield conn
+                        return
+
+                    inserter = AsyncBulkInserter(self, chunk_size)
+                    yield inserter
+                    await inserter.flush()
+        except BaseException:
+            # Tables created or altered in the rolled back transaction
+            # must be loaded again from the database
+            for name in changed:
+                table = self._tables.get(name)
+                if table is not None:
+                    table._table = None
+            raise
+
+    @asynccontextmanager
+    async def bulk(self, chunk_size: int = 1000) -> AsyncIterator['AsyncBulkInserter']:
+        """
+        Buffer single-row inserts and write them in batches.
+
+        Rows passed to the handle's insert() are collected per table and
+        written with insert_many() every chunk_size rows and on exit, so
+        row-at-a-time loops commit once per batch instead of once per row.
+        If the block raises, rows not yet written are discarded.
+
+        Args:
+            chunk_size: Number of buffered rows per table and key set that
+                        triggers a write
+
+        Yields:
+            AsyncBulkInserter handle
+
+        Raises:
+            ReadOnlyError: If in read-only mode
+
+        Examples:
+            >>> async with db.bulk() as bulk:
+            ...     for row in parsed_rows:
+            ...         await bulk.insert('users', row)
+        """
+        if self._read_only:
+            raise ReadOnlyError("INSERT not allowed in read-only mode")
+
+        inserter = AsyncBulkInserter(self, chunk_size)
+        yield inserter
+        await inserter.flush()
+
+    async def counts(self, *tables: str | tuple[str, dict[str, Any]]) -> dict[str, int]:
+        """
+        Count rows of several tables in one round-trip.
+
+        Each table becomes a scalar subquery of a single SELECT, so a
+        dashboard showing N counters waits for one query instead of N.
+
+        Args:
+            *tables: Table names, or (table_name, filters) tuples where
+                     filters are column filters as accepted by count()
+
+        Returns:
+            Dict of table_name -> number of matching rows
+
+        Raises:
+            TableNotFoundError: If a table doesn't exist (and ensure_schema is off)
+
+        Examples:
+            >>> await db.counts('users', ('orders', {'status': 'open'}))
+            {'users': 120, 'orders': 7}
+        """
+        if not tables:
+            return {}
+
+        names = []
+        columns = []
+        for i, spec in enumerate(tables):
+            name, filters = (spec, {}) if isinstance(spec, str) else spec
+            table = await self[name]._get_table()
+            stmt = select(func.count()).select_from(table)
+            where_clause = FilterBuilder.build(table, filters)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            names.append(name)
+            columns.append(stmt.scalar_subquery().label(f'count_{i}'))
+
         async with self._pool.acquire() as conn:
-            async with conn.begin():
-                yield conn
+            row = (await conn.execute(select(*columns))).one()
+        return dict(zip(names, row))
 
     async def tables(self) -> list[str]:
         """
@@ -289,6 +564,23 @@ class AsyncDatabase:
         """
         return await self._schema.get_table_names()
 
+    def invalidate(self) -> None:
+        """
+        Forget the reflected schema, so it is loaded again on next use.
+
+        The schema is reflected once and then kept up to date with the
+        changes made through this Database. Call this after schema changes
+        made elsewhere (migrations, raw DDL, other processes); it also
+        discards the on-disk copy kept with reflection_cache_ttl.
+
+        Examples:
+            >>> db.invalidate()
+            >>> await users.find_one(id=1)  # reflects the schema again
+        """
+        self._schema.invalidate()
+        for table in self._tables.values():
+            table._table = None
+
     async def close(self):
         """
         Close database connection and dispose engine.
@@ -299,6 +591,12 @@ class AsyncDatabase:
             >>> await db.close()
         """
         await self._pool.close()
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """Check if close() has been called."""
+        return self._closed
 
     @property
     def read_only(self) -> bool:
@@ -329,6 +627,25 @@ class AsyncTable:
         >>> await table.delete(name='John')
     """
 
+    __slots__ = (
+        '_db',
+        '_name',
+        '_schema',
+        '_pool',
+        '_read_only',
+        '_ensure_schema',
+        '_text_index_prefix',
+        '_table',
+        '_stmt_cache',
+        '_stmt_cache_table',
+        '_stmt_cache_width',
+        '_columns',
+        '_columns_table',
+        '_dialect_name',
+        '_pk_config',
+        '_ensured_indexes',
+    )
+
     def __init__(
         self,
         db: AsyncDatabase,
@@ -359,9 +676,26 @@ class AsyncTable:
         self._ensure_schema = ensure_schema
         self._text_index_prefix = text_index_prefix
         self._table = None  # SQLAlchemy Table (lazy loaded)
+        # Statements built against _stmt_cache_table, reused across calls
+        self._stmt_cache: dict[str, Any] = {}
+        self._stmt_cache_table = None
+        self._stmt_cache_width = 0
+        # Plain name -> Column dict of _columns_table, for FilterBuilder
+        self._columns: dict[str, Any] = {}
+        self._columns_table = None
+        # Invariant for the wrapper's lifetime - read once, not per row
+        self._dialect_name = db._engine.dialect.name
+        self._pk_config = db._pk_config
+        # Column sets already indexed by upsert()/upsert_many()
+        self._ensured_indexes: set[frozenset[str]] = set()
 
     async def _get_table(self):
-        """Lazy load SQLAlchemy Table object."""
+        """
+        Lazy load SQLAlchemy Table object.
+
+        Hot paths read self._table directly and only await this on a cold
+        miss, saving a coroutine round-trip per call once the table is loaded.
+        """
         if self._table is None:
             self._table = await self._schema.get_table(
                 self._name,
@@ -369,6 +703,142 @@ class AsyncTable:
             )
         return self._table
 
+    def _cached_stmt(self, table, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Get statement from per-table cache, building it on first use.
+
+        Reusing statement objects skips statement construction and cache
+        key generation on every call. The cache is dropped whenever the
+        SQLAlchemy Table object changes (e.g. after schema reflection) or
+        gains columns, since select(table) memoizes its column list.
+
+        Args:
+            table: SQLAlchemy Table object the statement is built against
+            key: Cache key (statement kind and shape)
+            build: Factory returning a new statement
+
+        Returns:
+            Cached or newly built statement
+        """
+        if self._stmt_cache_table is not table or self._stmt_cache_width != len(table.c):
+            self._stmt_cache.clear()
+            self._stmt_cache_table = table
+            self._stmt_cache_width = len(table.c)
+
+        stmt = self._stmt_cache.get(key)
+        if stmt is None:
+            if len(self._stmt_cache) >= STMT_CACHE_SIZE:
+                self._stmt_cache.clear()
+            stmt = self._stmt_cache[key] = build()
+        return stmt
+
+    def _column_map(self, table) -> dict[str, Any]:
+        """
+        Get name -> Column dict for table, rebuilt only when it changes.
+
+        A plain dict lookup is cheaper than going through table.c for
+        every filter column. Columns are only ever added to a Table, so a
+        changed column count means the dict is stale.
+
+        Args:
+            table: SQLAlchemy Table object
+
+        Returns:
+            Dictionary of column name -> Column
+        """
+        columns = self._columns
+        if self._columns_table is not table or len(columns) != len(table.c):
+            columns = self._columns = {col.name: col for col in table.c}
+            self._columns_table = table
+        return columns
+
+    async def _filtered_stmt(
+        self,
+        table,
+        key: tuple,
+        filters: dict[str, Any],
+        build: Callable[[Any], Any],
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Get statement for filters, reusing it for filters of the same shape.
+
+        Filters that only differ in values (see FilterBuilder.shape) share
+        one statement built with bind parameters, so FilterBuilder and
+        statement construction run once per shape instead of per call.
+
+        Args:
+            table: SQLAlchemy Table object
+            key: Cache key for everything except the filters
+            filters: Column filters
+            build: Factory taking the WHERE clause (or None) and returning
+                   a statement
+
+        Returns:
+            Tuple of (statement, bind parameters)
+        """
+        if not self._column_map(table).keys() >= filters.keys():
+            # The column may have been added by another process or Database
+            await self._schema.refresh_columns(table)
+
+        if len(filters) == 1:
+            # Point lookups like find_one(id=42): skip shape/param building
+            (column_name, value), = filters.items()
+            if value is not None and not isinstance(value, dict):
+                stmt = self._cached_stmt(
+                    table, (key, ((column_name, None),)),
+                    lambda: build(FilterBuilder.build_bound(table, filters, self._dialect)),
+                )
+                return stmt, {'dbset_w0': value}
+
+        shape = FilterBuilder.shape(filters)
+        if shape is None:
+            where_clause = FilterBuilder.build(
+                table, filters, columns=self._column_map(table)
+            )
+            return build(where_clause), {}
+
+        stmt = self._cached_stmt(
+            table, (key, shape),
+            lambda: build(FilterBuilder.build_bound(table, filters, self._dialect)),
+        )
+        return stmt, FilterBuilder.bind_params(filters)
+
+    def _missing_types(
+        self,
+        table,
+        rows: list[dict[str, Any]],
+        types: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get types for the keys of rows[0] (and types) that are not columns yet.
+
+        Only unknown keys go through type inference, so once the schema has
+        settled, writes skip inference and ensure_columns() entirely. Their
+        types are merged over all rows (see TypeInference.infer_types_from_rows).
+
+        Args:
+            table: SQLAlchemy Table object
+            rows: Rows about to be written (column names from the first)
+            types: Optional dict of column_name -> SQLAlchemy type overrides
+
+        Returns:
+            Dict of column_name -> SQLAlchemy type for missing columns
+        """
+        columns = table.c
+        missing = [key for key in rows[0] if key not in columns]
+        if missing:
+            inferred_types = TypeInference.infer_types_from_rows(
+                [{key: row.get(key) for key in missing} for row in rows],
+                dialect=self._dialect,
+            )
+        else:
+            inferred_types = {}
+        if types:
+            inferred_types.update(
+                {key: value for key, value in types.items() if key not in columns}
+            )
+        return inferred_types
+
     @property
     async def table(self):
         """
@@ -395,7 +865,7 @@ class AsyncTable:
     @property
     def _dialect(self) -> str:
         """Get database dialect name (e.g., 'postgresql', 'sqlite')."""
-        return self._db._engine.dialect.name
+        return self._dialect_name
 
     async def insert(
         self,
@@ -440,34 +910,29 @@ class AsyncTable:
         table = await self._schema.get_table(
             self._name,
             ensure_exists=ensure,
-            pk_config=self._db._pk_config if ensure else None
+            pk_config=self._pk_config if ensure else None
         )
 
         # Generate primary key value if needed (for UUID/CUSTOM types)
-        pk_col = self._db._pk_config.column_name
-        if pk_col not in row and self._db._pk_config.generator:
-            row[pk_col] = self._db._pk_config.generate_value()
+        pk_col = self._pk_config.column_name
+        if pk_col not in row and self._pk_config.generator:
+            row[pk_col] = self._pk_config.generate_value()
 
         # Infer types and ensure columns exist
         if ensure:
-            inferred_types = TypeInference.infer_types_from_row(row, dialect=self._dialect)
-            # Override with user-provided types
-            if types:
-                inferred_types.update(types)
-            await self._schema.ensure_columns(table, inferred_types)
+            missing_types = self._missing_types(table, [row], types)
+            if missing_types:
+                table = await self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
-            # Clear cached table and reload
-            self._table = None
-            table = await self._schema.get_table(self._name, ensure_exists=False)
-
-        # Insert row
-        stmt = insert(table).values(**row)
+        # Insert row (cached statement, values passed as parameters)
+        stmt = self._cached_stmt(table, 'insert', lambda: insert(table))
 
         async with self._pool.acquire() as conn:
-            result = await conn.execute(stmt)
+            result = await conn.execute(stmt, row)
             # For UUID/CUSTOM, return the generated value from row
             # For Integer, return from inserted_primary_key
-            if self._db._pk_config.pk_type != PrimaryKeyType.INTEGER:
+            if self._pk_config.pk_type != PrimaryKeyType.INTEGER:
                 return row.get(pk_col)
             else:
                 return result.inserted_primary_key[0]
@@ -477,14 +942,24 @@ class AsyncTable:
         rows: list[dict[str, Any]],
         ensure: bool | None = None,
         chunk_size: int = 1000,
+        use_copy: bool = True,
     ) -> int:
         """
         Insert multiple rows (batch operation).
 
+        On PostgreSQL with the asyncpg driver, batches of at least
+        COPY_THRESHOLD rows are loaded with binary COPY instead of
+        INSERT, which is several times faster for bulk ingest. Smaller
+        batches are sent as a single multi-row INSERT ... VALUES.
+
+        All chunks are written in one transaction, so the batch is
+        committed once: either every row is inserted or none is.
+
         Args:
             rows: List of dictionaries (rows to insert)
             ensure: If True, auto-create table/columns
             chunk_size: Number of rows per batch (default: 1000)
+            use_copy: If True, use COPY on PostgreSQL+asyncpg (default: True)
 
         Returns:
             Number of rows inserted
@@ -496,6 +971,9 @@ class AsyncTable:
             ... ]
             >>> count = await table.insert_many(rows)
             >>> print(count)  # 2
+
+            >>> # Force regular INSERT even on PostgreSQL
+            >>> count = await table.insert_many(rows, use_copy=False)
         """
         if self._read_only:
             raise ReadOnlyError("INSERT not allowed in read-only mode")
@@ -508,43 +986,139 @@ class AsyncTable:
         # Get or create table
         table = await self._schema.get_table(self._name, ensure_exists=ensure)
 
-        # Infer types from first row and ensure columns
+        # Infer types (merged over all rows) and ensure columns
+        # (must run before COPY - COPY does not auto-add columns)
         if ensure:
-            inferred_types = TypeInference.infer_types_from_row(rows[0], dialect=self._dialect)
-            await self._schema.ensure_columns(table, inferred_types)
-
-            # Clear cached table and reload
-            self._table = None
-            table = await self._schema.get_table(self._name, ensure_exists=False)
+            missing_types = self._missing_types(table, rows)
+            if missing_types:
+                table = await self._schema.ensure_columns(table, missing_types)
+            self._table = table
+
+        # COPY fast-path for large batches on PostgreSQL+asyncpg
+        if use_copy and len(rows) >= COPY_THRESHOLD and self._supports_copy:
+            return await self._copy_rows(table, rows)
+
+        # Multi-row VALUES: one statement per chunk, chunks stay under the
+        # bind limit. Only for rows that all have the same keys - padding
+        # the others with NULL would override server defaults, where
+        # executemany raises for the missing value instead
+        columns = None
+        if self._use_multi_values:
+            keys = rows[0].keys()
+            if all(row.keys() == keys for row in rows):
+                columns = [col_name for col_name in keys if col_name in table.c]
+        if columns:
+            max_params = self._db._engine.dialect.insertmanyvalues_max_parameters
+            chunk_size = max(1, min(chunk_size, max_params // len(columns)))
+        else:
+            stmt = self._cached_stmt(table, 'insert', lambda: insert(table))
 
-        # Insert in chunks
+        # Insert in chunks within a single transaction (one commit per batch)
         total = 0
-        for i in range(0, len(rows), chunk_size):
-            chunk = rows[i:i + chunk_size]
-            async with self._pool.acquire() as conn:
-                await conn.execute(insert(table), chunk)
+        async with self._pool.acquire() as conn:
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                if columns:
+                    values = [{col_name: row[col_name] for col_name in columns} for row in chunk]
+                    await conn.execute(insert(table).values(values))
+                else:
+                    await conn.execute(stmt, chunk)
                 total += len(chunk)
 
         return total
 
+    @property
+    def _use_multi_values(self) -> bool:
+        """
+        Check if insert_many should send multi-row VALUES statements.
+
+        SQLite runs executemany in-process, SQLAlchemy already batches
+        executemany into multi-row VALUES for psycopg2 and pyodbc, and the
+        MySQL drivers rewrite it themselves, so they gain nothing; Oracle
+        has no multi-row VALUES. That leaves PostgreSQL via psycopg 3,
+        asyncpg or pg8000.
+        """
+        dialect = self._db._engine.dialect
+        return (
+            dialect.supports_multivalues_insert
+            and dialect.name not in ('sqlite', 'mysql', 'mariadb')
+            and not dialect.use_insertmanyvalues_wo_returning
+        )
+
+    @property
+    def _supports_copy(self) -> bool:
+        """Check if the engine can use asyncpg's binary COPY."""
+        dialect = self._db._engine.dialect
+        return dialect.name == 'postgresql' and dialect.driver == 'asyncpg'
+
+    async def _copy_rows(self, table, rows: list[dict[str, Any]]) -> int:
+        """
+        Load rows with asyncpg's copy_records_to_table().
+
+        Columns are taken from the first row (same as executemany).
+        Values are gathered column by column and zipped into records, so
+        each column is walked once and JSON/JSONB columns are serialized
+        to text (as expected by the asyncpg codecs SQLAlchemy installs)
+        without a per-value column check.
+
+        Args:
+            table: SQLAlchemy Table object
+            rows: List of dictionaries (rows to insert)
+
+        Returns:
+            Number of rows inserted
+        """
+        columns = list(rows[0].keys())
+        json_columns = {
+            col.name for col in table.columns if isinstance(col.type, JSON)
+        }
+
+        values = []
+        for col_name in columns:
+            column = [row.get(col_name) for row in rows]
+            if col_name in json_columns:
+                column = [None if v is None else json.dumps(v) for v in column]
+            values.append(column)
+
+        async with self._pool.acquire() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.copy_records_to_table(
+                table.name,
+                records=list(zip(*values)),
+                columns=columns,
+                schema_name=table.schema,
+            )
+
+        return len(rows)
+
     async def find(
         self,
         _limit: int | None = None,
         _offset: int = 0,
         _order_by: str | list[str] | None = None,
+        _stream_size: int = 1000,
+        _as_dict: bool = True,
         **filters,
     ) -> AsyncIterator[dict]:
         """
         Find rows matching filters.
 
+        Results are streamed with a server-side cursor and fetched in
+        batches of _stream_size rows, so memory use stays bounded
+        regardless of result size.
+
         Args:
             _limit: Maximum number of rows to return
             _offset: Number of rows to skip
             _order_by: Column(s) to order by (prefix with '-' for DESC)
+            _stream_size: Number of rows fetched per batch (default: 1000)
+            _as_dict: If False, yield SQLAlchemy Row objects instead of
+                      dicts (attribute access, no per-row dict copy)
             **filters: Column filters (see FilterBuilder for syntax)
 
         Yields:
-            Rows as dictionaries
+            Rows as dictionaries (Rows if _as_dict is False)
 
         Examples:
             >>> # Find all active users over 18
@@ -563,39 +1137,64 @@ class AsyncTable:
             ... ):
             ...     print(user)
         """
-        table = await self._get_table()
-
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
-
-        # Build SELECT statement
-        stmt = select(table)
-
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
-
-        # Add ordering
-        if _order_by:
-            order_clauses = FilterBuilder.parse_order_by(table, _order_by)
-            stmt = stmt.order_by(*order_clauses)
-
-        # Add pagination
+        table = self._table
+        if table is None:
+            table = await self._get_table()
+
+        # Build SELECT statement, reused for filters of the same shape
+        order_key = (_order_by,) if isinstance(_order_by, str) else tuple(_order_by or ())
+
+        def build_select(where_clause):
+            stmt = select(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+
+            # Add ordering
+            if order_key:
+                stmt = stmt.order_by(*FilterBuilder.parse_order_by(table, list(order_key)))
+
+            # Add pagination (values are bound per call)
+            if _offset:
+                stmt = stmt.offset(bindparam('dbset_offset', type_=Integer))
+            if _limit:
+                stmt = stmt.limit(bindparam('dbset_limit', type_=Integer))
+            return stmt.execution_options(yield_per=_stream_size)
+
+        stmt, params = await self._filtered_stmt(
+            table,
+            ('find', order_key, bool(_offset), bool(_limit), _stream_size),
+            filters,
+            build_select,
+        )
         if _offset:
-            stmt = stmt.offset(_offset)
+            params['dbset_offset'] = _offset
         if _limit:
-            stmt = stmt.limit(_limit)
+            params['dbset_limit'] = _limit
 
-        # Execute and yield rows
-        async with self._pool.connect() as conn:
-            result = await conn.execute(stmt)
-            for row in result:
-                yield dict(row._mapping)
-
-    async def find_one(self, **filters) -> dict | None:
+        # Execute with server-side cursor and yield rows batch by batch
+        async with self._pool.acquire() as conn:
+            result = await conn.stream(stmt, params)
+            keys = tuple(result.keys())
+            async for partition in result.partitions():
+                if _as_dict:
+                    for row in partition:
+                        yield dict(zip(keys, row))
+                else:
+                    for row in partition:
+                        yield row
+
+    async def find_one(
+        self,
+        _offset: int = 0,
+        _order_by: str | list[str] | None = None,
+        **filters,
+    ) -> dict | None:
         """
         Find single row matching filters.
 
         Args:
+            _offset: Number of rows to skip
+            _order_by: Column(s) to order by
             **filters: Column filters
 
         Returns:
@@ -606,9 +1205,32 @@ class AsyncTable:
             >>> if user:
             ...     print(user['age'])
         """
-        async for row in self.find(_limit=1, **filters):
-            return row
-        return None
+        table = self._table
+        if table is None:
+            table = await self._get_table()
+
+        # Plain execute + first(): no streaming cursor or generator needed
+        order_key = (_order_by,) if isinstance(_order_by, str) else tuple(_order_by or ())
+
+        def build_select(where_clause):
+            stmt = select(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            if order_key:
+                stmt = stmt.order_by(*FilterBuilder.parse_order_by(table, list(order_key)))
+            if _offset:
+                stmt = stmt.offset(bindparam('dbset_offset', type_=Integer))
+            return stmt.limit(1)
+
+        stmt, params = await self._filtered_stmt(
+            table, ('find_one', order_key, bool(_offset)), filters, build_select
+        )
+        if _offset:
+            params['dbset_offset'] = _offset
+        async with self._pool.acquire() as conn:
+            result = await conn.execute(stmt, params)
+            row = result.mappings().first()
+        return dict(row) if row is not None else None
 
     async def all(self) -> AsyncIterator[dict]:
         """
@@ -638,20 +1260,22 @@ class AsyncTable:
             >>> total = await table.count()
             >>> adults = await table.count(age={'>=': 18})
         """
-        table = await self._get_table()
-
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
+        table = self._table
+        if table is None:
+            table = await self._get_table()
 
-        # Build COUNT statement
-        stmt = select(func.count()).select_from(table)
+        def build_count(where_clause):
+            stmt = select(func.count()).select_from(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            return stmt
 
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
+        # Build COUNT statement, reused for filters of the same shape
+        stmt, params = await self._filtered_stmt(table, ('count',), filters, build_count)
 
         # Execute
-        async with self._pool.connect() as conn:
-            result = await conn.execute(stmt)
+        async with self._pool.acquire() as conn:
+            result = await conn.execute(stmt, params)
             return result.scalar()
 
     async def update(
@@ -684,13 +1308,15 @@ class AsyncTable:
         if self._read_only:
             raise ReadOnlyError("UPDATE not allowed in read-only mode")
 
-        table = await self._get_table()
+        table = self._table
+        if table is None:
+            table = await self._get_table()
 
         # Build WHERE clause
         if keys:
             # Filter keys to only include columns that exist in the table
             # This matches dataset behavior: non-existent keys are ignored
-            table_cols = {col.name for col in table.columns}
+            table_cols = table.c
             valid_keys = [k for k in keys if k in table_cols and k in row]
 
             filters = {k: row[k] for k in valid_keys}
@@ -701,17 +1327,24 @@ class AsyncTable:
             if not row:
                 return 0
 
-        where_clause = FilterBuilder.build(table, filters)
-
-        if where_clause is None:
+        if not filters:
             raise QueryError("UPDATE requires WHERE clause (filters or keys)")
 
-        # Build UPDATE statement
-        stmt = update(table).where(where_clause).values(**row)
+        # Build UPDATE statement, reused for the same columns and filter shape
+        value_names = {col_name: f"dbset_v{i}" for i, col_name in enumerate(row)}
+
+        def build_update(where_clause):
+            return update(table).where(where_clause).values(
+                {col_name: bindparam(name) for col_name, name in value_names.items()}
+            )
+
+        stmt, params = await self._filtered_stmt(table, ('update', tuple(row)), filters, build_update)
+        for col_name, name in value_names.items():
+            params[name] = row[col_name]
 
         # Execute
         async with self._pool.acquire() as conn:
-            result = await conn.execute(stmt)
+            result = await conn.execute(stmt, params)
             return result.rowcount
 
     async def upsert(
@@ -761,26 +1394,28 @@ class AsyncTable:
             table = await self._schema.get_table(
                 self._name,
                 ensure_exists=True,
-                pk_config=self._db._pk_config
+                pk_config=self._pk_config
             )
 
             # Infer types and ensure columns exist
-            inferred_types = TypeInference.infer_types_from_row(row, dialect=self._dialect)
-            if types:
-                inferred_types.update(types)
-            await self._schema.ensure_columns(table, inferred_types)
+            missing_types = self._missing_types(table, [row], types)
+            if missing_types:
+                table = await self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
             # Filter keys to only include columns that exist in the table (for index creation)
             # After ensure_columns, columns from row + original table columns all exist
-            table_cols = {col.name for col in table.columns} | set(row.keys())
-            index_keys = [k for k in keys if k in table_cols]
+            table_cols = table.c
+            index_keys = [k for k in keys if k in table_cols or k in row]
 
             # Auto-create index on valid keys for performance
             if index_keys:
-                await self.create_index(index_keys)
+                await self._ensure_index(index_keys)
 
-            # Clear cached table
-            self._table = None
+        # One round-trip when the database can return the affected row's key
+        handled, pk = await self._upsert_returning(row, original_keys)
+        if handled:
+            return pk
 
         # Check if row exists using original keys (with .get() for missing keys)
         # This matches dataset behavior: non-existent keys cause query to fail/return None
@@ -799,6 +1434,78 @@ class AsyncTable:
             # Insert new
             return await self.insert(row, ensure=ensure, types=types)
 
+    async def _upsert_returning(self, row: dict[str, Any], keys: list[str]) -> tuple[bool, Any]:
+        """
+        Upsert row with a single statement that returns its primary key.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE ... RETURNING when the keys
+        have a unique index, otherwise UPDATE ... RETURNING followed by an
+        INSERT only if nothing was updated. Either way the SELECT that
+        upsert() would run first is skipped.
+
+        Args:
+            row: Dictionary of column_name -> value
+            keys: Key columns identifying the row
+
+        Returns:
+            Tuple of (handled, primary key). handled is False when the
+            database, table or row does not allow it (no RETURNING support,
+            no single-column primary key, unknown columns, no non-key values);
+            the caller then falls back to SELECT-then-write.
+        """
+        try:
+            table = self._table
+            if table is None:
+                table = await self._get_table()
+        except TableNotFoundError:
+            return False, None
+
+        dialect = self._db._engine.dialect
+        pk_column = returning_column(table)
+        update_columns = [col_name for col_name in row if col_name not in keys]
+        if (
+            pk_column is None
+            or not keys
+            or not update_columns
+            or not all(k in row for k in keys)
+            or not set(row).issubset(table.c.keys())
+        ):
+            return False, None
+
+        # INSERT ... ON CONFLICT DO UPDATE ... RETURNING pk
+        cached_stmt = partial(self._cached_stmt, table)
+        native = dialect.insert_returning and prepare_upsert(
+            table, [row], keys, self._dialect, self._pk_config, cached_stmt
+        )
+        if native:
+            stmt, batch = native
+            stmt = cached_stmt(
+                ('upsert_returning', tuple(keys), tuple(batch[0])),
+                lambda: stmt.returning(pk_column),
+            )
+            async with self._pool.acquire() as conn:
+                result = await conn.execute(stmt, batch[0])
+                return True, result.scalar_one()
+
+        if not dialect.update_returning:
+            return False, None
+
+        # UPDATE ... RETURNING pk, INSERT if no row matched
+        where_clause = FilterBuilder.build(
+            table, {k: row[k] for k in keys}, columns=self._column_map(table)
+        )
+        stmt = (
+            update(table)
+            .where(where_clause)
+            .values({col_name: row[col_name] for col_name in update_columns})
+            .returning(pk_column)
+        )
+        async with self._pool.acquire() as conn:
+            updated = (await conn.execute(stmt)).scalars().first()
+        if updated is not None:
+            return True, updated
+        return True, await self.insert(row, ensure=False)
+
     async def upsert_many(
         self,
         rows: list[dict[str, Any]],
@@ -810,6 +1517,12 @@ class AsyncTable:
         """
         Upsert multiple rows (batch operation).
 
+        If the keys are covered by a unique index (or the primary key) and
+        all rows have the same columns, rows are written with one
+        INSERT ... ON CONFLICT DO UPDATE (ON DUPLICATE KEY UPDATE on MySQL)
+        per chunk. Otherwise each row goes through upsert(), concurrently
+        (up to the pool's capacity) except on SQLite.
+
         Args:
             rows: List of dictionaries (rows to upsert)
             keys: List of key columns to check for existing rows
@@ -842,30 +1555,69 @@ class AsyncTable:
             table = await self._schema.get_table(
                 self._name,
                 ensure_exists=True,
-                pk_config=self._db._pk_config
+                pk_config=self._pk_config
             )
 
-            # Infer types from first row and ensure columns exist
-            inferred_types = TypeInference.infer_types_from_row(rows[0], dialect=self._dialect)
-            if types:
-                inferred_types.update(types)
-            await self._schema.ensure_columns(table, inferred_types)
+            # Infer types (merged over all rows) and ensure columns exist
+            missing_types = self._missing_types(table, rows, types)
+            if missing_types:
+                table = await self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
             # Filter keys to only include columns that exist in the table (for index creation)
             # After ensure_columns, columns from row + original table columns all exist
-            table_cols = {col.name for col in table.columns} | set(rows[0].keys())
-            index_keys = [k for k in keys if k in table_cols]
+            table_cols = table.c
+            index_keys = [k for k in keys if k in table_cols or k in rows[0]]
 
             # Auto-create index on valid keys for performance (once for batch)
             if index_keys:
-                await self.create_index(index_keys)
+                await self._ensure_index(index_keys)
 
-            # Clear cached table
-            self._table = None
+        # Single INSERT ... ON CONFLICT per chunk when the keys have a
+        # unique index and the batch is uniform
+        try:
+            table = self._table
+            if table is None:
+                table = await self._get_table()
+        except TableNotFoundError:
+            table = None
+        native = table is not None and prepare_upsert(
+            table, rows, keys, self._dialect, self._pk_config,
+            partial(self._cached_stmt, table),
+        )
+        if native:
+            stmt, batch = native
+            async with self._pool.acquire() as conn:
+                for i in range(0, len(batch), chunk_size):
+                    await conn.execute(stmt, batch[i:i + chunk_size])
+            return len(rows)
+
+        # SQLite serializes writers, so concurrency would only add lock errors;
+        # inside transaction() all rows share one connection
+        if self._dialect == 'sqlite' or self._pool.current is not None:
+            for row in rows:
+                await self.upsert(row, keys=keys, ensure=False, types=types)
+            return len(rows)
+
+        # Upsert rows concurrently, bounded by pool capacity. Rows sharing
+        # a key run in order inside one task, so the last one still wins.
+        limit = asyncio.Semaphore(self._pool.capacity or chunk_size)
+
+        async def upsert_group(group: list[dict[str, Any]]) -> None:
+            async with limit:
+                for row in group:
+                    await self.upsert(row, keys=keys, ensure=False, types=types)
 
-        # Process each row (upsert handles non-existent keys gracefully)
-        for row in rows:
-            await self.upsert(row, keys=keys, ensure=False, types=types)
+        for i in range(0, len(rows), chunk_size):
+            groups: dict[Any, list[dict[str, Any]]] = {}
+            for row in rows[i:i + chunk_size]:
+                key = tuple(row.get(k) for k in keys)
+                try:
+                    hash(key)
+                except TypeError:
+                    key = None  # Unhashable key values share one ordered group
+                groups.setdefault(key, []).append(row)
+            await asyncio.gather(*(upsert_group(group) for group in groups.values()))
 
         return len(rows)
 
@@ -892,33 +1644,49 @@ class AsyncTable:
         if not filters:
             raise QueryError("DELETE requires WHERE clause (provide filters)")
 
-        table = await self._get_table()
+        table = self._table
+        if table is None:
+            table = await self._get_table()
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
-
-        # Build DELETE statement
-        stmt = delete(table).where(where_clause)
+        # Build DELETE statement, reused for filters of the same shape
+        stmt, params = await self._filtered_stmt(
+            table, ('delete',), filters, lambda where_clause: delete(table).where(where_clause)
+        )
 
         # Execute
         async with self._pool.acquire() as conn:
-            result = await conn.execute(stmt)
+            result = await conn.execute(stmt, params)
             return result.rowcount
 
     async def distinct(
         self,
         *columns: str,
+        _stream_size: int = 1000,
+        _auto_index: bool = False,
+        _as_dict: bool = True,
         **filters,
     ) -> AsyncIterator[dict]:
         """
         Get distinct values for specified columns.
 
+        Results are streamed from a server-side cursor (where supported)
+        in batches of _stream_size rows, so high-cardinality columns are
+        not buffered in memory.
+
         Args:
             *columns: Column names to select
+            _stream_size: Number of rows fetched per batch (default: 1000)
+            _auto_index: If True, create an index on the columns on first
+                         use, so the database can scan the index instead
+                         of the whole table; skipped in read-only mode
+                         (default: False)
+            _as_dict: If False, yield SQLAlchemy Row objects instead of
+                      dicts, skipping a dict allocation per row; Rows
+                      support row[0] and row.column access (default: True)
             **filters: Column filters
 
         Yields:
-            Distinct rows as dictionaries
+            Distinct rows as dictionaries (Rows if _as_dict is False)
 
         Examples:
             >>> # Get distinct statuses
@@ -932,23 +1700,51 @@ class AsyncTable:
         if not columns:
             raise QueryError("DISTINCT requires at least one column")
 
-        table = await self._get_table()
+        if _auto_index and not self._read_only:
+            await self._ensure_index(list(columns))
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
+        table = self._table
+        if table is None:
+            table = await self._get_table()
 
-        # Build SELECT DISTINCT statement
-        selected_columns = [table.c[col] for col in columns]
-        stmt = select(*selected_columns).distinct()
+        def build_select(where_clause):
+            selected_columns = [table.c[col] for col in columns]
+            stmt = select(*selected_columns).distinct()
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            return stmt.execution_options(yield_per=_stream_size)
 
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
+        # Build SELECT DISTINCT statement (cached per filter shape)
+        stmt, params = await self._filtered_stmt(
+            table, ('distinct', columns, _stream_size), filters, build_select
+        )
 
-        # Execute and yield rows
-        async with self._pool.connect() as conn:
-            result = await conn.execute(stmt)
-            for row in result:
-                yield dict(row._mapping)
+        # Execute with server-side cursor and yield rows batch by batch
+        async with self._pool.acquire() as conn:
+            result = await conn.stream(stmt, params)
+            keys = tuple(result.keys())
+            async for partition in result.partitions():
+                if _as_dict:
+                    for row in partition:
+                        yield dict(zip(keys, row))
+                else:
+                    for row in partition:
+                        yield row
+
+    async def _ensure_index(self, columns: list[str]) -> None:
+        """
+        Create index once per table wrapper (upsert keys, distinct columns).
+
+        create_index() is idempotent but reflects the schema to check for an
+        existing index, so repeated calls remember what they already did.
+
+        Args:
+            columns: Column names to index
+        """
+        signature = frozenset(columns)
+        if signature not in self._ensured_indexes:
+            await self.create_index(columns)
+            self._ensured_indexes.add(signature)
 
     async def create_index(
         self,
@@ -1007,7 +1803,9 @@ class AsyncTable:
         if isinstance(columns, str):
             columns = [columns]
 
-        table = await self._get_table()
+        table = self._table
+        if table is None:
+            table = await self._get_table()
         return await self._schema.create_index(
             table, columns, name, unique,
             text_index_prefix=self._text_index_prefix,
@@ -1042,5 +1840,76 @@ class AsyncTable:
         if isinstance(columns, str):
             columns = [columns]
 
-        table = await self._get_table()
+        table = self._table
+        if table is None:
+            table = await self._get_table()
         return await self._schema.index_exists(table, columns)
+
+
+class AsyncBulkInserter:
+    """
+    Batching handle returned by AsyncDatabase.bulk() and transaction(batch=True).
+
+    Rows are buffered per table and key set, since insert_many() takes its
+    columns from the first row: rows with different keys go to separate
+    multi-row INSERTs (and new keys become columns) instead of failing.
+
+    Examples:
+        >>> async with db.bulk(chunk_size=500) as bulk:
+        ...     await bulk.insert('users', {'name': 'John'})
+        ...     await bulk.insert('orders', {'user': 'John', 'total': 100})
+    """
+
+    __slots__ = ('_db', '_chunk_size', '_buffers', '_count')
+
+    def __init__(self, db: AsyncDatabase, chunk_size: int = 1000):
+        """
+        Initialize bulk inserter.
+
+        Args:
+            db: Parent AsyncDatabase
+            chunk_size: Number of buffered rows per table and key set that
+                        triggers a write
+        """
+        self._db = db
+        self._chunk_size = chunk_size
+        self._buffers: dict[tuple, list[dict[str, Any]]] = {}
+        self._count = 0
+
+    async def insert(self, table_name: str, row: dict[str, Any]) -> None:
+        """
+        Buffer row for insertion, writing its buffer when full.
+
+        Args:
+            table_name: Name of table
+            row: Dictionary of column_name -> value
+        """
+        key = (table_name, tuple(row))
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(row)
+        if len(buffer) >= self._chunk_size:
+            await self._flush_buffer(key)
+
+    async def flush(self) -> int:
+        """
+        Write all buffered rows.
+
+        Returns:
+            Total number of rows written by this inserter so far
+        """
+        for key in list(self._buffers):
+            await self._flush_buffer(key)
+        return self._count
+
+    async def _flush_buffer(self, key: tuple) -> None:
+        """Write buffered rows of one table and key set with insert_many()."""
+        rows = self._buffers.pop(key, None)
+        if rows:
+            self._count += await self._db[key[0]].insert_many(
+                rows, chunk_size=self._chunk_size
+            )
+
+    @property
+    def count(self) -> int:
+        """Number of rows written so far."""
+        return self._count
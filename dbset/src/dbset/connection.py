@@ -1,14 +1,100 @@
 """Connection pooling and management for sync and async engines."""
 from __future__ import annotations
 
+import warnings
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncIterator, Iterator
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
 
 from sqlalchemy import Engine
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError, SQLAlchemyError
 
 from .exceptions import ConnectionError
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+# Errors reported as ConnectionError when checking out a connection.
+# Drivers such as asyncpg raise OSError for refused/dropped connections
+# without SQLAlchemy wrapping it. Anything else (including cancellation)
+# propagates unchanged.
+CHECKOUT_ERRORS = (SQLAlchemyError, OSError)
+
+# Default pool settings for Database.connect() and connect() (not used for
+# SQLite). pool_size + max_overflow should cover the number of queries run
+# at once; pool_timeout makes an exhausted pool fail fast.
+POOL_DEFAULTS = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_timeout': 10.0,
+    'pool_recycle': 300,
+}
+
+# Async applications run many queries concurrently on one pool
+# (asyncio.gather), so AsyncDatabase.connect() and async_connect() get more
+ASYNC_POOL_DEFAULTS = {**POOL_DEFAULTS, 'pool_size': 20, 'max_overflow': 40}
+
+
+class _PooledConnection:
+    """
+    Async context manager returned by AsyncConnectionPool.acquire()/connect().
+
+    A plain class rather than an @asynccontextmanager generator: it is
+    entered for every statement, and this avoids creating a generator and
+    its wrapper (twice over, as AsyncEngine.begin() is one too) each time.
+    """
+
+    __slots__ = ('_pool', '_begin', '_error', '_conn', '_trans')
+
+    def __init__(self, pool: AsyncConnectionPool, begin: bool, error: str):
+        self._pool = pool
+        self._begin = begin
+        self._error = error
+        self._conn = None
+        self._trans = None
+
+    async def __aenter__(self) -> AsyncConnection:
+        conn = self._pool._current.get()
+        if conn is not None:
+            return conn  # Inside transaction(): reuse its connection
+
+        try:
+            conn = await self._pool._engine.connect().start(is_ctxmanager=True)
+            if self._begin:
+                try:
+                    self._trans = await conn.begin().start(is_ctxmanager=True)
+                except BaseException:
+                    await conn.close()
+                    raise
+        except CHECKOUT_ERRORS as e:
+            raise ConnectionError(f"{self._error}: {e}") from e
+
+        self._conn = conn
+        return conn
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        conn = self._conn
+        if conn is None:
+            return False
+
+        trans = self._trans
+        self._conn = self._trans = None
+        try:
+            try:
+                if trans is not None:
+                    # Commits, or rolls back if the block raised
+                    await trans.__aexit__(exc_type, exc, tb)
+            finally:
+                await conn.__aexit__(exc_type, exc, tb)
+        except SQLAlchemyError as e:
+            raise ConnectionError(f"{self._error}: {e}") from e
+
+        if isinstance(exc, SQLAlchemyError):
+            raise ConnectionError(f"{self._error}: {exc}") from exc
+        return False
+
 
 class AsyncConnectionPool:
     """
@@ -26,12 +112,38 @@ class AsyncConnectionPool:
             engine: SQLAlchemy AsyncEngine with built-in connection pool
         """
         self._engine = engine
+        # Connection of the transaction() block running in this context
+        self._current: ContextVar[AsyncConnection | None] = ContextVar(
+            'dbset_connection', default=None
+        )
+
+    @property
+    def current(self) -> AsyncConnection | None:
+        """Connection of the enclosing transaction() block, if any."""
+        return self._current.get()
+
+    @property
+    def capacity(self) -> int | None:
+        """
+        Maximum number of connections the pool hands out at once.
 
-    @asynccontextmanager
-    async def acquire(self) -> AsyncIterator[AsyncConnection]:
+        Returns:
+            pool_size + max_overflow, or None if the pool is unbounded
+            (NullPool, or max_overflow=-1)
+        """
+        pool = self._engine.pool
+        size = getattr(pool, 'size', None)
+        overflow = getattr(pool, '_max_overflow', 0)
+        if not callable(size) or overflow < 0:
+            return None
+        return size() + overflow
+
+    def acquire(self) -> _PooledConnection:
         """
         Acquire connection from pool as async context manager.
 
+        Inside transaction(), yields the transaction's connection instead.
+
         Yields:
             AsyncConnection from the pool
 
@@ -42,14 +154,9 @@ class AsyncConnectionPool:
             >>> async with pool.acquire() as conn:
             ...     result = await conn.execute(stmt)
         """
-        try:
-            async with self._engine.begin() as conn:
-                yield conn
-        except Exception as e:
-            raise ConnectionError(f"Failed to acquire connection: {e}")
+        return _PooledConnection(self, True, "Failed to acquire connection")
 
-    @asynccontextmanager
-    async def connect(self) -> AsyncIterator[AsyncConnection]:
+    def connect(self) -> _PooledConnection:
         """
         Get connection without starting transaction.
 
@@ -62,11 +169,30 @@ class AsyncConnectionPool:
             >>> async with pool.connect() as conn:
             ...     result = await conn.execute(stmt)
         """
-        try:
-            async with self._engine.connect() as conn:
+        return _PooledConnection(self, False, "Failed to connect")
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncConnection]:
+        """
+        Acquire connection and share it with everything in this context.
+
+        Until the block exits, acquire() and connect() from the same task
+        (or thread) yield this connection instead of checking out another
+        one, so all statements join one transaction.
+
+        Yields:
+            AsyncConnection inside a transaction
+
+        Examples:
+            >>> async with pool.transaction() as conn:
+            ...     await table.insert(row)  # runs on conn
+        """
+        async with self.acquire() as conn:
+            token = self._current.set(conn)
+            try:
                 yield conn
-        except Exception as e:
-            raise ConnectionError(f"Failed to connect: {e}")
+            finally:
+                self._current.reset(token)
 
     async def close(self):
         """
@@ -93,12 +219,23 @@ class SyncConnectionPool:
             engine: SQLAlchemy Engine with built-in connection pool
         """
         self._engine = engine
+        # Connection of the transaction() block running in this context
+        self._current: ContextVar[Any | None] = ContextVar(
+            'dbset_connection', default=None
+        )
+
+    @property
+    def current(self) -> Any | None:
+        """Connection of the enclosing transaction() block, if any."""
+        return self._current.get()
 
     @contextmanager
     def acquire(self) -> Iterator:
         """
         Acquire connection from pool as context manager.
 
+        Inside transaction(), yields the transaction's connection instead.
+
         Yields:
             Connection from the pool
 
@@ -109,11 +246,16 @@ class SyncConnectionPool:
             >>> with pool.acquire() as conn:
             ...     result = conn.execute(stmt)
         """
+        conn = self._current.get()
+        if conn is not None:
+            yield conn
+            return
+
         try:
             with self._engine.begin() as conn:
                 yield conn
-        except Exception as e:
-            raise ConnectionError(f"Failed to acquire connection: {e}")
+        except SQLAlchemyError as e:
+            raise ConnectionError(f"Failed to acquire connection: {e}") from e
 
     @contextmanager
     def connect(self) -> Iterator:
@@ -129,11 +271,39 @@ class SyncConnectionPool:
             >>> with pool.connect() as conn:
             ...     result = conn.execute(stmt)
         """
+        conn = self._current.get()
+        if conn is not None:
+            yield conn
+            return
+
         try:
             with self._engine.connect() as conn:
                 yield conn
-        except Exception as e:
-            raise ConnectionError(f"Failed to connect: {e}")
+        except SQLAlchemyError as e:
+            raise ConnectionError(f"Failed to connect: {e}") from e
+
+    @contextmanager
+    def transaction(self) -> Iterator:
+        """
+        Acquire connection and share it with everything in this context.
+
+        Until the block exits, acquire() and connect() from the same task
+        (or thread) yield this connection instead of checking out another
+        one, so all statements join one transaction.
+
+        Yields:
+            Connection inside a transaction
+
+        Examples:
+            >>> with pool.transaction() as conn:
+            ...     table.insert(row)  # runs on conn
+        """
+        with self.acquire() as conn:
+            token = self._current.set(conn)
+            try:
+                yield conn
+            finally:
+                self._current.reset(token)
 
     def close(self):
         """
@@ -145,19 +315,33 @@ class SyncConnectionPool:
 
 
 def create_pool_config(
-    pool_size: int = 5,
-    max_overflow: int = 10,
-    pool_timeout: float = 30.0,
-    pool_recycle: int = 3600,
+    pool_size: int = POOL_DEFAULTS['pool_size'],
+    max_overflow: int = POOL_DEFAULTS['max_overflow'],
+    pool_timeout: float = POOL_DEFAULTS['pool_timeout'],
+    pool_recycle: int = POOL_DEFAULTS['pool_recycle'],
+    pre_ping: bool = False,
 ) -> dict:
     """
     Create connection pool configuration for SQLAlchemy engine.
 
+    Only pool_size connections are kept open. Connections opened beyond
+    that (up to max_overflow) serve load peaks and are closed as soon as
+    they are returned while the pool is full, so a burst does not hold
+    connections afterwards; callers block for up to pool_timeout only
+    once all of them are in use.
+
+    Defaults come from POOL_DEFAULTS; async callers pass
+    ASYNC_POOL_DEFAULTS (see AsyncDatabase.connect).
+
     Args:
-        pool_size: Number of connections to maintain in pool (default: 5)
-        max_overflow: Max connections beyond pool_size (default: 10)
-        pool_timeout: Seconds to wait for connection (default: 30.0)
-        pool_recycle: Recycle connections after N seconds (default: 3600)
+        pool_size: Number of connections to maintain in pool (default: 10)
+        max_overflow: Max connections beyond pool_size (default: 20)
+        pool_timeout: Seconds to wait for connection (default: 10.0)
+        pool_recycle: Recycle connections after N seconds (default: 300)
+        pre_ping: Test each connection with a round trip on checkout
+                  (default: False). Stale connections are replaced by
+                  pool_recycle instead; enable this only where idle
+                  connections get dropped in under pool_recycle seconds.
 
     Returns:
         Dictionary of pool configuration for create_engine/create_async_engine
@@ -171,5 +355,102 @@ def create_pool_config(
         'max_overflow': max_overflow,
         'pool_timeout': pool_timeout,
         'pool_recycle': pool_recycle,
-        'pool_pre_ping': True,  # Test connections before using
+        'pool_pre_ping': pre_ping,
     }
+
+
+# Driver substitutions for URLs that name a driver of the wrong kind
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+}
+SYNC_DRIVERS = {
+    'postgresql+asyncpg': 'postgresql',
+    'sqlite+aiosqlite': 'sqlite',
+}
+
+
+def resolve_url(url: str, async_driver: bool) -> str:
+    """
+    Validate database URL and switch it to a matching sync/async driver.
+
+    Mismatched drivers (e.g. 'postgresql://' passed to async_connect)
+    would otherwise only fail on the first query.
+
+    Args:
+        url: Database URL
+        async_driver: True for AsyncDatabase, False for Database
+
+    Returns:
+        URL unchanged, or with its driver replaced (emits a warning)
+
+    Raises:
+        ConnectionError: If URL cannot be parsed
+
+    Examples:
+        >>> resolve_url('postgresql://localhost/mydb', async_driver=True)
+        'postgresql+asyncpg://localhost/mydb'
+        >>> resolve_url('sqlite+aiosqlite:///db.sqlite', async_driver=False)
+        'sqlite:///db.sqlite'
+    """
+    try:
+        parsed = make_url(url)
+    except ArgumentError as e:
+        raise ConnectionError(f"Invalid database URL: {e}")
+
+    drivers = ASYNC_DRIVERS if async_driver else SYNC_DRIVERS
+    drivername = drivers.get(parsed.drivername)
+    if drivername is None:
+        return url
+
+    warnings.warn(
+        f"Driver '{parsed.drivername}' does not match the "
+        f"{'async' if async_driver else 'sync'} API, using '{drivername}' instead",
+        stacklevel=3,
+    )
+    # Only the scheme changes - keep the rest of the URL verbatim
+    return drivername + url[len(parsed.drivername):]
+
+
+def _freeze(value: Any) -> Any:
+    """Convert dicts/lists in engine options to hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def connection_key(url: str, **options: Any) -> tuple | None:
+    """
+    Build cache key identifying an engine by URL and connect options.
+
+    Args:
+        url: Database URL (after resolve_url)
+        **options: connect() arguments and engine kwargs
+
+    Returns:
+        Hashable key, or None if the connection must not be shared
+        (in-memory SQLite databases, unhashable options)
+
+    Examples:
+        >>> connection_key('sqlite:///app.db', read_only=False) is not None
+        True
+        >>> connection_key('sqlite:///:memory:') is None
+        True
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == 'sqlite' and (
+        parsed.database in (None, '', ':memory:')
+        or parsed.query.get('mode') == 'memory'
+    ):
+        return None  # Every in-memory connection is a separate database
+
+    key = (parsed.render_as_string(hide_password=False), _freeze(options))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
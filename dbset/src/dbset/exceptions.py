@@ -19,6 +19,10 @@ class TableNotFoundError(DatasetError):
         self.table_name = table_name
         super().__init__(f"Table '{table_name}' does not exist")
 
+    def __reduce__(self):
+        # Rebuild from constructor args, not the formatted message
+        return type(self), (self.table_name,), self.__dict__
+
 
 class ColumnNotFoundError(DatasetError):
     """Raised when attempting to access a column that doesn't exist."""
@@ -30,6 +34,9 @@ class ColumnNotFoundError(DatasetError):
             f"Column '{column_name}' does not exist in table '{table_name}'"
         )
 
+    def __reduce__(self):
+        return type(self), (self.column_name, self.table_name), self.__dict__
+
 
 class ReadOnlyError(DatasetError):
     """Raised when attempting write operations in read-only mode."""
@@ -40,6 +47,9 @@ class ReadOnlyError(DatasetError):
             f"Operation '{operation}' not allowed in read-only mode"
         )
 
+    def __reduce__(self):
+        return type(self), (self.operation,), self.__dict__
+
 
 class TransactionError(DatasetError):
     """Raised when transaction operation fails."""
@@ -58,6 +68,9 @@ class SchemaError(DatasetError):
         self.table_name = table_name
         super().__init__(message)
 
+    def __reduce__(self):
+        return type(self), (*self.args, self.table_name), self.__dict__
+
 
 class QueryError(DatasetError):
     """Raised when query execution fails."""
@@ -1,14 +1,82 @@
 """Query builder - translates dict-based filters to SQLAlchemy WHERE clauses."""
 from __future__ import annotations
 
-from typing import Any
-
-from sqlalchemy import Table, and_, or_, not_
+import operator
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Mapping
+
+from sqlalchemy import JSON, Table, TextClause, all_, and_, any_, bindparam, or_, not_, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
+from sqlalchemy.sql.operators import ColumnOperators
 
 from .exceptions import QueryError
 
 
+# LIKE-style operators and the pattern their value is wrapped in
+LIKE_PATTERNS = {
+    'startswith': '{}%',
+    'endswith': '%{}',
+    'contains': '%{}%',
+}
+
+# Raw SQL that query() may stream with a server-side cursor (like
+# SQLAlchemy's SERVER_SIDE_CURSOR_RE, plus CTEs)
+STREAMABLE_SQL_RE = re.compile(r'\s*(SELECT|WITH)\b', re.IGNORECASE | re.UNICODE)
+
+# Operators whose SQL does not depend on the filter value, so a clause can
+# be built once with bind parameters and reused (see FilterBuilder.shape)
+BINDABLE_OPERATORS = frozenset({
+    '=', '==', '!=', '>', '>=', '<', '<=',
+    'in', 'not_in', 'like', 'ilike', 'not_like',
+    'startswith', 'endswith', 'contains', 'between',
+})
+
+# Filter operator -> function(column, value) building the clause.
+# Comparisons dispatch straight to the C-level operator functions and
+# plain column methods are called unbound, so only the operators that
+# reshape their value need a Python-level wrapper.
+_FILTER_OPERATORS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    'in': ColumnOperators.in_,
+    'not_in': ColumnOperators.not_in,
+    'like': ColumnOperators.like,
+    'ilike': ColumnOperators.ilike,  # Case-insensitive LIKE
+    'not_like': ColumnOperators.not_like,
+    'startswith': lambda col, val: col.like(f"{val}%"),
+    'endswith': lambda col, val: col.like(f"%{val}"),
+    'contains': lambda col, val: col.like(f"%{val}%"),
+    'is': ColumnOperators.is_,  # For NULL checks
+    'is_not': ColumnOperators.is_not,
+    'between': lambda col, val: col.between(val[0], val[1]),
+}
+
+# Keys are interned so operator strings that are interned too (identifier-
+# like literals are, and sys.intern() makes any string so) match on identity
+# without a character comparison
+FILTER_OPERATORS = {sys.intern(name): func for name, func in _FILTER_OPERATORS.items()}
+
+# Listed in "Unknown operator" errors
+VALID_OPERATORS = ', '.join(FILTER_OPERATORS)
+
+# Operators taking a list/tuple value (bound as expanding parameters)
+LIST_OPERATORS = frozenset({'in', 'not_in'})
+
+# Operators whose value shape is checked by FilterBuilder._validate()
+CHECKED_OPERATORS = LIST_OPERATORS | {'between'}
+
+# Number of distinct raw SQL strings kept parsed by text_clause()
+TEXT_CACHE_SIZE = 512
+
+
 class FilterBuilder:
     """
     Builds SQLAlchemy WHERE clauses from dictionary filters.
@@ -27,32 +95,14 @@ class FilterBuilder:
     """
 
     # Operator mapping: dict key -> SQLAlchemy operator function
-    OPERATORS = {
-        '=': lambda col, val: col == val,
-        '==': lambda col, val: col == val,
-        '!=': lambda col, val: col != val,
-        '>': lambda col, val: col > val,
-        '>=': lambda col, val: col >= val,
-        '<': lambda col, val: col < val,
-        '<=': lambda col, val: col <= val,
-        'in': lambda col, val: col.in_(val),
-        'not_in': lambda col, val: col.notin_(val),
-        'like': lambda col, val: col.like(val),
-        'ilike': lambda col, val: col.ilike(val),  # Case-insensitive LIKE
-        'not_like': lambda col, val: col.notlike(val),
-        'startswith': lambda col, val: col.like(f"{val}%"),
-        'endswith': lambda col, val: col.like(f"%{val}"),
-        'contains': lambda col, val: col.like(f"%{val}%"),
-        'is': lambda col, val: col.is_(val),  # For NULL checks
-        'is_not': lambda col, val: col.is_not(val),
-        'between': lambda col, val: col.between(val[0], val[1]),
-    }
+    OPERATORS = FILTER_OPERATORS
 
     @staticmethod
     def build(
         table: Table,
         filters: dict[str, Any],
         conjunction: str = 'AND',
+        columns: Mapping[str, Any] | None = None,
     ) -> BooleanClauseList | ColumnElement | None:
         """
         Build SQLAlchemy WHERE clause from dict filters.
@@ -61,6 +111,9 @@ class FilterBuilder:
             table: SQLAlchemy Table object
             filters: Dictionary of column_name -> value or operator dict
             conjunction: 'AND' or 'OR' for combining multiple conditions
+                         (case-insensitive; uppercase skips normalization)
+            columns: Optional name -> Column mapping of the table, cached
+                     by the caller (default: table.c)
 
         Returns:
             SQLAlchemy BooleanClauseList or None if no filters
@@ -100,49 +153,42 @@ class FilterBuilder:
         if not filters:
             return None
 
+        if columns is None:
+            columns = table.c
+
+        # Fast path: single equality filter, no clause list or AND needed
+        if len(filters) == 1:
+            (column_name, value), = filters.items()
+            column = columns.get(column_name)
+            if column is not None and not isinstance(value, dict):
+                return column == value
+
         clauses = []
+        operators = FILTER_OPERATORS
 
         for column_name, value in filters.items():
-            # Check column exists
-            if column_name not in table.c:
+            # Check column exists (single lookup)
+            column = columns.get(column_name)
+            if column is None:
                 raise QueryError(
                     f"Column '{column_name}' not found in table '{table.name}'"
                 )
 
-            column = table.c[column_name]
-
             # Handle advanced filters: {'age': {'>=': 18}}
             if isinstance(value, dict):
-                for operator, op_value in value.items():
-                    if operator not in FilterBuilder.OPERATORS:
+                for op_name, op_value in value.items():
+                    op_func = operators.get(op_name)
+                    if op_func is None:
                         raise QueryError(
-                            f"Unknown operator: '{operator}'. "
-                            f"Valid operators: {', '.join(FilterBuilder.OPERATORS.keys())}"
+                            f"Unknown operator: '{op_name}'. "
+                            f"Valid operators: {VALID_OPERATORS}"
                         )
 
-                    # Validate BETWEEN has exactly 2 values
-                    if operator == 'between':
-                        if not isinstance(op_value, (list, tuple)) or len(op_value) != 2:
-                            raise QueryError(
-                                f"BETWEEN operator requires list/tuple of 2 values, "
-                                f"got: {op_value}"
-                            )
-
-                    # Validate IN/NOT_IN has list
-                    if operator in ('in', 'not_in'):
-                        if not isinstance(op_value, (list, tuple)):
-                            raise QueryError(
-                                f"{operator.upper()} operator requires list/tuple, "
-                                f"got: {type(op_value).__name__}"
-                            )
-
-                    try:
-                        clause = FilterBuilder.OPERATORS[operator](column, op_value)
-                        clauses.append(clause)
-                    except Exception as e:
-                        raise QueryError(
-                            f"Error building filter for {column_name} {operator} {op_value}: {e}"
-                        )
+                    if op_name in CHECKED_OPERATORS:
+                        FilterBuilder._validate(op_name, op_value)
+
+                    # Value shapes are validated above, so no try/except here
+                    clauses.append(op_func(column, op_value))
             else:
                 # Simple equality filter: {'age': 30}
                 clauses.append(column == value)
@@ -154,15 +200,186 @@ class FilterBuilder:
         if len(clauses) == 1:
             return clauses[0]
 
-        if conjunction.upper() == 'AND':
+        # Normalize case only for spellings other than 'AND'/'OR'
+        if conjunction != 'AND' and conjunction != 'OR':
+            conjunction = conjunction.upper()
+
+        if conjunction == 'AND':
             return and_(*clauses)
-        elif conjunction.upper() == 'OR':
+        elif conjunction == 'OR':
             return or_(*clauses)
         else:
             raise QueryError(
                 f"Invalid conjunction: '{conjunction}'. Must be 'AND' or 'OR'"
             )
 
+    @staticmethod
+    def _validate(op_name: str, op_value: Any) -> None:
+        """Check operator value shape (BETWEEN pair, IN list)."""
+        # Validate IN/NOT_IN has list
+        if op_name in LIST_OPERATORS:
+            if not isinstance(op_value, (list, tuple)):
+                raise QueryError(
+                    f"{op_name.upper()} operator requires list/tuple, "
+                    f"got: {type(op_value).__name__}"
+                )
+
+        # Validate BETWEEN has exactly 2 values
+        elif op_name == 'between':
+            if not isinstance(op_value, (list, tuple)) or len(op_value) != 2:
+                raise QueryError(
+                    f"BETWEEN operator requires list/tuple of 2 values, "
+                    f"got: {op_value}"
+                )
+
+    @staticmethod
+    def shape(filters: dict[str, Any]) -> tuple | None:
+        """
+        Get hashable description of the filters' columns and operators.
+
+        Filters with the same shape compile to the same SQL and differ only
+        in bound values, so a clause built by build_bound() can be reused
+        for all of them.
+
+        Args:
+            filters: Dictionary of column_name -> value or operator dict
+
+        Returns:
+            Tuple of (column_name, operators) pairs, or None if the SQL
+            depends on the values (NULL comparisons, IS/IS NOT, unknown
+            operators)
+
+        Examples:
+            >>> FilterBuilder.shape({'age': {'>=': 18}, 'status': 'active'})
+            (('age', ('>=',)), ('status', None))
+        """
+        key = []
+        for column_name, value in filters.items():
+            if isinstance(value, dict):
+                ops = tuple(value)
+                if not BINDABLE_OPERATORS.issuperset(ops) or None in value.values():
+                    return None
+                key.append((column_name, ops))
+            elif value is None:
+                return None  # Compiles to IS NULL
+            else:
+                key.append((column_name, None))
+        return tuple(key)
+
+    @staticmethod
+    def build_bound(
+        table: Table,
+        filters: dict[str, Any],
+        dialect: str | None = None,
+    ) -> BooleanClauseList | ColumnElement | None:
+        """
+        Build WHERE clause with named bind parameters instead of values.
+
+        Only the filters' shape is used; values are supplied at execution
+        time by bind_params(). Filters must have a shape (see shape()).
+
+        On PostgreSQL, 'in'/'not_in' become = ANY(array) / != ALL(array)
+        with a single array parameter. Expanding IN parameters render one
+        placeholder per value, so every list length would produce new SQL
+        text and miss the driver's prepared statement cache.
+
+        Args:
+            table: SQLAlchemy Table object
+            filters: Dictionary of column_name -> value or operator dict
+            dialect: Database dialect name (e.g., 'postgresql', 'sqlite')
+
+        Returns:
+            SQLAlchemy clause or None if no filters
+
+        Raises:
+            QueryError: If a column is not found
+
+        Examples:
+            >>> clause = FilterBuilder.build_bound(users_table, {'age': {'>=': 18}})
+            >>> conn.execute(select(users_table).where(clause),
+            ...              FilterBuilder.bind_params({'age': {'>=': 40}}))
+        """
+        clauses = []
+        columns = table.c
+
+        for index, (column_name, value) in enumerate(filters.items()):
+            column = columns.get(column_name)
+            if column is None:
+                raise QueryError(
+                    f"Column '{column_name}' not found in table '{table.name}'"
+                )
+
+            name = f"dbset_w{index}"
+            if not isinstance(value, dict):
+                clauses.append(column == bindparam(name))
+                continue
+
+            for op_index, op_name in enumerate(value):
+                param_name = f"{name}_{op_index}"
+                array_param = (
+                    dialect == 'postgresql'
+                    and op_name in LIST_OPERATORS
+                    and not isinstance(column.type, JSON)
+                )
+                if array_param:
+                    param = bindparam(param_name, type_=ARRAY(column.type))
+                    clauses.append(
+                        column == any_(param) if op_name == 'in' else column != all_(param)
+                    )
+                    continue
+
+                param = bindparam(param_name, expanding=op_name in LIST_OPERATORS)
+                if op_name == 'between':
+                    clause = column.between(
+                        bindparam(f"{param_name}_lo"), bindparam(f"{param_name}_hi")
+                    )
+                elif op_name in LIKE_PATTERNS:
+                    clause = column.like(param)
+                else:
+                    clause = FILTER_OPERATORS[op_name](column, param)
+                clauses.append(clause)
+
+        if not clauses:
+            return None
+        if len(clauses) == 1:
+            return clauses[0]
+        return and_(*clauses)
+
+    @staticmethod
+    def bind_params(filters: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get bind parameter values for a clause built by build_bound().
+
+        Args:
+            filters: Dictionary of column_name -> value or operator dict
+
+        Returns:
+            Dictionary of bind parameter name -> value
+
+        Raises:
+            QueryError: If operator values are invalid
+        """
+        params = {}
+        for index, value in enumerate(filters.values()):
+            name = f"dbset_w{index}"
+            if not isinstance(value, dict):
+                params[name] = value
+                continue
+
+            for op_index, (op_name, op_value) in enumerate(value.items()):
+                if op_name in CHECKED_OPERATORS:
+                    FilterBuilder._validate(op_name, op_value)
+                param_name = f"{name}_{op_index}"
+                if op_name == 'between':
+                    params[f"{param_name}_lo"], params[f"{param_name}_hi"] = op_value
+                elif op_name in LIKE_PATTERNS:
+                    params[param_name] = LIKE_PATTERNS[op_name].format(op_value)
+                elif op_name in LIST_OPERATORS:
+                    params[param_name] = list(op_value)
+                else:
+                    params[param_name] = op_value
+        return params
+
     @staticmethod
     def parse_order_by(
         table: Table,
@@ -193,25 +410,60 @@ class FilterBuilder:
             [users_table.c.name.asc(), users_table.c.age.desc()]
         """
         if isinstance(order_by, str):
-            order_by = [order_by]
-
-        order_clauses = []
-        for col_spec in order_by:
-            # Check for DESC prefix
-            if col_spec.startswith('-'):
-                column_name = col_spec[1:]
-                desc = True
-            else:
-                column_name = col_spec
-                desc = False
+            return [FilterBuilder._order_clause(table, order_by)]
+        return [FilterBuilder._order_clause(table, col_spec) for col_spec in order_by]
+
+    @staticmethod
+    def _order_clause(table: Table, col_spec: str) -> ColumnElement:
+        """Build ASC/DESC clause for one order_by entry ('-' prefix for DESC)."""
+        desc = col_spec[:1] == '-'
+        column_name = col_spec[1:] if desc else col_spec
+
+        column = table.c.get(column_name)
+        if column is None:
+            raise QueryError(
+                f"Column '{column_name}' not found in table '{table.name}'"
+            )
+        return column.desc() if desc else column.asc()
 
-            # Validate column exists
-            if column_name not in table.c:
-                raise QueryError(
-                    f"Column '{column_name}' not found in table '{table.name}'"
-                )
 
-            column = table.c[column_name]
-            order_clauses.append(column.desc() if desc else column.asc())
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def text_clause(sql: str) -> TextClause:
+    """
+    Wrap raw SQL in text(), parsing each distinct string only once.
 
-        return order_clauses
+    Applications tend to pass the same SQL strings to query() over and
+    over; TextClause objects are immutable, so one can be shared by all
+    calls with the same string.
+
+    Args:
+        sql: Raw SQL string (may contain :name bind parameters)
+
+    Returns:
+        TextClause for the string
+
+    Examples:
+        >>> stmt = text_clause("SELECT * FROM users WHERE age > :age")
+        >>> stmt is text_clause("SELECT * FROM users WHERE age > :age")
+        True
+    """
+    return text(sql)
+
+
+def is_streamable(stmt: Any) -> bool:
+    """
+    Check whether query() may fetch a statement with a server-side cursor.
+
+    Only SELECTs are streamed, including raw SQL starting with SELECT or
+    WITH. PostgreSQL rejects DECLARE CURSOR for other statements, e.g.
+    UPDATE ... RETURNING, so they run buffered.
+
+    Args:
+        stmt: Executable statement
+
+    Returns:
+        True if the statement is a SELECT
+    """
+    if isinstance(stmt, TextClause):
+        return STREAMABLE_SQL_RE.match(stmt.text) is not None
+    return getattr(stmt, 'is_select', False)
@@ -0,0 +1,102 @@
+"""Reflection cache - persists reflected MetaData on disk between runs."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import MetaData
+
+# Bumped whenever the file layout changes, so old files are ignored
+CACHE_FORMAT = 1
+
+
+def cache_dir() -> Path:
+    """
+    Get directory for reflection cache files.
+
+    Returns:
+        $XDG_CACHE_HOME/dbset, or ~/.cache/dbset if XDG_CACHE_HOME is unset
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'dbset'
+
+
+def cache_path(url: Any, schema: str | None, server_version: Any) -> Path:
+    """
+    Get cache file path for a database.
+
+    The file name is a hash of the URL (without password), schema and
+    server version, so databases and server upgrades never share a file.
+
+    Args:
+        url: SQLAlchemy URL of the engine
+        schema: Database schema name (optional)
+        server_version: Dialect server_version_info
+
+    Returns:
+        Path of the cache file (may not exist)
+    """
+    key = f"{url.render_as_string(hide_password=True)}|{schema}|{server_version}"
+    return cache_dir() / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.pickle"
+
+
+def load(path: Path, metadata: MetaData, ttl: float) -> bool:
+    """
+    Copy tables from a cache file into metadata, if it is fresh enough.
+
+    Args:
+        path: Cache file path
+        metadata: MetaData to add the cached tables to
+        ttl: Maximum age of the file in seconds
+
+    Returns:
+        True if tables were loaded, False if the file is missing, stale
+        or unreadable (the caller should reflect instead)
+    """
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return False
+        with path.open('rb') as f:
+            version, cached = pickle.load(f)
+    except Exception:
+        return False
+    if version != CACHE_FORMAT:
+        return False
+
+    for table in cached.sorted_tables:
+        table.to_metadata(metadata)
+    return True
+
+
+def store(path: Path, metadata: MetaData) -> None:
+    """
+    Write metadata to a cache file (best effort, errors are ignored).
+
+    The file is written under a temporary name and renamed, so concurrent
+    readers never see a partial file.
+
+    Args:
+        path: Cache file path
+        metadata: Reflected MetaData
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open('wb') as f:
+            pickle.dump((CACHE_FORMAT, metadata), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+def discard(path: Path | None) -> None:
+    """Delete a cache file after the schema changed (missing file is fine)."""
+    if path is not None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
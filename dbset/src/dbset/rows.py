@@ -0,0 +1,28 @@
+"""Row materialization - converts SQLAlchemy result rows to dictionaries."""
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+
+def iter_dicts(result: Any) -> Iterator[dict[str, Any]]:
+    """
+    Iterate SQLAlchemy result as dictionaries.
+
+    Column keys are read once per result and zipped with each row's
+    values. This avoids the per-row RowMapping proxy created by
+    dict(row._mapping), which is several times slower on large results.
+
+    Args:
+        result: SQLAlchemy Result (or any iterable of rows with .keys())
+
+    Yields:
+        Rows as dictionaries
+
+    Examples:
+        >>> result = conn.execute(select(users_table))
+        >>> for row in iter_dicts(result):
+        ...     print(row['name'])
+    """
+    keys = tuple(result.keys())
+    for row in result:
+        yield dict(zip(keys, row))
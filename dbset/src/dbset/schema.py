@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-from typing import Any
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
 
 from sqlalchemy import (
     Column,
@@ -16,11 +19,273 @@ from sqlalchemy import (
     inspect,
 )
 from sqlalchemy.engine import Engine
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.types import TypeEngine
 
-from .exceptions import ColumnNotFoundError, SchemaError, TableNotFoundError
-from .types import PrimaryKeyConfig, TypeInference
+from . import reflection_cache
+from .exceptions import (
+    ColumnNotFoundError,
+    DatasetError,
+    SchemaError,
+    TableNotFoundError,
+)
+from .types import PrimaryKeyConfig, TypeInference, default_pk_config
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Inspector
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from .connection import AsyncConnectionPool, SyncConnectionPool
+
+# Dialects that accept CREATE INDEX IF NOT EXISTS (MySQL does not)
+IF_NOT_EXISTS_DIALECTS = ('postgresql', 'sqlite', 'mariadb')
+
+# Dialects that accept several ADD COLUMN clauses in one ALTER TABLE
+MULTI_ADD_COLUMN_DIALECTS = ('postgresql', 'mysql', 'mariadb')
+
+# Dialects that accept CREATE TABLE IF NOT EXISTS
+TABLE_IF_NOT_EXISTS_DIALECTS = ('postgresql', 'sqlite', 'mysql', 'mariadb')
+
+# Placeholder table name compiled into cached CREATE TABLE statements
+_TEMPLATE_TABLE = '__dbset_table__'
+
+
+@lru_cache(maxsize=32)
+def _create_table_template(dialect: Any, pk_config: PrimaryKeyConfig) -> tuple[str, str]:
+    """
+    Compile CREATE TABLE IF NOT EXISTS for a table with only a primary key.
+
+    Args:
+        dialect: SQLAlchemy dialect to compile for
+        pk_config: Primary key configuration (shared instances hit the cache)
+
+    Returns:
+        (head, tail) of the statement; the quoted table name goes between
+    """
+    table = Table(_TEMPLATE_TABLE, MetaData(), pk_config.get_column())
+    sql = str(CreateTable(table, if_not_exists=True).compile(dialect=dialect))
+    head, tail = sql.split(dialect.identifier_preparer.format_table(table), 1)
+    return head, tail
+
+
+def create_table_sql(dialect: Any, table: Table, pk_config: PrimaryKeyConfig) -> str:
+    """
+    Build CREATE TABLE IF NOT EXISTS for a table with only a primary key.
+
+    The statement is compiled once per dialect and key configuration, so
+    auto-creating tables skips the DDL compiler and the separate existence
+    check of table.create(checkfirst=True).
+
+    Args:
+        dialect: SQLAlchemy dialect (must be in TABLE_IF_NOT_EXISTS_DIALECTS)
+        table: Table object to create
+        pk_config: Primary key configuration the table was built from
+
+    Returns:
+        SQL statement
+    """
+    head, tail = _create_table_template(dialect, pk_config)
+    return head + dialect.identifier_preparer.format_table(table) + tail
+
+
+@lru_cache(maxsize=1024)
+def generate_index_name(table_name: str, columns: tuple[str, ...]) -> str:
+    """
+    Generate index name following convention: idx_{table}_{col1}_{col2}.
+
+    Names are persisted in the database, so the hash must not change:
+    an index created by an older version has to keep matching.
+
+    Args:
+        table_name: Name of table
+        columns: Tuple of column names
+
+    Returns:
+        Generated index name (truncated to 63 chars if necessary)
+    """
+    # Build base name
+    col_part = "_".join(columns)
+    base_name = f"idx_{table_name}_{col_part}"
+
+    # PostgreSQL has 63 char limit for identifiers
+    if len(base_name) <= 63:
+        return base_name
+
+    # Truncate and add hash suffix for uniqueness (not a security use,
+    # which keeps it working on FIPS-restricted OpenSSL builds)
+    hash_suffix = hashlib.md5(base_name.encode(), usedforsecurity=False).hexdigest()[:8]
+    max_prefix_len = 63 - len(hash_suffix) - 1  # -1 for underscore
+    return f"{base_name[:max_prefix_len]}_{hash_suffix}"
+
+
+def add_columns_sql(
+    dialect: Any,
+    table: Table,
+    columns: list[Column],
+    type_cache: dict[tuple[type, str], str] | None = None,
+) -> list[str]:
+    """
+    Build ALTER TABLE statements adding columns to a table.
+
+    Dialects in MULTI_ADD_COLUMN_DIALECTS get a single statement with one
+    ADD COLUMN clause per column, so the table is rewritten/locked once.
+    Others (SQLite) get one statement per column.
+
+    Args:
+        dialect: SQLAlchemy dialect used to quote names and compile types
+        table: SQLAlchemy Table object
+        columns: New Column objects (not yet attached to the table)
+        type_cache: Compiled type SQL keyed by type class and repr, reused
+                    across calls for the same dialect (optional)
+
+    Returns:
+        List of ALTER TABLE statements to execute in order
+    """
+    if type_cache is None:
+        type_cache = {}
+
+    # Quote identifiers properly for SQL safety (handles special chars like dashes)
+    preparer = dialect.identifier_preparer
+    alter = f"ALTER TABLE {preparer.quote(table.name)} "
+    clauses = []
+    for col in columns:
+        # repr() includes constructor args, e.g. String(length=50)
+        key = (type(col.type), repr(col.type))
+        type_sql = type_cache.get(key)
+        if type_sql is None:
+            type_sql = type_cache[key] = col.type.compile(dialect=dialect)
+        clauses.append(f"ADD COLUMN {preparer.quote(col.name)} {type_sql}")
+    if dialect.name in MULTI_ADD_COLUMN_DIALECTS:
+        return [alter + ", ".join(clauses)]
+    return [alter + clause for clause in clauses]
+
+
+@contextmanager
+def schema_errors(action: str, table_name: str | None = None) -> Iterator[None]:
+    """
+    Re-raise errors from a DDL/reflection step as SchemaError.
+
+    dbset's own errors (e.g. ColumnNotFoundError) pass through unchanged.
+
+    Args:
+        action: What was being done, e.g. "create table 'users'"
+        table_name: Table the error relates to (optional)
+    """
+    try:
+        yield
+    except DatasetError:
+        raise
+    except Exception as e:
+        raise SchemaError(f"Failed to {action}: {e}", table_name=table_name) from e
+
+
+def reflect_table(
+    inspector: Inspector,
+    metadata: MetaData,
+    table_name: str,
+    schema: str | None,
+) -> None:
+    """
+    Reflect a single table into metadata, if it exists in the database.
+
+    Goes through the given Inspector, so the reflection queries are served
+    from (and stored in) its info_cache.
+
+    Args:
+        inspector: Inspector bound to the connection to reflect with
+        metadata: MetaData to add the table to
+        table_name: Name of table
+        schema: Database schema name (optional)
+    """
+    if not inspector.has_table(table_name, schema=schema):
+        return
+
+    table = Table(table_name, metadata, schema=schema)
+    try:
+        inspector.reflect_table(table, None)
+    except Exception:
+        metadata.remove(table)
+        raise
+
+
+def reflect_new_columns(
+    inspector: Inspector,
+    table: Table,
+    schema: str | None,
+) -> list[Column]:
+    """
+    Reflect columns added to a table in the database since it was loaded.
+
+    The columns are appended to the given Table object in place, so code
+    holding it (table wrappers, cached statements keyed on its width) picks
+    them up without reflecting the whole table again.
+
+    Args:
+        inspector: Inspector bound to the connection to reflect with
+        table: SQLAlchemy Table object to extend
+        schema: Database schema name (optional)
+
+    Returns:
+        List of columns appended to the table
+    """
+    added = [
+        Column(info['name'], info['type'], nullable=info.get('nullable', True))
+        for info in inspector.get_columns(table.name, schema=schema)
+        if info['name'] not in table.c
+    ]
+    for col in added:
+        table.append_column(col)
+    return added
+
+
+def forget_missing_tables(info_cache: dict) -> None:
+    """
+    Drop cached table-existence misses from an Inspector info_cache.
+
+    A table missing now may be created later by another process or by raw
+    SQL, so has_table() misses and table name lists are never kept across
+    calls. Everything else stays cached until the next DDL.
+
+    Args:
+        info_cache: Inspector info_cache to prune in place
+    """
+    for key, value in list(info_cache.items()):
+        name = key[0] if isinstance(key, tuple) and key else None
+        if name == 'get_table_names' or (name == 'has_table' and not value):
+            info_cache.pop(key, None)
+
+
+def has_index_on(
+    inspector: Inspector,
+    table_name: str,
+    schema: str | None,
+    columns: list[str],
+) -> bool:
+    """
+    Check the database for an index covering exactly the given columns.
+
+    Column order is ignored. Reads Inspector.get_indexes, so repeated checks
+    are served from the inspector's info_cache.
+
+    Args:
+        inspector: Inspector bound to the connection to query with
+        table_name: Name of table
+        schema: Database schema name (optional)
+        columns: List of column names
+
+    Returns:
+        True if a matching index exists, False otherwise (also when the
+        table does not exist)
+    """
+    try:
+        indexes = inspector.get_indexes(table_name, schema=schema)
+    except NoSuchTableError:
+        return False
+
+    columns_set = set(columns)
+    return any(set(index['column_names']) == columns_set for index in indexes)
 
 
 class AsyncSchemaManager:
@@ -36,6 +301,8 @@ class AsyncSchemaManager:
         engine: AsyncEngine,
         metadata: MetaData,
         schema: str | None = None,
+        pool: AsyncConnectionPool | None = None,
+        cache_ttl: float = 0,
     ):
         """
         Initialize schema manager.
@@ -44,10 +311,56 @@ class AsyncSchemaManager:
             engine: SQLAlchemy AsyncEngine
             metadata: SQLAlchemy MetaData for schema reflection
             schema: Database schema name (optional)
+            pool: Connection pool whose transaction() DDL should join (optional)
+            cache_ttl: Seconds a reflected schema stored on disk stays valid
+                       for new managers (default: 0 - no disk cache)
         """
         self._engine = engine
         self._metadata = metadata
         self._schema = schema
+        self._pool = pool
+        # Metadata holds the whole schema until invalidate() is called
+        self._reflected = False
+        self._reflect_lock = asyncio.Lock()
+        # Inspector info_cache shared across connections, cleared on DDL
+        self._info_cache: dict = {}
+        # Tables changed by DDL inside the current track_ddl() block
+        self._ddl_tables: ContextVar[set[str] | None] = ContextVar(
+            'dbset_ddl_tables', default=None
+        )
+        # On-disk copy of the reflected schema (see reflection_cache)
+        self._cache_ttl = cache_ttl
+        self._cache_path = None
+        # Compiled column type SQL for ALTER TABLE (see add_columns_sql)
+        self._type_sql_cache: dict[tuple[type, str], str] = {}
+
+    @asynccontextmanager
+    async def _connection(self, begin: bool = True) -> AsyncIterator[AsyncConnection]:
+        """
+        Get connection for DDL/reflection, joining the pool's current transaction.
+
+        Args:
+            begin: If True, run in a transaction committed on exit
+        """
+        conn = self._pool.current if self._pool is not None else None
+        if conn is not None:
+            yield conn
+            return
+
+        async with (self._engine.begin() if begin else self._engine.connect()) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _ddl(self, table_name: str) -> AsyncIterator[AsyncConnection]:
+        """Get connection for DDL, dropping cached Inspector results afterwards."""
+        changed = self._ddl_tables.get()
+        if changed is not None:
+            changed.add(table_name)
+        try:
+            async with self._connection() as conn:
+                yield conn
+        finally:
+            self.invalidate_cache()
 
     async def get_table(
         self,
@@ -69,17 +382,16 @@ class AsyncSchemaManager:
         Raises:
             TableNotFoundError: If table doesn't exist and ensure_exists=False
         """
-        # Reflect metadata to get current schema
+        # Reflect metadata once (cached afterwards)
         await self.reflect()
 
-        # Check if table exists in metadata
-        full_name = f"{self._schema}.{table_name}" if self._schema else table_name
-
-        if full_name in self._metadata.tables:
-            return self._metadata.tables[full_name]
-
-        if table_name in self._metadata.tables:
-            return self._metadata.tables[table_name]
+        # Check if table exists in metadata, then in the database in case
+        # it was created elsewhere since the schema was reflected
+        table = self.reflected_table(table_name)
+        if table is None:
+            table = await self._reflect_one(table_name)
+        if table is not None:
+            return table
 
         # Table not found
         if not ensure_exists:
@@ -88,34 +400,57 @@ class AsyncSchemaManager:
         # Create table with configured primary key
         return await self.create_table(table_name, pk_config=pk_config)
 
+    def reflected_table(self, table_name: str) -> Table | None:
+        """
+        Get table from already reflected metadata, without a database round-trip.
+
+        Args:
+            table_name: Name of table
+
+        Returns:
+            SQLAlchemy Table object, or None if not in metadata
+        """
+        tables = self._metadata.tables
+        if self._schema:
+            table = tables.get(f"{self._schema}.{table_name}")
+            if table is not None:
+                return table
+        return tables.get(table_name)
+
     async def table_exists(self, table_name: str) -> bool:
         """
         Check if table exists in database.
 
+        Does not reflect the schema: known tables are answered from metadata
+        and others with a single has_table probe. Callers that need the
+        Table object should use get_table() instead.
+
         Args:
             table_name: Name of table
 
         Returns:
             True if table exists, False otherwise
         """
-        await self.reflect()
-
-        full_name = f"{self._schema}.{table_name}" if self._schema else table_name
-
-        return (
-            full_name in self._metadata.tables
-            or table_name in self._metadata.tables
-        )
+        if self.reflected_table(table_name) is not None:
+            return True
+        # Not known yet - it may have been created elsewhere
+        async with self._connection(begin=False) as conn:
+            return await conn.run_sync(
+                lambda sync_conn: self._inspect(sync_conn).has_table(table_name, schema=self._schema)
+            )
 
     async def get_table_names(self) -> list[str]:
         """
         Get list of all table names in database.
 
         Returns:
-            List of table names
+            List of table names (schema-qualified if a schema is set)
         """
-        await self.reflect()
-        return list(self._metadata.tables.keys())
+        async with self._connection(begin=False) as conn:
+            names = await conn.run_sync(
+                lambda sync_conn: self._inspect(sync_conn).get_table_names(schema=self._schema)
+            )
+        return [f"{self._schema}.{name}" for name in names] if self._schema else names
 
     async def create_table(
         self,
@@ -151,10 +486,10 @@ class AsyncSchemaManager:
             >>> pk_config = PrimaryKeyConfig(pk_type='uuid', column_name='user_id')
             >>> table = await schema.create_table('users', pk_config=pk_config)
         """
-        try:
+        with schema_errors(f"create table '{table_name}'", table_name):
             # Use provided pk_config or default to Integer 'id' column
             if pk_config is None:
-                pk_config = PrimaryKeyConfig()
+                pk_config = default_pk_config()
 
             # Define table with configured primary key
             table_columns = [pk_config.get_column()]
@@ -174,41 +509,99 @@ class AsyncSchemaManager:
                 schema=self._schema,
             )
 
-            # Create table in database
-            async with self._engine.begin() as conn:
-                await conn.run_sync(table.create, checkfirst=True)
-
-            # Refresh metadata
-            await self.reflect()
-
-            return table
-
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to create table '{table_name}': {e}",
-                table_name=table_name,
+            # Create table in database (precompiled DDL for the common
+            # "primary key only" case)
+            dialect = self._engine.dialect
+            if_not_exists = (
+                len(table_columns) == 1 and dialect.name in TABLE_IF_NOT_EXISTS_DIALECTS
             )
+            try:
+                async with self._ddl(table_name) as conn:
+                    if if_not_exists:
+                        sql = create_table_sql(dialect, table, pk_config)
+                        # DDL() applies %-formatting, so escape literal percent signs
+                        await conn.execute(DDL(sql.replace('%', '%%')))
+                    else:
+                        await conn.run_sync(table.create, checkfirst=True)
+            except Exception:
+                self._metadata.remove(table)
+                raise
+
+            if if_not_exists:
+                # IF NOT EXISTS is a no-op for a table created elsewhere in
+                # the meantime, so take its columns from the database
+                self._metadata.remove(table)
+                return await self._reflect_one(table_name)
+
+            # The Table object is already in metadata - no need to reflect
+            return table
 
     async def ensure_columns(
         self,
         table: Table,
         columns: dict[str, TypeEngine],
-    ) -> None:
+    ) -> Table:
         """
         Ensure columns exist in table, creating missing ones.
 
+        New columns are appended to the given Table object, so callers can
+        keep using it without reflecting the schema again.
+
         Args:
             table: SQLAlchemy Table object
             columns: Dict of column_name -> SQLAlchemy type
 
+        Returns:
+            The same Table object, including any added columns
+
         Raises:
             SchemaError: If column creation fails
         """
-        existing_columns = {col.name for col in table.columns}
-        missing_columns = set(columns.keys()) - existing_columns
+        # Keep the caller's column order; all missing columns go in one DDL block
+        missing = [
+            Column(name, col_type)
+            for name, col_type in columns.items()
+            if name not in table.c
+        ]
+        if missing:
+            try:
+                await self._add_columns(table, missing)
+            except SchemaError:
+                # Another process or Database may have added some of them
+                # since the table was reflected - pick those up and retry once
+                if not await self.refresh_columns(table):
+                    raise
+                missing = [col for col in missing if col.name not in table.c]
+                if missing:
+                    await self._add_columns(table, missing)
+
+        return table
+
+    async def refresh_columns(self, table: Table) -> bool:
+        """
+        Pick up columns added to a table outside this manager.
 
-        for col_name in missing_columns:
-            await self.add_column(table, col_name, columns[col_name])
+        The schema is reflected once, so columns added by another process
+        or Database are unknown until then. Only this table's columns are
+        read, and new ones are appended to the Table object in place.
+
+        Args:
+            table: SQLAlchemy Table object
+
+        Returns:
+            True if any columns were added
+        """
+        self.invalidate_cache()
+        with schema_errors(f"reflect table '{table.name}'", table.name):
+            async with self._connection(begin=False) as conn:
+                added = await conn.run_sync(
+                    lambda sync_conn: reflect_new_columns(
+                        self._inspect(sync_conn), table, self._schema
+                    )
+                )
+        if added:
+            self._engine.sync_engine.clear_compiled_cache()
+        return bool(added)
 
     async def add_column(
         self,
@@ -219,6 +612,8 @@ class AsyncSchemaManager:
         """
         Add new column to existing table.
 
+        The column is also appended to the given Table object.
+
         Args:
             table: SQLAlchemy Table object
             column_name: Name of column to add
@@ -227,30 +622,25 @@ class AsyncSchemaManager:
         Raises:
             SchemaError: If column addition fails
         """
-        try:
-            # Generate column definition SQL
-            col = Column(column_name, column_type)
-            col_type_sql = col.type.compile(dialect=self._engine.dialect)
-
-            # Quote identifiers properly for SQL safety (handles special chars like dashes)
-            preparer = self._engine.dialect.identifier_preparer
-            quoted_table = preparer.quote(table.name)
-            quoted_column = preparer.quote(column_name)
-
-            # Generate ALTER TABLE statement
-            alter_sql = f"ALTER TABLE {quoted_table} ADD COLUMN {quoted_column} {col_type_sql}"
-
-            async with self._engine.begin() as conn:
-                await conn.execute(DDL(alter_sql))
-
-            # Refresh metadata
-            await self.reflect()
-
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to add column '{column_name}' to table '{table.name}': {e}",
-                table_name=table.name,
+        await self._add_columns(table, [Column(column_name, column_type)])
+
+    async def _add_columns(self, table: Table, columns: list[Column]) -> None:
+        """Run ALTER TABLE for new columns and append them to the Table object."""
+        names = ", ".join(f"'{col.name}'" for col in columns)
+        with schema_errors(f"add column {names} to table '{table.name}'", table.name):
+            statements = add_columns_sql(
+                self._engine.dialect, table, columns, self._type_sql_cache
             )
+            async with self._ddl(table.name) as conn:
+                for alter_sql in statements:
+                    await conn.execute(DDL(alter_sql.replace('%', '%%')))
+
+            # Add columns to the Table object in place instead of reflecting
+            for col in columns:
+                table.append_column(col)
+            # Compiled SQL is cached per Table, not per column list, so
+            # statements compiled before the change would miss the new columns
+            self._engine.sync_engine.clear_compiled_cache()
 
     async def drop_table(self, table_name: str) -> None:
         """
@@ -263,40 +653,194 @@ class AsyncSchemaManager:
             TableNotFoundError: If table doesn't exist
             SchemaError: If drop operation fails
         """
-        if not await self.table_exists(table_name):
+        # Known table or a single-table reflect - no full schema reflect
+        table = self.reflected_table(table_name)
+        if table is None:
+            table = await self._reflect_one(table_name)
+        if table is None:
             raise TableNotFoundError(table_name)
 
-        try:
-            table = await self.get_table(table_name)
-            async with self._engine.begin() as conn:
+        with schema_errors(f"drop table '{table_name}'", table_name):
+            async with self._ddl(table_name) as conn:
                 await conn.run_sync(table.drop)
 
             # Refresh metadata
             self._metadata.remove(table)
 
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to drop table '{table_name}': {e}",
-                table_name=table_name,
-            )
-
     async def reflect(self) -> None:
         """
         Reflect database schema into metadata.
 
-        Loads current table/column definitions from database.
+        Loads current table/column definitions from database on the first
+        call only; later calls return immediately until invalidate() is
+        called. Tables created or altered through this manager are kept up
+        to date in metadata without reflecting again; columns added
+        elsewhere are picked up per table by refresh_columns().
         """
-        try:
-            # Clear existing metadata to force fresh reflection
-            self._metadata.clear()
+        if self._reflected:
+            return
+
+        async with self._reflect_lock:
+            if self._reflected:
+                return  # Another task reflected while we waited
+
+            with schema_errors("reflect schema"):
+                # Clear existing metadata to force fresh reflection
+                self._metadata.clear()
+
+                concurrency = self._reflect_concurrency()
+                async with self._connection(begin=False) as conn:
+                    loaded = self._load_cached(conn.dialect)
+                    if not loaded and concurrency == 1:
+                        await conn.run_sync(
+                            self._metadata.reflect,
+                            schema=self._schema,
+                        )
+                    elif not loaded:
+                        table_names = await conn.run_sync(
+                            lambda sync_conn: self._inspect(sync_conn).get_table_names(
+                                schema=self._schema
+                            )
+                        )
+
+                if not loaded:
+                    if concurrency > 1:
+                        await self._reflect_tables_parallel(table_names, concurrency)
+                    self._store_cached()
+
+            self._reflected = True
+
+    def _reflect_concurrency(self) -> int:
+        """
+        Get number of tables reflect() may load at once, on separate connections.
+
+        Returns 1 (one MetaData.reflect call) inside a transaction, for
+        dialects that reflect all tables in a few batched queries (e.g.
+        PostgreSQL), and for pools without a size (e.g. in-memory SQLite).
+        """
+        if self._pool is not None and self._pool.current is not None:
+            return 1
+        if type(self._engine.dialect).get_multi_columns is not DefaultDialect.get_multi_columns:
+            return 1
+        size = getattr(self._engine.pool, 'size', None)
+        return max(size(), 1) if callable(size) else 1
+
+    async def _reflect_tables_parallel(self, table_names: list[str], concurrency: int) -> None:
+        """
+        Reflect tables concurrently, each on its own pooled connection.
+
+        Every task reflects into a private MetaData, so tasks never touch
+        shared state; the tables are copied into metadata once all are done.
+
+        Args:
+            table_names: Names of tables to reflect
+            concurrency: Maximum number of connections used at once
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-            async with self._engine.connect() as conn:
+        async def reflect_one(table_name: str) -> MetaData:
+            metadata = MetaData()
+            async with semaphore, self._engine.connect() as conn:
                 await conn.run_sync(
-                    self._metadata.reflect,
+                    metadata.reflect,
                     schema=self._schema,
+                    only=[table_name],
+                    resolve_fks=False,
                 )
-        except Exception as e:
-            raise SchemaError(f"Failed to reflect schema: {e}")
+            return metadata
+
+        for metadata in await asyncio.gather(*(reflect_one(name) for name in table_names)):
+            for table in metadata.tables.values():
+                table.to_metadata(self._metadata)
+
+    def invalidate(self) -> None:
+        """
+        Drop the reflected schema so the next reflect() loads it again.
+
+        Call this after changing the schema outside this manager (raw DDL,
+        migrations, other processes).
+        """
+        self._reflected = False
+        self.invalidate_cache()
+
+    @contextmanager
+    def track_ddl(self) -> Iterator[set[str]]:
+        """
+        Record tables changed by DDL in this context, forgetting them on error.
+
+        Database.transaction() wraps its block in this. DDL run inside the
+        transaction is rolled back with it (or, on databases with
+        non-transactional DDL, may have been committed), while the new
+        tables and columns are already in metadata. On error the whole
+        metadata is dropped and invalidate() called, so the next access
+        reflects the real schema.
+
+        Yields:
+            Names of tables changed by DDL so far
+        """
+        changed: set[str] = set()
+        token = self._ddl_tables.set(changed)
+        try:
+            yield changed
+        except BaseException:
+            if changed:
+                self._metadata.clear()
+                self.invalidate()
+            raise
+        finally:
+            self._ddl_tables.reset(token)
+
+    def _inspect(self, sync_conn) -> Inspector:
+        """
+        Get Inspector for a (sync) connection, sharing the manager's cache.
+
+        Inspectors are bound to one connection, but their info_cache is a
+        plain dict: sharing it keeps has_table()/get_indexes()/column
+        results across calls until the next DDL or invalidate(). Table
+        existence misses are dropped first (see forget_missing_tables).
+        """
+        forget_missing_tables(self._info_cache)
+        inspector = inspect(sync_conn)
+        inspector.info_cache = self._info_cache
+        return inspector
+
+    def invalidate_cache(self) -> None:
+        """Forget cached Inspector results and on-disk schema (after every DDL)."""
+        self._info_cache.clear()
+        reflection_cache.discard(self._cache_path)
+
+    def _load_cached(self, dialect) -> bool:
+        """Load reflected schema from the disk cache, if enabled and fresh."""
+        if not self._cache_ttl:
+            return False
+        self._cache_path = reflection_cache.cache_path(
+            self._engine.url, self._schema, dialect.server_version_info
+        )
+        return reflection_cache.load(self._cache_path, self._metadata, self._cache_ttl)
+
+    def _store_cached(self) -> None:
+        """Write freshly reflected schema to the disk cache, if enabled."""
+        if self._cache_path is not None:
+            reflection_cache.store(self._cache_path, self._metadata)
+
+    async def _reflect_one(self, table_name: str) -> Table | None:
+        """
+        Reflect a single table into metadata.
+
+        Args:
+            table_name: Name of table
+
+        Returns:
+            SQLAlchemy Table object, or None if the table doesn't exist
+        """
+        with schema_errors(f"reflect table '{table_name}'", table_name):
+            async with self._connection(begin=False) as conn:
+                await conn.run_sync(
+                    lambda sync_conn: reflect_table(
+                        self._inspect(sync_conn), self._metadata, table_name, self._schema
+                    )
+                )
+        return self.reflected_table(table_name)
 
     @staticmethod
     def _generate_index_name(table_name: str, columns: list[str]) -> str:
@@ -310,18 +854,7 @@ class AsyncSchemaManager:
         Returns:
             Generated index name (truncated to 63 chars if necessary)
         """
-        # Build base name
-        col_part = "_".join(columns)
-        base_name = f"idx_{table_name}_{col_part}"
-
-        # PostgreSQL has 63 char limit for identifiers
-        if len(base_name) <= 63:
-            return base_name
-
-        # Truncate and add hash suffix for uniqueness
-        hash_suffix = hashlib.md5(base_name.encode()).hexdigest()[:8]
-        max_prefix_len = 63 - len(hash_suffix) - 1  # -1 for underscore
-        return f"{base_name[:max_prefix_len]}_{hash_suffix}"
+        return generate_index_name(table_name, tuple(columns))
 
     async def create_index(
         self,
@@ -366,9 +899,9 @@ class AsyncSchemaManager:
         if not columns:
             raise ValueError("columns list cannot be empty")
 
-        try:
+        with schema_errors(f"create index on table '{table.name}'", table.name):
             # Validate all columns exist
-            table_cols = {col.name for col in table.columns}
+            table_cols = table.c
             for col_name in columns:
                 if col_name not in table_cols:
                     raise ColumnNotFoundError(col_name, table.name)
@@ -396,23 +929,21 @@ class AsyncSchemaManager:
 
             index = Index(index_name, *index_columns, unique=unique, **kw)
 
-            # Create index in database
-            async with self._engine.begin() as conn:
-                await conn.run_sync(index.create, checkfirst=True)
-
-            # Refresh metadata to include new index
-            await self.reflect()
-
+            # Create index in database (IF NOT EXISTS saves the separate
+            # existence check where the dialect supports it)
+            try:
+                async with self._ddl(table.name) as conn:
+                    if dialect_name in IF_NOT_EXISTS_DIALECTS:
+                        await conn.execute(CreateIndex(index, if_not_exists=True))
+                    else:
+                        await conn.run_sync(index.create, checkfirst=True)
+            except Exception:
+                table.indexes.discard(index)
+                raise
+
+            # The Index object is attached to the table - no need to reflect
             return index_name
 
-        except ColumnNotFoundError:
-            raise
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to create index on table '{table.name}': {e}",
-                table_name=table.name,
-            )
-
     async def index_exists(self, table: Table, columns: list[str]) -> bool:
         """
         Check if index exists on specified columns.
@@ -428,35 +959,13 @@ class AsyncSchemaManager:
             >>> exists = await schema.index_exists(table, ['email'])
             >>> exists = await schema.index_exists(table, ['country', 'city'])
         """
-        # Reflect metadata to get fresh schema
-        await self.reflect()
-
-        # Get updated table object from metadata
-        full_name = f"{self._schema}.{table.name}" if self._schema else table.name
-        if full_name in self._metadata.tables:
-            fresh_table = self._metadata.tables[full_name]
-        elif table.name in self._metadata.tables:
-            fresh_table = self._metadata.tables[table.name]
-        else:
-            return False
-
-        # Convert columns to set for comparison
-        columns_set = set(columns)
-
-        # Check each index
-        for index in fresh_table.indexes:
-            index_cols = {col.name for col in index.columns}
-
-            # For single column, order doesn't matter
-            if len(columns) == 1:
-                if columns_set == index_cols:
-                    return True
-            # For compound indexes, check exact match (order-independent for simplicity)
-            else:
-                if columns_set == index_cols:
-                    return True
-
-        return False
+        # One get_indexes query (cached until the next DDL), no reflect
+        async with self._connection(begin=False) as conn:
+            return await conn.run_sync(
+                lambda sync_conn: has_index_on(
+                    self._inspect(sync_conn), table.name, self._schema, columns
+                )
+            )
 
 
 class SyncSchemaManager:
@@ -471,6 +980,8 @@ class SyncSchemaManager:
         engine: Engine,
         metadata: MetaData,
         schema: str | None = None,
+        pool: SyncConnectionPool | None = None,
+        cache_ttl: float = 0,
     ):
         """
         Initialize schema manager.
@@ -479,10 +990,55 @@ class SyncSchemaManager:
             engine: SQLAlchemy Engine
             metadata: SQLAlchemy MetaData for schema reflection
             schema: Database schema name (optional)
+            pool: Connection pool whose transaction() DDL should join (optional)
+            cache_ttl: Seconds a reflected schema stored on disk stays valid
+                       for new managers (default: 0 - no disk cache)
         """
         self._engine = engine
         self._metadata = metadata
         self._schema = schema
+        self._pool = pool
+        # Metadata holds the whole schema until invalidate() is called
+        self._reflected = False
+        # Inspector info_cache shared across connections, cleared on DDL
+        self._info_cache: dict = {}
+        # Tables changed by DDL inside the current track_ddl() block
+        self._ddl_tables: ContextVar[set[str] | None] = ContextVar(
+            'dbset_ddl_tables', default=None
+        )
+        # On-disk copy of the reflected schema (see reflection_cache)
+        self._cache_ttl = cache_ttl
+        self._cache_path = None
+        # Compiled column type SQL for ALTER TABLE (see add_columns_sql)
+        self._type_sql_cache: dict[tuple[type, str], str] = {}
+
+    @contextmanager
+    def _connection(self, begin: bool = True) -> Iterator:
+        """
+        Get connection for DDL/reflection, joining the pool's current transaction.
+
+        Args:
+            begin: If True, run in a transaction committed on exit
+        """
+        conn = self._pool.current if self._pool is not None else None
+        if conn is not None:
+            yield conn
+            return
+
+        with (self._engine.begin() if begin else self._engine.connect()) as conn:
+            yield conn
+
+    @contextmanager
+    def _ddl(self, table_name: str) -> Iterator:
+        """Get connection for DDL, dropping cached Inspector results afterwards."""
+        changed = self._ddl_tables.get()
+        if changed is not None:
+            changed.add(table_name)
+        try:
+            with self._connection() as conn:
+                yield conn
+        finally:
+            self.invalidate_cache()
 
     def get_table(
         self,
@@ -491,17 +1047,15 @@ class SyncSchemaManager:
         pk_config: PrimaryKeyConfig | None = None,
     ) -> Table:
         """Get SQLAlchemy Table object (sync version)."""
-        # Reflect metadata
+        # Reflect metadata once (cached afterwards)
         self.reflect()
 
-        # Check if table exists
-        full_name = f"{self._schema}.{table_name}" if self._schema else table_name
-
-        if full_name in self._metadata.tables:
-            return self._metadata.tables[full_name]
-
-        if table_name in self._metadata.tables:
-            return self._metadata.tables[table_name]
+        # Check metadata, then the database (table created elsewhere)
+        table = self.reflected_table(table_name)
+        if table is None:
+            table = self._reflect_one(table_name)
+        if table is not None:
+            return table
 
         # Table not found
         if not ensure_exists:
@@ -510,21 +1064,28 @@ class SyncSchemaManager:
         # Create table
         return self.create_table(table_name, pk_config=pk_config)
 
-    def table_exists(self, table_name: str) -> bool:
-        """Check if table exists (sync version)."""
-        self.reflect()
-
-        full_name = f"{self._schema}.{table_name}" if self._schema else table_name
+    def reflected_table(self, table_name: str) -> Table | None:
+        """Get table from already reflected metadata (sync version)."""
+        tables = self._metadata.tables
+        if self._schema:
+            table = tables.get(f"{self._schema}.{table_name}")
+            if table is not None:
+                return table
+        return tables.get(table_name)
 
-        return (
-            full_name in self._metadata.tables
-            or table_name in self._metadata.tables
-        )
+    def table_exists(self, table_name: str) -> bool:
+        """Check if table exists without reflecting the schema (sync version)."""
+        if self.reflected_table(table_name) is not None:
+            return True
+        # Not known yet - it may have been created elsewhere
+        with self._connection(begin=False) as conn:
+            return self._inspect(conn).has_table(table_name, schema=self._schema)
 
     def get_table_names(self) -> list[str]:
         """Get list of all table names (sync version)."""
-        self.reflect()
-        return list(self._metadata.tables.keys())
+        with self._connection(begin=False) as conn:
+            names = self._inspect(conn).get_table_names(schema=self._schema)
+        return [f"{self._schema}.{name}" for name in names] if self._schema else names
 
     def create_table(
         self,
@@ -533,10 +1094,10 @@ class SyncSchemaManager:
         pk_config: PrimaryKeyConfig | None = None,
     ) -> Table:
         """Create new table (sync version)."""
-        try:
+        with schema_errors(f"create table '{table_name}'", table_name):
             # Use provided pk_config or default to Integer 'id' column
             if pk_config is None:
-                pk_config = PrimaryKeyConfig()
+                pk_config = default_pk_config()
 
             # Define table with configured primary key
             table_columns = [pk_config.get_column()]
@@ -556,32 +1117,68 @@ class SyncSchemaManager:
                 schema=self._schema,
             )
 
-            # Create table in database
-            with self._engine.begin() as conn:
-                table.create(conn, checkfirst=True)
-
-            # Refresh metadata
-            self.reflect()
-
-            return table
-
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to create table '{table_name}': {e}",
-                table_name=table_name,
+            # Create table in database (precompiled DDL for the common
+            # "primary key only" case)
+            dialect = self._engine.dialect
+            if_not_exists = (
+                len(table_columns) == 1 and dialect.name in TABLE_IF_NOT_EXISTS_DIALECTS
             )
+            try:
+                with self._ddl(table_name) as conn:
+                    if if_not_exists:
+                        sql = create_table_sql(dialect, table, pk_config)
+                        # DDL() applies %-formatting, so escape literal percent signs
+                        conn.execute(DDL(sql.replace('%', '%%')))
+                    else:
+                        table.create(conn, checkfirst=True)
+            except Exception:
+                self._metadata.remove(table)
+                raise
+
+            if if_not_exists:
+                # IF NOT EXISTS is a no-op for a table created elsewhere in
+                # the meantime, so take its columns from the database
+                self._metadata.remove(table)
+                return self._reflect_one(table_name)
+
+            # The Table object is already in metadata - no need to reflect
+            return table
 
     def ensure_columns(
         self,
         table: Table,
         columns: dict[str, TypeEngine],
-    ) -> None:
-        """Ensure columns exist (sync version)."""
-        existing_columns = {col.name for col in table.columns}
-        missing_columns = set(columns.keys()) - existing_columns
-
-        for col_name in missing_columns:
-            self.add_column(table, col_name, columns[col_name])
+    ) -> Table:
+        """Ensure columns exist, returning the updated table (sync version)."""
+        # Keep the caller's column order; all missing columns go in one DDL block
+        missing = [
+            Column(name, col_type)
+            for name, col_type in columns.items()
+            if name not in table.c
+        ]
+        if missing:
+            try:
+                self._add_columns(table, missing)
+            except SchemaError:
+                # Another process or Database may have added some of them
+                # since the table was reflected - pick those up and retry once
+                if not self.refresh_columns(table):
+                    raise
+                missing = [col for col in missing if col.name not in table.c]
+                if missing:
+                    self._add_columns(table, missing)
+
+        return table
+
+    def refresh_columns(self, table: Table) -> bool:
+        """Pick up columns added to a table outside this manager (sync version)."""
+        self.invalidate_cache()
+        with schema_errors(f"reflect table '{table.name}'", table.name):
+            with self._connection(begin=False) as conn:
+                added = reflect_new_columns(self._inspect(conn), table, self._schema)
+        if added:
+            self._engine.clear_compiled_cache()
+        return bool(added)
 
     def add_column(
         self,
@@ -590,63 +1187,113 @@ class SyncSchemaManager:
         column_type: TypeEngine,
     ) -> None:
         """Add column to table (sync version)."""
-        try:
-            # Generate column definition SQL
-            col = Column(column_name, column_type)
-            col_type_sql = col.type.compile(dialect=self._engine.dialect)
-
-            # Quote identifiers properly for SQL safety (handles special chars like dashes)
-            preparer = self._engine.dialect.identifier_preparer
-            quoted_table = preparer.quote(table.name)
-            quoted_column = preparer.quote(column_name)
-
-            # Generate ALTER TABLE statement
-            alter_sql = f"ALTER TABLE {quoted_table} ADD COLUMN {quoted_column} {col_type_sql}"
-
-            with self._engine.begin() as conn:
-                conn.execute(DDL(alter_sql))
-
-            # Refresh metadata
-            self.reflect()
-
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to add column '{column_name}' to table '{table.name}': {e}",
-                table_name=table.name,
+        self._add_columns(table, [Column(column_name, column_type)])
+
+    def _add_columns(self, table: Table, columns: list[Column]) -> None:
+        """Run ALTER TABLE for new columns and append them to the Table object."""
+        names = ", ".join(f"'{col.name}'" for col in columns)
+        with schema_errors(f"add column {names} to table '{table.name}'", table.name):
+            statements = add_columns_sql(
+                self._engine.dialect, table, columns, self._type_sql_cache
             )
+            with self._ddl(table.name) as conn:
+                for alter_sql in statements:
+                    conn.execute(DDL(alter_sql.replace('%', '%%')))
+
+            # Add columns to the Table object in place instead of reflecting
+            for col in columns:
+                table.append_column(col)
+            # Compiled SQL is cached per Table, not per column list, so
+            # statements compiled before the change would miss the new columns
+            self._engine.clear_compiled_cache()
 
     def drop_table(self, table_name: str) -> None:
         """Drop table (sync version)."""
-        if not self.table_exists(table_name):
+        # Known table or a single-table reflect - no full schema reflect
+        table = self.reflected_table(table_name)
+        if table is None:
+            table = self._reflect_one(table_name)
+        if table is None:
             raise TableNotFoundError(table_name)
 
-        try:
-            table = self.get_table(table_name)
-            with self._engine.begin() as conn:
+        with schema_errors(f"drop table '{table_name}'", table_name):
+            with self._ddl(table_name) as conn:
                 table.drop(conn)
 
             # Refresh metadata
             self._metadata.remove(table)
 
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to drop table '{table_name}': {e}",
-                table_name=table_name,
-            )
-
     def reflect(self) -> None:
-        """Reflect database schema (sync version)."""
-        try:
+        """Reflect database schema once, until invalidate() (sync version)."""
+        if self._reflected:
+            return
+
+        with schema_errors("reflect schema"):
             # Clear existing metadata to force fresh reflection
             self._metadata.clear()
 
-            with self._engine.connect() as conn:
-                self._metadata.reflect(
-                    bind=conn,
-                    schema=self._schema,
-                )
-        except Exception as e:
-            raise SchemaError(f"Failed to reflect schema: {e}")
+            with self._connection(begin=False) as conn:
+                if not self._load_cached(conn.dialect):
+                    self._metadata.reflect(
+                        bind=conn,
+                        schema=self._schema,
+                    )
+                    self._store_cached()
+
+        self._reflected = True
+
+    def invalidate(self) -> None:
+        """Drop the reflected schema so the next reflect() loads it again."""
+        self._reflected = False
+        self.invalidate_cache()
+
+    @contextmanager
+    def track_ddl(self) -> Iterator[set[str]]:
+        """Record tables changed by DDL, forgetting them on error (sync version)."""
+        changed: set[str] = set()
+        token = self._ddl_tables.set(changed)
+        try:
+            yield changed
+        except BaseException:
+            if changed:
+                self._metadata.clear()
+                self.invalidate()
+            raise
+        finally:
+            self._ddl_tables.reset(token)
+
+    def _inspect(self, conn) -> Inspector:
+        """Get Inspector for a connection, sharing the manager's cache."""
+        forget_missing_tables(self._info_cache)
+        inspector = inspect(conn)
+        inspector.info_cache = self._info_cache
+        return inspector
+
+    def invalidate_cache(self) -> None:
+        """Forget cached Inspector results and on-disk schema (after every DDL)."""
+        self._info_cache.clear()
+        reflection_cache.discard(self._cache_path)
+
+    def _load_cached(self, dialect) -> bool:
+        """Load reflected schema from the disk cache, if enabled and fresh."""
+        if not self._cache_ttl:
+            return False
+        self._cache_path = reflection_cache.cache_path(
+            self._engine.url, self._schema, dialect.server_version_info
+        )
+        return reflection_cache.load(self._cache_path, self._metadata, self._cache_ttl)
+
+    def _store_cached(self) -> None:
+        """Write freshly reflected schema to the disk cache, if enabled."""
+        if self._cache_path is not None:
+            reflection_cache.store(self._cache_path, self._metadata)
+
+    def _reflect_one(self, table_name: str) -> Table | None:
+        """Reflect a single table into metadata (sync version)."""
+        with schema_errors(f"reflect table '{table_name}'", table_name):
+            with self._connection(begin=False) as conn:
+                reflect_table(self._inspect(conn), self._metadata, table_name, self._schema)
+        return self.reflected_table(table_name)
 
     @staticmethod
     def _generate_index_name(table_name: str, columns: list[str]) -> str:
@@ -660,18 +1307,7 @@ class SyncSchemaManager:
         Returns:
             Generated index name (truncated to 63 chars if necessary)
         """
-        # Build base name
-        col_part = "_".join(columns)
-        base_name = f"idx_{table_name}_{col_part}"
-
-        # PostgreSQL has 63 char limit for identifiers
-        if len(base_name) <= 63:
-            return base_name
-
-        # Truncate and add hash suffix for uniqueness
-        hash_suffix = hashlib.md5(base_name.encode()).hexdigest()[:8]
-        max_prefix_len = 63 - len(hash_suffix) - 1  # -1 for underscore
-        return f"{base_name[:max_prefix_len]}_{hash_suffix}"
+        return generate_index_name(table_name, tuple(columns))
 
     def create_index(
         self,
@@ -704,9 +1340,9 @@ class SyncSchemaManager:
         if not columns:
             raise ValueError("columns list cannot be empty")
 
-        try:
+        with schema_errors(f"create index on table '{table.name}'", table.name):
             # Validate all columns exist
-            table_cols = {col.name for col in table.columns}
+            table_cols = table.c
             for col_name in columns:
                 if col_name not in table_cols:
                     raise ColumnNotFoundError(col_name, table.name)
@@ -734,23 +1370,21 @@ class SyncSchemaManager:
 
             index = Index(index_name, *index_columns, unique=unique, **kw)
 
-            # Create index in database
-            with self._engine.begin() as conn:
-                index.create(conn, checkfirst=True)
-
-            # Refresh metadata to include new index
-            self.reflect()
-
+            # Create index in database (IF NOT EXISTS saves the separate
+            # existence check where the dialect supports it)
+            try:
+                with self._ddl(table.name) as conn:
+                    if dialect_name in IF_NOT_EXISTS_DIALECTS:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                    else:
+                        index.create(conn, checkfirst=True)
+            except Exception:
+                table.indexes.discard(index)
+                raise
+
+            # The Index object is attached to the table - no need to reflect
             return index_name
 
-        except ColumnNotFoundError:
-            raise
-        except Exception as e:
-            raise SchemaError(
-                f"Failed to create index on table '{table.name}': {e}",
-                table_name=table.name,
-            )
-
     def index_exists(self, table: Table, columns: list[str]) -> bool:
         """
         Check if index exists on specified columns (sync version).
@@ -762,32 +1396,6 @@ class SyncSchemaManager:
         Returns:
             True if matching index exists, False otherwise
         """
-        # Reflect metadata to get fresh schema
-        self.reflect()
-
-        # Get updated table object from metadata
-        full_name = f"{self._schema}.{table.name}" if self._schema else table.name
-        if full_name in self._metadata.tables:
-            fresh_table = self._metadata.tables[full_name]
-        elif table.name in self._metadata.tables:
-            fresh_table = self._metadata.tables[table.name]
-        else:
-            return False
-
-        # Convert columns to set for comparison
-        columns_set = set(columns)
-
-        # Check each index
-        for index in fresh_table.indexes:
-            index_cols = {col.name for col in index.columns}
-
-            # For single column, order doesn't matter
-            if len(columns) == 1:
-                if columns_set == index_cols:
-                    return True
-            # For compound indexes, check exact match (order-independent for simplicity)
-            else:
-                if columns_set == index_cols:
-                    return True
-
-        return False
+        # One get_indexes query (cached until the next DDL), no reflect
+        with self._connection(begin=False) as conn:
+            return has_index_on(self._inspect(conn), table.name, self._schema, columns)
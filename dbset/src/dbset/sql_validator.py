@@ -1,6 +1,20 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+try:
+    # google-re2: linear-time DFA matching with the same API as re
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+try:
+    # sqlglot: real SQL parser, handles quoting, CTEs and subqueries
+    import sqlglot
+    from sqlglot import exp as _exp
+except ImportError:
+    sqlglot = None
 
 FORBIDDEN_KEYWORDS = [
     "INSERT",
@@ -16,11 +30,36 @@ FORBIDDEN_KEYWORDS = [
     "EXEC",
 ]
 
-FORBIDDEN_PATTERN = re.compile(
-    r"\b(" + "|".join(FORBIDDEN_KEYWORDS) + r")\b",
-    re.IGNORECASE,
+
+def _compile_keywords(keywords: list[str]) -> re.Pattern:
+    """Compile a case-insensitive whole-word alternation, using re2 if installed."""
+    pattern = r"\b(" + "|".join(keywords) + r")\b"
+    if _re2 is not None:
+        return _re2.compile("(?i)" + pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+FORBIDDEN_PATTERN = _compile_keywords(FORBIDDEN_KEYWORDS)
+
+# Function calls that contain FROM, e.g. EXTRACT(YEAR FROM created_at)
+FUNCTION_FROM_PATTERN = re.compile(
+    r'\b(EXTRACT|SUBSTRING|POSITION|TRIM)\s*\([^)]*\bFROM\b[^)]*\)',
+    re.IGNORECASE
+)
+
+# Match FROM/JOIN tablename - capture only table name, in one pass
+# Pattern explanation:
+# \b(?:FROM|JOIN)\s+ - FROM or JOIN keyword followed by whitespace
+# ([a-zA-Z_][a-zA-Z0-9_]*) - table name (captured)
+# Aliases are not consumed, so "FROM a JOIN b" still finds b
+TABLE_REF_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)',
+    re.IGNORECASE
 )
 
+# Number of distinct SQL strings whose parsed table names are remembered
+PARSE_CACHE_SIZE = 4096
+
 
 class SQLValidationError(Exception):
     pass
@@ -46,43 +85,47 @@ def validate_readonly(sql: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parsed_table_names(sql: str) -> tuple[str, ...] | None:
+    """
+    Get table names from the sqlglot AST, skipping CTE names.
+    Returns None if sqlglot is not installed or the query does not parse.
+    """
+    if sqlglot is None:
+        return None
+    try:
+        tree = sqlglot.parse_one(sql)
+    except sqlglot.errors.SqlglotError:
+        return None
+    if tree is None:
+        return None
+
+    ctes = {cte.alias for cte in tree.find_all(_exp.CTE)}
+    return tuple(dict.fromkeys(
+        table.name
+        for table in tree.find_all(_exp.Table)
+        if table.name and table.name not in ctes
+    ))
+
+
 def extract_table_names(sql: str) -> list[str]:
     """
     Extract table names from SQL query.
-    Improved regex-based extraction for FROM and JOIN clauses.
-    Handles table aliases and avoids matching FROM in function calls like EXTRACT(... FROM ...).
+    Uses the sqlglot AST when sqlglot is installed and the query parses;
+    otherwise falls back to regex-based extraction for FROM and JOIN clauses.
+    The regex path handles table aliases and avoids matching FROM in function
+    calls like EXTRACT(... FROM ...).
     """
-    tables: list[str] = []
+    parsed = _parsed_table_names(sql)
+    if parsed is not None:
+        return list(parsed)
 
     # Remove function calls containing FROM (like EXTRACT, SUBSTRING, etc.)
     # to avoid false positives
-    sql_cleaned = re.sub(
-        r'\b(EXTRACT|SUBSTRING|POSITION|TRIM)\s*\([^)]*\bFROM\b[^)]*\)',
-        '',
-        sql,
-        flags=re.IGNORECASE
-    )
-
-    # Match FROM tablename [alias] - capture only table name, not alias
-    # Pattern explanation:
-    # \bFROM\s+ - FROM keyword followed by whitespace
-    # ([a-zA-Z_][a-zA-Z0-9_]*) - table name (captured)
-    # (?:\s+[a-zA-Z_][a-zA-Z0-9_]*)? - optional alias (not captured)
-    from_pattern = re.compile(
-        r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*)(?:\s+(?:AS\s+)?[a-zA-Z_][a-zA-Z0-9_]*)?',
-        re.IGNORECASE
-    )
-
-    # Match JOIN tablename [alias] - capture only table name, not alias
-    join_pattern = re.compile(
-        r'\bJOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)(?:\s+(?:AS\s+)?[a-zA-Z_][a-zA-Z0-9_]*)?',
-        re.IGNORECASE
-    )
-
-    tables.extend(from_pattern.findall(sql_cleaned))
-    tables.extend(join_pattern.findall(sql_cleaned))
-
-    return list(set(tables))
+    sql_cleaned = FUNCTION_FROM_PATTERN.sub('', sql)
+
+    # Deduplicate, keeping first-seen order
+    return list(dict.fromkeys(TABLE_REF_PATTERN.findall(sql_cleaned)))
 
 
 def validate_tables_exist(sql: str, existing_tables: list[str]) -> list[str]:
@@ -90,12 +133,8 @@ def validate_tables_exist(sql: str, existing_tables: list[str]) -> list[str]:
     Check if all tables referenced in SQL exist in the schema.
     Returns list of missing tables (empty if all exist).
     """
-    referenced_tables = extract_table_names(sql)
-    existing_lower = [t.lower() for t in existing_tables]
-
-    missing = []
-    for table in referenced_tables:
-        if table.lower() not in existing_lower:
-            missing.append(table)
-
-    return missing
+    existing_lower = {t.lower() for t in existing_tables}
+    return [
+        table for table in extract_table_names(sql)
+        if table.lower() not in existing_lower
+    ]
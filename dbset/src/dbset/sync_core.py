@@ -1,19 +1,34 @@
 """Sync core API - Database and Table classes built on SQLAlchemy sync."""
 from __future__ import annotations
 
+import sys
 from contextlib import contextmanager
-from typing import Any, Iterator
+from functools import partial
+from typing import Any, Callable, Iterator
 
-from sqlalchemy import Engine, MetaData, create_engine, delete, func, insert, select, update
+from sqlalchemy import Engine, Integer, MetaData, bindparam, create_engine, delete, func, insert, select, update
 
-from .connection import SyncConnectionPool, create_pool_config
-from .exceptions import QueryError, ReadOnlyError, TableNotFoundError
-from .query import FilterBuilder
+from .connection import POOL_DEFAULTS, SyncConnectionPool, create_pool_config, resolve_url
+from .exceptions import ConnectionError, QueryError, ReadOnlyError, SchemaError, TableNotFoundError
+from .query import FilterBuilder, is_streamable, text_clause
+from .rows import iter_dicts
 from .schema import SyncSchemaManager
-from .types import PrimaryKeyConfig, PrimaryKeyType, TypeInference
+from .types import PrimaryKeyConfig, PrimaryKeyType, TypeInference, default_pk_config
+from .upsert import prepare_upsert, returning_column
 from .validators import ReadOnlyValidator
 
 
+# Rows fetched per batch when streaming Database.query() results
+QUERY_STREAM_SIZE = 1000
+
+# Max statements kept per table in the statement cache
+STMT_CACHE_SIZE = 256
+
+# Compiled SQL kept per engine (SQLAlchemy default is 500, which a few busy
+# tables with many filter shapes can cycle through)
+QUERY_CACHE_SIZE = 2000
+
+
 class Database:
     """
     Sync database connection - thin wrapper over SQLAlchemy Engine.
@@ -30,6 +45,19 @@ class Database:
         >>> db.close()
     """
 
+    __slots__ = (
+        '_engine',
+        '_metadata',
+        '_schema',
+        '_pool',
+        '_read_only',
+        '_ensure_schema',
+        '_pk_config',
+        '_text_index_prefix',
+        '_tables',
+        '_closed',
+    )
+
     def __init__(
         self,
         engine: Engine,
@@ -60,9 +88,10 @@ class Database:
         self._pool = pool
         self._read_only = read_only
         self._ensure_schema = ensure_schema
-        self._pk_config = pk_config or PrimaryKeyConfig()
+        self._pk_config = pk_config or default_pk_config()
         self._text_index_prefix = text_index_prefix
         self._tables: dict[str, 'Table'] = {}
+        self._closed = False
 
     @classmethod
     def connect(
@@ -71,12 +100,16 @@ class Database:
         read_only: bool = False,
         ensure_schema: bool = True,
         schema: str | None = None,
-        pool_size: int = 5,
-        max_overflow: int = 10,
+        pool_size: int = POOL_DEFAULTS['pool_size'],
+        max_overflow: int = POOL_DEFAULTS['max_overflow'],
+        pool_recycle: int = POOL_DEFAULTS['pool_recycle'],
         primary_key_type: str | PrimaryKeyType = PrimaryKeyType.INTEGER,
         primary_key_column: str = 'id',
         pk_config: PrimaryKeyConfig | None = None,
         text_index_prefix: int = 255,
+        pre_ping: bool = False,
+        pool_timeout: float = POOL_DEFAULTS['pool_timeout'],
+        reflection_cache_ttl: float = 0,
         **engine_kwargs,
     ) -> 'Database':
         """
@@ -87,13 +120,22 @@ class Database:
             read_only: If True, only SELECT queries allowed
             ensure_schema: If True, auto-create tables/columns
             schema: Database schema name (optional)
-            pool_size: Connection pool size (default: 5)
-            max_overflow: Max connections beyond pool_size (default: 10)
+            pool_size: Connection pool size (default: 10)
+            max_overflow: Max connections beyond pool_size (default: 20)
+            pool_recycle: Recycle connections after N seconds (default: 300)
             primary_key_type: Type of primary key for auto-created tables
                              ('integer', 'uuid', or PrimaryKeyType enum)
             primary_key_column: Name of primary key column (default: 'id')
             pk_config: Advanced PK configuration (overrides primary_key_type/column)
             text_index_prefix: Prefix length for TEXT column indexes in MySQL/MariaDB (default: 255)
+            pre_ping: Test connections with a round trip on every checkout
+                      (default: False)
+            pool_timeout: Seconds to wait for a free connection before
+                          raising (default: 10.0)
+            reflection_cache_ttl: If set, keep the reflected schema in
+                                  $XDG_CACHE_HOME/dbset for this many seconds
+                                  and load it on connect instead of
+                                  reflecting (default: 0 - disabled)
             **engine_kwargs: Additional arguments for create_engine
 
         Returns:
@@ -122,8 +164,11 @@ class Database:
             ...     read_only=True
             ... )
         """
+        # Validate URL and switch to a matching driver up front
+        url = resolve_url(url, async_driver=False)
+
         # Create engine config
-        engine_config = {**engine_kwargs}
+        engine_config = {'query_cache_size': QUERY_CACHE_SIZE, **engine_kwargs}
 
         # Only apply pool config for non-SQLite databases
         # (SQLite uses SingletonThreadPool which doesn't accept these params)
@@ -131,6 +176,9 @@ class Database:
             pool_config = create_pool_config(
                 pool_size=pool_size,
                 max_overflow=max_overflow,
+                pool_recycle=pool_recycle,
+                pre_ping=pre_ping,
+                pool_timeout=pool_timeout,
             )
             engine_config.update(pool_config)
 
@@ -140,18 +188,25 @@ class Database:
         # Create metadata
         metadata = MetaData(schema=schema)
 
-        # Create schema manager
-        schema_manager = SyncSchemaManager(engine, metadata, schema)
-
         # Create connection pool
         pool = SyncConnectionPool(engine)
 
+        # Create schema manager
+        schema_manager = SyncSchemaManager(
+            engine, metadata, schema, pool=pool, cache_ttl=reflection_cache_ttl
+        )
+
+        # Warm up: open the first pooled connection and load the schema now,
+        # so connection problems surface here rather than on the first query
+        try:
+            schema_manager.reflect()
+        except SchemaError as e:
+            engine.dispose()
+            raise ConnectionError(f"Failed to connect to database: {e}")
+
         # Create primary key config
         if pk_config is None:
-            pk_config = PrimaryKeyConfig(
-                pk_type=primary_key_type,
-                column_name=primary_key_column
-            )
+            pk_config = default_pk_config(primary_key_type, primary_key_column)
 
         return cls(
             engine=engine,
@@ -179,8 +234,12 @@ class Database:
             >>> users.insert({'name': 'John'})
         """
         # Return cached table if exists
-        if table_name in self._tables:
-            return self._tables[table_name]
+        table = self._tables.get(table_name)
+        if table is not None:
+            return table
+
+        # Intern name so later lookups hit the identity fast path
+        table_name = sys.intern(table_name)
 
         # Create new table wrapper
         table = Table(
@@ -193,21 +252,30 @@ class Database:
             text_index_prefix=self._text_index_prefix,
         )
 
-        # Cache it
-        self._tables[table_name] = table
+        # Reuse table reflected at connect time, so the first access to
+        # .table does not reflect again
+        table._table = self._schema.reflected_table(table_name)
 
-        return table
+        # Cache it; setdefault keeps the first wrapper if another thread
+        # created one for the same name in the meantime
+        return self._tables.setdefault(table_name, table)
 
     def query(
         self,
         sql: str | Any,
+        _stream: bool = True,
         **params,
     ) -> Iterator[dict]:
         """
         Execute raw SQL query or SQLAlchemy statement.
 
+        SELECT and WITH queries are streamed with a server-side cursor (where
+        supported) in batches of QUERY_STREAM_SIZE rows; other statements
+        (e.g. UPDATE ... RETURNING) are fetched in one go.
+
         Args:
             sql: SQL string or SQLAlchemy statement
+            _stream: If False, fetch all rows at once instead of streaming
             **params: Query parameters for raw SQL
 
         Yields:
@@ -231,34 +299,180 @@ class Database:
         if self._read_only and isinstance(sql, str):
             ReadOnlyValidator.validate_sql(sql)
 
-        with self._pool.connect() as conn:
-            if isinstance(sql, str):
-                # Raw SQL string
-                result = conn.execute(sql, params)
-            else:
-                # SQLAlchemy statement
-                result = conn.execute(sql)
+        # Raw SQL strings must be wrapped in text() to be executable;
+        # parsed ones are cached per string
+        stmt = text_clause(sql) if isinstance(sql, str) else sql
+        if _stream and is_streamable(stmt):
+            stmt = stmt.execution_options(yield_per=QUERY_STREAM_SIZE)
+
+        with self._pool.acquire() as conn:
+            result = conn.execute(stmt, params)
 
             # Yield rows as dicts
-            for row in result:
-                yield dict(row._mapping)
+            for row in iter_dicts(result):
+                yield row
+
+    def execute_many(
+        self,
+        sql: str | Any,
+        rows: list[dict[str, Any]],
+    ) -> int:
+        """
+        Execute one statement for many parameter sets (executemany).
+
+        All parameter sets go to the driver in a single executemany call
+        within one transaction, so bulk UPDATE/DELETE/INSERT statements
+        skip the per-row table API. INSERTs are batched into multi-row
+        VALUES by SQLAlchemy where the dialect supports it.
+
+        Args:
+            sql: SQL string with :name parameters, or SQLAlchemy statement
+            rows: List of parameter dictionaries
+
+        Returns:
+            Number of parameter sets executed
+
+        Raises:
+            ReadOnlyError: If in read-only mode
+
+        Examples:
+            >>> db.execute_many(
+            ...     "UPDATE users SET score = :score WHERE id = :id",
+            ...     [{'id': 1, 'score': 10}, {'id': 2, 'score': 20}],
+            ... )
+            2
+        """
+        if self._read_only:
+            raise ReadOnlyError("execute_many not allowed in read-only mode")
+
+        if not rows:
+            return 0
+
+        stmt = text_clause(sql) if isinstance(sql, str) else sql
+        with self._pool.acquire() as conn:
+            conn.execute(stmt, rows)
+        return len(rows)
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, batch: bool = False, chunk_size: int = 1000):
         """
         Start explicit transaction context.
 
+        All operations within the context will be committed together
+        or rolled back on exception.
+
+        With batch=True the block gets a BulkInserter instead of the
+        connection: rows passed to its insert() are buffered per table and
+        written as multi-row INSERTs (every chunk_size rows, and before
+        commit), so N inserts cost a few round-trips instead of N. Call
+        its flush() to make buffered rows visible to queries in the block.
+
+        Args:
+            batch: If True, yield a BulkInserter bound to the transaction
+            chunk_size: Number of buffered rows per table that triggers a
+                        write (batch mode only)
+
+        Yields:
+            Connection inside the transaction, or BulkInserter if batch=True
+
         Examples:
             >>> with db.transaction():
             ...     db['users'].insert({'name': 'Alice'})
             ...     db['orders'].insert({'user_id': 1, 'total': 100})
+
+            >>> # Buffer inserts, one multi-row INSERT per table on commit
+            >>> with db.transaction(batch=True) as tx:
+            ...     for row in rows:
+            ...         tx.insert('users', row)
         """
         if self._read_only:
             raise ReadOnlyError("Transactions not allowed in read-only mode")
 
+        changed: set[str] = set()
+        try:
+            with self._schema.track_ddl() as changed, self._pool.transaction() as conn:
+                if not batch:
+                    yield conn
+                    return
+
+                inserter = BulkInserter(self, chunk_size)
+                yield inserter
+                inserter.flush()
+        except BaseException:
+            # Tables created or altered in the rolled back transaction
+            # must be loaded again from the database
+            for name in changed:
+                table = self._tables.get(name)
+                if table is not None:
+                    table._table = None
+            raise
+
+    @contextmanager
+    def bulk(self, chunk_size: int = 1000) -> Iterator['BulkInserter']:
+        """
+        Buffer single-row inserts and write them in batches.
+
+        Rows are written with insert_many() every chunk_size rows per table
+        and on exit. If the block raises, rows not yet written are discarded.
+
+        Args:
+            chunk_size: Number of buffered rows per table and key set that
+                        triggers a write
+
+        Yields:
+            BulkInserter handle
+
+        Examples:
+            >>> with db.bulk() as bulk:
+            ...     for row in parsed_rows:
+            ...         bulk.insert('users', row)
+        """
+        if self._read_only:
+            raise ReadOnlyError("INSERT not allowed in read-only mode")
+
+        inserter = BulkInserter(self, chunk_size)
+        yield inserter
+        inserter.flush()
+
+    def counts(self, *tables: str | tuple[str, dict[str, Any]]) -> dict[str, int]:
+        """
+        Count rows of several tables in one round-trip.
+
+        Each table becomes a scalar subquery of a single SELECT, so a
+        dashboard showing N counters waits for one query instead of N.
+
+        Args:
+            *tables: Table names, or (table_name, filters) tuples where
+                     filters are column filters as accepted by count()
+
+        Returns:
+            Dict of table_name -> number of matching rows
+
+        Raises:
+            TableNotFoundError: If a table doesn't exist (and ensure_schema is off)
+
+        Examples:
+            >>> db.counts('users', ('orders', {'status': 'open'}))
+            {'users': 120, 'orders': 7}
+        """
+        if not tables:
+            return {}
+
+        names = []
+        columns = []
+        for i, spec in enumerate(tables):
+            name, filters = (spec, {}) if isinstance(spec, str) else spec
+            table = self[name]._get_table()
+            stmt = select(func.count()).select_from(table)
+            where_clause = FilterBuilder.build(table, filters)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            names.append(name)
+            columns.append(stmt.scalar_subquery().label(f'count_{i}'))
+
         with self._pool.acquire() as conn:
-            with conn.begin():
-                yield conn
+            row = conn.execute(select(*columns)).one()
+        return dict(zip(names, row))
 
     @property
     def tables(self) -> list[str]:
@@ -275,9 +489,32 @@ class Database:
         """
         return self._schema.get_table_names()
 
+    def invalidate(self) -> None:
+        """
+        Forget the reflected schema, so it is loaded again on next use.
+
+        The schema is reflected once and then kept up to date with the
+        changes made through this Database. Call this after schema changes
+        made elsewhere (migrations, raw DDL, other processes); it also
+        discards the on-disk copy kept with reflection_cache_ttl.
+
+        Examples:
+            >>> db.invalidate()
+            >>> users.find_one(id=1)  # reflects the schema again
+        """
+        self._schema.invalidate()
+        for table in self._tables.values():
+            table._table = None
+
     def close(self):
         """Close database connection and dispose engine."""
         self._pool.close()
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """Check if close() has been called."""
+        return self._closed
 
     @property
     def read_only(self) -> bool:
@@ -308,6 +545,25 @@ class Table:
         >>> table.delete(name='John')
     """
 
+    __slots__ = (
+        '_db',
+        '_name',
+        '_schema',
+        '_pool',
+        '_read_only',
+        '_ensure_schema',
+        '_text_index_prefix',
+        '_table',
+        '_stmt_cache',
+        '_stmt_cache_table',
+        '_stmt_cache_width',
+        '_columns',
+        '_columns_table',
+        '_dialect_name',
+        '_pk_config',
+        '_ensured_indexes',
+    )
+
     def __init__(
         self,
         db: Database,
@@ -327,6 +583,18 @@ class Table:
         self._ensure_schema = ensure_schema
         self._text_index_prefix = text_index_prefix
         self._table = None  # SQLAlchemy Table (lazy loaded)
+        # Statements built against _stmt_cache_table, reused across calls
+        self._stmt_cache: dict[str, Any] = {}
+        self._stmt_cache_table = None
+        self._stmt_cache_width = 0
+        # Plain name -> Column dict of _columns_table, for FilterBuilder
+        self._columns: dict[str, Any] = {}
+        self._columns_table = None
+        # Invariant for the wrapper's lifetime - read once, not per row
+        self._dialect_name = db._engine.dialect.name
+        self._pk_config = db._pk_config
+        # Column sets already indexed by upsert()/upsert_many()
+        self._ensured_indexes: set[frozenset[str]] = set()
 
     def _get_table(self):
         """Lazy load SQLAlchemy Table object."""
@@ -337,6 +605,142 @@ class Table:
             )
         return self._table
 
+    def _cached_stmt(self, table, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Get statement from per-table cache, building it on first use.
+
+        Reusing statement objects skips statement construction and cache
+        key generation on every call. The cache is dropped whenever the
+        SQLAlchemy Table object changes (e.g. after schema reflection) or
+        gains columns, since select(table) memoizes its column list.
+
+        Args:
+            table: SQLAlchemy Table object the statement is built against
+            key: Cache key (statement kind and shape)
+            build: Factory returning a new statement
+
+        Returns:
+            Cached or newly built statement
+        """
+        if self._stmt_cache_table is not table or self._stmt_cache_width != len(table.c):
+            self._stmt_cache.clear()
+            self._stmt_cache_table = table
+            self._stmt_cache_width = len(table.c)
+
+        stmt = self._stmt_cache.get(key)
+        if stmt is None:
+            if len(self._stmt_cache) >= STMT_CACHE_SIZE:
+                self._stmt_cache.clear()
+            stmt = self._stmt_cache[key] = build()
+        return stmt
+
+    def _column_map(self, table) -> dict[str, Any]:
+        """
+        Get name -> Column dict for table, rebuilt only when it changes.
+
+        A plain dict lookup is cheaper than going through table.c for
+        every filter column. Columns are only ever added to a Table, so a
+        changed column count means the dict is stale.
+
+        Args:
+            table: SQLAlchemy Table object
+
+        Returns:
+            Dictionary of column name -> Column
+        """
+        columns = self._columns
+        if self._columns_table is not table or len(columns) != len(table.c):
+            columns = self._columns = {col.name: col for col in table.c}
+            self._columns_table = table
+        return columns
+
+    def _filtered_stmt(
+        self,
+        table,
+        key: tuple,
+        filters: dict[str, Any],
+        build: Callable[[Any], Any],
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Get statement for filters, reusing it for filters of the same shape.
+
+        Filters that only differ in values (see FilterBuilder.shape) share
+        one statement built with bind parameters, so FilterBuilder and
+        statement construction run once per shape instead of per call.
+
+        Args:
+            table: SQLAlchemy Table object
+            key: Cache key for everything except the filters
+            filters: Column filters
+            build: Factory taking the WHERE clause (or None) and returning
+                   a statement
+
+        Returns:
+            Tuple of (statement, bind parameters)
+        """
+        if not self._column_map(table).keys() >= filters.keys():
+            # The column may have been added by another process or Database
+            self._schema.refresh_columns(table)
+
+        if len(filters) == 1:
+            # Point lookups like find_one(id=42): skip shape/param building
+            (column_name, value), = filters.items()
+            if value is not None and not isinstance(value, dict):
+                stmt = self._cached_stmt(
+                    table, (key, ((column_name, None),)),
+                    lambda: build(FilterBuilder.build_bound(table, filters, self._dialect)),
+                )
+                return stmt, {'dbset_w0': value}
+
+        shape = FilterBuilder.shape(filters)
+        if shape is None:
+            where_clause = FilterBuilder.build(
+                table, filters, columns=self._column_map(table)
+            )
+            return build(where_clause), {}
+
+        stmt = self._cached_stmt(
+            table, (key, shape),
+            lambda: build(FilterBuilder.build_bound(table, filters, self._dialect)),
+        )
+        return stmt, FilterBuilder.bind_params(filters)
+
+    def _missing_types(
+        self,
+        table,
+        rows: list[dict[str, Any]],
+        types: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get types for the keys of rows[0] (and types) that are not columns yet.
+
+        Only unknown keys go through type inference, so once the schema has
+        settled, writes skip inference and ensure_columns() entirely. Their
+        types are merged over all rows (see TypeInference.infer_types_from_rows).
+
+        Args:
+            table: SQLAlchemy Table object
+            rows: Rows about to be written (column names from the first)
+            types: Optional dict of column_name -> SQLAlchemy type overrides
+
+        Returns:
+            Dict of column_name -> SQLAlchemy type for missing columns
+        """
+        columns = table.c
+        missing = [key for key in rows[0] if key not in columns]
+        if missing:
+            inferred_types = TypeInference.infer_types_from_rows(
+                [{key: row.get(key) for key in missing} for row in rows],
+                dialect=self._dialect,
+            )
+        else:
+            inferred_types = {}
+        if types:
+            inferred_types.update(
+                {key: value for key, value in types.items() if key not in columns}
+            )
+        return inferred_types
+
     @property
     def table(self):
         """
@@ -361,7 +765,7 @@ class Table:
     @property
     def _dialect(self) -> str:
         """Get database dialect name (e.g., 'postgresql', 'sqlite')."""
-        return self._db._engine.dialect.name
+        return self._dialect_name
 
     def insert(
         self,
@@ -400,33 +804,29 @@ class Table:
         table = self._schema.get_table(
             self._name,
             ensure_exists=ensure,
-            pk_config=self._db._pk_config if ensure else None
+            pk_config=self._pk_config if ensure else None
         )
 
         # Generate primary key value if needed (for UUID/CUSTOM types)
-        pk_col = self._db._pk_config.column_name
-        if pk_col not in row and self._db._pk_config.generator:
-            row[pk_col] = self._db._pk_config.generate_value()
+        pk_col = self._pk_config.column_name
+        if pk_col not in row and self._pk_config.generator:
+            row[pk_col] = self._pk_config.generate_value()
 
         # Infer types and ensure columns exist
         if ensure:
-            inferred_types = TypeInference.infer_types_from_row(row, dialect=self._dialect)
-            if types:
-                inferred_types.update(types)
-            self._schema.ensure_columns(table, inferred_types)
-
-            # Clear cached table and reload
-            self._table = None
-            table = self._schema.get_table(self._name, ensure_exists=False)
+            missing_types = self._missing_types(table, [row], types)
+            if missing_types:
+                table = self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
-        # Insert row
-        stmt = insert(table).values(**row)
+        # Insert row (cached statement, values passed as parameters)
+        stmt = self._cached_stmt(table, 'insert', lambda: insert(table))
 
         with self._pool.acquire() as conn:
-            result = conn.execute(stmt)
+            result = conn.execute(stmt, row)
             # For UUID/CUSTOM, return the generated value from row
             # For Integer, return from inserted_primary_key
-            if self._db._pk_config.pk_type != PrimaryKeyType.INTEGER:
+            if self._pk_config.pk_type != PrimaryKeyType.INTEGER:
                 return row.get(pk_col)
             else:
                 return result.inserted_primary_key[0]
@@ -440,6 +840,8 @@ class Table:
         """
         Insert multiple rows (batch operation).
 
+        All chunks are written in one transaction.
+
         Args:
             rows: List of dictionaries
             ensure: If True, auto-create table/columns
@@ -468,41 +870,83 @@ class Table:
 
         # Infer types and ensure columns
         if ensure:
-            inferred_types = TypeInference.infer_types_from_row(rows[0], dialect=self._dialect)
-            self._schema.ensure_columns(table, inferred_types)
-
-            # Clear cached table and reload
-            self._table = None
-            table = self._schema.get_table(self._name, ensure_exists=False)
+            missing_types = self._missing_types(table, rows)
+            if missing_types:
+                table = self._schema.ensure_columns(table, missing_types)
+            self._table = table
+
+        # Multi-row VALUES: one statement per chunk, chunks stay under the
+        # bind limit. Only for rows that all have the same keys - padding
+        # the others with NULL would override server defaults, where
+        # executemany raises for the missing value instead
+        columns = None
+        if self._use_multi_values:
+            keys = rows[0].keys()
+            if all(row.keys() == keys for row in rows):
+                columns = [col_name for col_name in keys if col_name in table.c]
+        if columns:
+            max_params = self._db._engine.dialect.insertmanyvalues_max_parameters
+            chunk_size = max(1, min(chunk_size, max_params // len(columns)))
+        else:
+            stmt = self._cached_stmt(table, 'insert', lambda: insert(table))
 
-        # Insert in chunks
+        # Insert in chunks within a single transaction (one commit per batch)
         total = 0
-        for i in range(0, len(rows), chunk_size):
-            chunk = rows[i:i + chunk_size]
-            with self._pool.acquire() as conn:
-                conn.execute(insert(table), chunk)
+        with self._pool.acquire() as conn:
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                if columns:
+                    values = [{col_name: row[col_name] for col_name in columns} for row in chunk]
+                    conn.execute(insert(table).values(values))
+                else:
+                    conn.execute(stmt, chunk)
                 total += len(chunk)
 
         return total
 
+    @property
+    def _use_multi_values(self) -> bool:
+        """
+        Check if insert_many should send multi-row VALUES statements.
+
+        SQLite runs executemany in-process, SQLAlchemy already batches
+        executemany into multi-row VALUES for psycopg2 and pyodbc, and the
+        MySQL drivers rewrite it themselves, so they gain nothing; Oracle
+        has no multi-row VALUES. That leaves PostgreSQL via psycopg 3,
+        asyncpg or pg8000.
+        """
+        dialect = self._db._engine.dialect
+        return (
+            dialect.supports_multivalues_insert
+            and dialect.name not in ('sqlite', 'mysql', 'mariadb')
+            and not dialect.use_insertmanyvalues_wo_returning
+        )
+
     def find(
         self,
         _limit: int | None = None,
         _offset: int = 0,
         _order_by: str | list[str] | None = None,
+        _stream_size: int = 1000,
+        _as_dict: bool = True,
         **filters,
     ) -> Iterator[dict]:
         """
         Find rows matching filters.
 
+        Results are streamed and fetched in batches of _stream_size rows.
+
         Args:
             _limit: Maximum number of rows
             _offset: Number of rows to skip
             _order_by: Column(s) to order by
+            _stream_size: Number of rows fetched per batch (default: 1000)
+            _as_dict: If False, yield SQLAlchemy Row objects instead of
+                      dicts (attribute access, no per-row dict copy)
             **filters: Column filters
 
         Yields:
-            Rows as dictionaries
+            Rows as dictionaries (Rows if _as_dict is False)
 
         Examples:
             >>> for user in table.find(age={'>=': 18}, status='active'):
@@ -510,37 +954,53 @@ class Table:
         """
         table = self._get_table()
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
-
-        # Build SELECT statement
-        stmt = select(table)
-
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
-
-        # Add ordering
-        if _order_by:
-            order_clauses = FilterBuilder.parse_order_by(table, _order_by)
-            stmt = stmt.order_by(*order_clauses)
-
-        # Add pagination
+        # Build SELECT statement, reused for filters of the same shape
+        order_key = (_order_by,) if isinstance(_order_by, str) else tuple(_order_by or ())
+
+        def build_select(where_clause):
+            stmt = select(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+
+            # Add ordering
+            if order_key:
+                stmt = stmt.order_by(*FilterBuilder.parse_order_by(table, list(order_key)))
+
+            # Add pagination (values are bound per call)
+            if _offset:
+                stmt = stmt.offset(bindparam('dbset_offset', type_=Integer))
+            if _limit:
+                stmt = stmt.limit(bindparam('dbset_limit', type_=Integer))
+            return stmt.execution_options(yield_per=_stream_size)
+
+        stmt, params = self._filtered_stmt(
+            table,
+            ('find', order_key, bool(_offset), bool(_limit), _stream_size),
+            filters,
+            build_select,
+        )
         if _offset:
-            stmt = stmt.offset(_offset)
+            params['dbset_offset'] = _offset
         if _limit:
-            stmt = stmt.limit(_limit)
+            params['dbset_limit'] = _limit
 
-        # Execute and yield rows
-        with self._pool.connect() as conn:
-            result = conn.execute(stmt)
-            for row in result:
-                yield dict(row._mapping)
+        # Execute with server-side cursor (where supported) and yield rows
+        with self._pool.acquire() as conn:
+            result = conn.execute(stmt, params)
+            yield from iter_dicts(result) if _as_dict else result
 
-    def find_one(self, **filters) -> dict | None:
+    def find_one(
+        self,
+        _offset: int = 0,
+        _order_by: str | list[str] | None = None,
+        **filters,
+    ) -> dict | None:
         """
         Find single row matching filters.
 
         Args:
+            _offset: Number of rows to skip
+            _order_by: Column(s) to order by
             **filters: Column filters
 
         Returns:
@@ -549,9 +1009,29 @@ class Table:
         Examples:
             >>> user = table.find_one(name='John')
         """
-        for row in self.find(_limit=1, **filters):
-            return row
-        return None
+        table = self._get_table()
+
+        # Plain execute + first(): no streaming cursor or generator needed
+        order_key = (_order_by,) if isinstance(_order_by, str) else tuple(_order_by or ())
+
+        def build_select(where_clause):
+            stmt = select(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            if order_key:
+                stmt = stmt.order_by(*FilterBuilder.parse_order_by(table, list(order_key)))
+            if _offset:
+                stmt = stmt.offset(bindparam('dbset_offset', type_=Integer))
+            return stmt.limit(1)
+
+        stmt, params = self._filtered_stmt(
+            table, ('find_one', order_key, bool(_offset)), filters, build_select
+        )
+        if _offset:
+            params['dbset_offset'] = _offset
+        with self._pool.acquire() as conn:
+            row = conn.execute(stmt, params).mappings().first()
+        return dict(row) if row is not None else None
 
     def all(self) -> Iterator[dict]:
         """
@@ -583,18 +1063,18 @@ class Table:
         """
         table = self._get_table()
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
-
-        # Build COUNT statement
-        stmt = select(func.count()).select_from(table)
+        def build_count(where_clause):
+            stmt = select(func.count()).select_from(table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            return stmt
 
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
+        # Build COUNT statement, reused for filters of the same shape
+        stmt, params = self._filtered_stmt(table, ('count',), filters, build_count)
 
         # Execute
-        with self._pool.connect() as conn:
-            result = conn.execute(stmt)
+        with self._pool.acquire() as conn:
+            result = conn.execute(stmt, params)
             return result.scalar()
 
     def update(
@@ -626,7 +1106,7 @@ class Table:
         if keys:
             # Filter keys to only include columns that exist in the table
             # This matches dataset behavior: non-existent keys are ignored
-            table_cols = {col.name for col in table.columns}
+            table_cols = table.c
             valid_keys = [k for k in keys if k in table_cols and k in row]
 
             filters = {k: row[k] for k in valid_keys}
@@ -636,17 +1116,24 @@ class Table:
             if not row:
                 return 0
 
-        where_clause = FilterBuilder.build(table, filters)
-
-        if where_clause is None:
+        if not filters:
             raise QueryError("UPDATE requires WHERE clause (filters or keys)")
 
-        # Build UPDATE statement
-        stmt = update(table).where(where_clause).values(**row)
+        # Build UPDATE statement, reused for the same columns and filter shape
+        value_names = {col_name: f"dbset_v{i}" for i, col_name in enumerate(row)}
+
+        def build_update(where_clause):
+            return update(table).where(where_clause).values(
+                {col_name: bindparam(name) for col_name, name in value_names.items()}
+            )
+
+        stmt, params = self._filtered_stmt(table, ('update', tuple(row)), filters, build_update)
+        for col_name, name in value_names.items():
+            params[name] = row[col_name]
 
         # Execute
         with self._pool.acquire() as conn:
-            result = conn.execute(stmt)
+            result = conn.execute(stmt, params)
             return result.rowcount
 
     def upsert(
@@ -692,26 +1179,28 @@ class Table:
             table = self._schema.get_table(
                 self._name,
                 ensure_exists=True,
-                pk_config=self._db._pk_config
+                pk_config=self._pk_config
             )
 
             # Infer types and ensure columns exist
-            inferred_types = TypeInference.infer_types_from_row(row, dialect=self._dialect)
-            if types:
-                inferred_types.update(types)
-            self._schema.ensure_columns(table, inferred_types)
+            missing_types = self._missing_types(table, [row], types)
+            if missing_types:
+                table = self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
             # Filter keys to only include columns that exist in the table (for index creation)
             # After ensure_columns, columns from row + original table columns all exist
-            table_cols = {col.name for col in table.columns} | set(row.keys())
-            index_keys = [k for k in keys if k in table_cols]
+            table_cols = table.c
+            index_keys = [k for k in keys if k in table_cols or k in row]
 
             # Auto-create index on valid keys for performance
             if index_keys:
-                self.create_index(index_keys)
+                self._ensure_index(index_keys)
 
-            # Clear cached table
-            self._table = None
+        # One round-trip when the database can return the affected row's key
+        handled, pk = self._upsert_returning(row, original_keys)
+        if handled:
+            return pk
 
         # Check if row exists using original keys (with .get() for missing keys)
         # This matches dataset behavior: non-existent keys cause query to fail/return None
@@ -730,6 +1219,76 @@ class Table:
             # Insert new
             return self.insert(row, ensure=ensure, types=types)
 
+    def _upsert_returning(self, row: dict[str, Any], keys: list[str]) -> tuple[bool, Any]:
+        """
+        Upsert row with a single statement that returns its primary key.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE ... RETURNING when the keys
+        have a unique index, otherwise UPDATE ... RETURNING followed by an
+        INSERT only if nothing was updated. Either way the SELECT that
+        upsert() would run first is skipped.
+
+        Args:
+            row: Dictionary of column_name -> value
+            keys: Key columns identifying the row
+
+        Returns:
+            Tuple of (handled, primary key). handled is False when the
+            database, table or row does not allow it (no RETURNING support,
+            no single-column primary key, unknown columns, no non-key values);
+            the caller then falls back to SELECT-then-write.
+        """
+        try:
+            table = self._get_table()
+        except TableNotFoundError:
+            return False, None
+
+        dialect = self._db._engine.dialect
+        pk_column = returning_column(table)
+        update_columns = [col_name for col_name in row if col_name not in keys]
+        if (
+            pk_column is None
+            or not keys
+            or not update_columns
+            or not all(k in row for k in keys)
+            or not set(row).issubset(table.c.keys())
+        ):
+            return False, None
+
+        # INSERT ... ON CONFLICT DO UPDATE ... RETURNING pk
+        cached_stmt = partial(self._cached_stmt, table)
+        native = dialect.insert_returning and prepare_upsert(
+            table, [row], keys, self._dialect, self._pk_config, cached_stmt
+        )
+        if native:
+            stmt, batch = native
+            stmt = cached_stmt(
+                ('upsert_returning', tuple(keys), tuple(batch[0])),
+                lambda: stmt.returning(pk_column),
+            )
+            with self._pool.acquire() as conn:
+                result = conn.execute(stmt, batch[0])
+                return True, result.scalar_one()
+
+        if not dialect.update_returning:
+            return False, None
+
+        # UPDATE ... RETURNING pk, INSERT if no row matched
+        where_clause = FilterBuilder.build(
+            table, {k: row[k] for k in keys}, columns=self._column_map(table)
+        )
+        stmt = (
+            update(table)
+            .where(where_clause)
+            .values({col_name: row[col_name] for col_name in update_columns})
+            .returning(pk_column)
+        )
+        with self._pool.acquire() as conn:
+            updated = conn.execute(stmt).scalars().first()
+        if updated is not None:
+            return True, updated
+        return True, self.insert(row, ensure=False)
+
     def upsert_many(
         self,
         rows: list[dict[str, Any]],
@@ -741,6 +1300,12 @@ class Table:
         """
         Upsert multiple rows (batch operation).
 
+        If the keys are covered by a unique index (or the primary key) and
+        all rows have the same columns, rows are written with one
+        INSERT ... ON CONFLICT DO UPDATE (ON DUPLICATE KEY UPDATE on MySQL)
+        per chunk. Otherwise each row goes through upsert(). Either way all
+        rows are written in one transaction.
+
         Args:
             rows: List of dictionaries (rows to upsert)
             keys: List of key columns to check for existing rows
@@ -773,30 +1338,46 @@ class Table:
             table = self._schema.get_table(
                 self._name,
                 ensure_exists=True,
-                pk_config=self._db._pk_config
+                pk_config=self._pk_config
             )
 
-            # Infer types from first row and ensure columns exist
-            inferred_types = TypeInference.infer_types_from_row(rows[0], dialect=self._dialect)
-            if types:
-                inferred_types.update(types)
-            self._schema.ensure_columns(table, inferred_types)
+            # Infer types (merged over all rows) and ensure columns exist
+            missing_types = self._missing_types(table, rows, types)
+            if missing_types:
+                table = self._schema.ensure_columns(table, missing_types)
+            self._table = table
 
             # Filter keys to only include columns that exist in the table (for index creation)
             # After ensure_columns, columns from row + original table columns all exist
-            table_cols = {col.name for col in table.columns} | set(rows[0].keys())
-            index_keys = [k for k in keys if k in table_cols]
+            table_cols = table.c
+            index_keys = [k for k in keys if k in table_cols or k in rows[0]]
 
             # Auto-create index on valid keys for performance (once for batch)
             if index_keys:
-                self.create_index(index_keys)
+                self._ensure_index(index_keys)
 
-            # Clear cached table
-            self._table = None
+        # Single INSERT ... ON CONFLICT per chunk when the keys have a
+        # unique index and the batch is uniform
+        try:
+            table = self._get_table()
+        except TableNotFoundError:
+            table = None
+        native = table is not None and prepare_upsert(
+            table, rows, keys, self._dialect, self._pk_config,
+            partial(self._cached_stmt, table),
+        )
+        if native:
+            stmt, batch = native
+            with self._pool.acquire() as conn:
+                for i in range(0, len(batch), chunk_size):
+                    conn.execute(stmt, batch[i:i + chunk_size])
+            return len(rows)
 
-        # Process each row (upsert handles non-existent keys gracefully)
-        for row in rows:
-            self.upsert(row, keys=keys, ensure=False, types=types)
+        # Process each row (upsert handles non-existent keys gracefully),
+        # all on one connection and in one transaction like the native path
+        with self._pool.transaction():
+            for row in rows:
+                self.upsert(row, keys=keys, ensure=False, types=types)
 
         return len(rows)
 
@@ -821,31 +1402,43 @@ class Table:
 
         table = self._get_table()
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
-
-        # Build DELETE statement
-        stmt = delete(table).where(where_clause)
+        # Build DELETE statement, reused for filters of the same shape
+        stmt, params = self._filtered_stmt(
+            table, ('delete',), filters, lambda where_clause: delete(table).where(where_clause)
+        )
 
         # Execute
         with self._pool.acquire() as conn:
-            result = conn.execute(stmt)
+            result = conn.execute(stmt, params)
             return result.rowcount
 
     def distinct(
         self,
         *columns: str,
+        _stream_size: int = 1000,
+        _auto_index: bool = False,
+        _as_dict: bool = True,
         **filters,
     ) -> Iterator[dict]:
         """
         Get distinct values for specified columns.
 
+        Results are streamed and fetched in batches of _stream_size rows.
+
         Args:
             *columns: Column names
+            _stream_size: Number of rows fetched per batch (default: 1000)
+            _auto_index: If True, create an index on the columns on first
+                         use, so the database can scan the index instead
+                         of the whole table; skipped in read-only mode
+                         (default: False)
+            _as_dict: If False, yield SQLAlchemy Row objects instead of
+                      dicts, skipping a dict allocation per row; Rows
+                      support row[0] and row.column access (default: True)
             **filters: Column filters
 
         Yields:
-            Distinct rows
+            Distinct rows (dicts, or Rows if _as_dict is False)
 
         Examples:
             >>> for row in table.distinct('status'):
@@ -854,23 +1447,42 @@ class Table:
         if not columns:
             raise QueryError("DISTINCT requires at least one column")
 
+        if _auto_index and not self._read_only:
+            self._ensure_index(list(columns))
+
         table = self._get_table()
 
-        # Build WHERE clause
-        where_clause = FilterBuilder.build(table, filters)
+        def build_select(where_clause):
+            selected_columns = [table.c[col] for col in columns]
+            stmt = select(*selected_columns).distinct()
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+            return stmt.execution_options(yield_per=_stream_size)
 
-        # Build SELECT DISTINCT statement
-        selected_columns = [table.c[col] for col in columns]
-        stmt = select(*selected_columns).distinct()
+        # Build SELECT DISTINCT statement (cached per filter shape)
+        stmt, params = self._filtered_stmt(
+            table, ('distinct', columns, _stream_size), filters, build_select
+        )
+
+        # Execute with server-side cursor (where supported) and yield rows
+        with self._pool.acquire() as conn:
+            result = conn.execute(stmt, params)
+            yield from iter_dicts(result) if _as_dict else result
 
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
+    def _ensure_index(self, columns: list[str]) -> None:
+        """
+        Create index once per table wrapper (upsert keys, distinct columns).
 
-        # Execute and yield rows
-        with self._pool.connect() as conn:
-            result = conn.execute(stmt)
-            for row in result:
-                yield dict(row._mapping)
+        create_index() is idempotent but reflects the schema to check for an
+        existing index, so repeated calls remember what they already did.
+
+        Args:
+            columns: Column names to index
+        """
+        signature = frozenset(columns)
+        if signature not in self._ensured_indexes:
+            self.create_index(columns)
+            self._ensured_indexes.add(signature)
 
     def create_index(
         self,
@@ -959,3 +1571,54 @@ class Table:
 
         table = self._get_table()
         return self._schema.index_exists(table, columns)
+
+
+class BulkInserter:
+    """
+    Batching handle returned by Database.bulk() and transaction(batch=True).
+
+    Rows are buffered per table and key set, since insert_many() takes its
+    columns from the first row: rows with different keys go to separate
+    multi-row INSERTs (and new keys become columns) instead of failing.
+
+    Examples:
+        >>> with db.bulk(chunk_size=500) as bulk:
+        ...     bulk.insert('users', {'name': 'John'})
+        ...     bulk.insert('users', {'name': 'Jane', 'age': 25})
+    """
+
+    __slots__ = ('_db', '_chunk_size', '_buffers', '_count')
+
+    def __init__(self, db: Database, chunk_size: int = 1000):
+        """Initialize bulk inserter."""
+        self._db = db
+        self._chunk_size = chunk_size
+        self._buffers: dict[tuple, list[dict[str, Any]]] = {}
+        self._count = 0
+
+    def insert(self, table_name: str, row: dict[str, Any]) -> None:
+        """Buffer row for insertion, writing its buffer when full."""
+        key = (table_name, tuple(row))
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(row)
+        if len(buffer) >= self._chunk_size:
+            self._flush_buffer(key)
+
+    def flush(self) -> int:
+        """Write all buffered rows, returning total rows written so far."""
+        for key in list(self._buffers):
+            self._flush_buffer(key)
+        return self._count
+
+    def _flush_buffer(self, key: tuple) -> None:
+        """Write buffered rows of one table and key set with insert_many()."""
+        rows = self._buffers.pop(key, None)
+        if rows:
+            self._count += self._db[key[0]].insert_many(
+                rows, chunk_size=self._chunk_size
+            )
+
+    @property
+    def count(self) -> int:
+        """Number of rows written so far."""
+        return self._count
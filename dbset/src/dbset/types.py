@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable
 from uuid import uuid4
 
@@ -25,6 +26,60 @@ from sqlalchemy.types import TypeEngine
 from .exceptions import TypeInferenceError
 
 
+def _infer_decimal(value: Decimal, dialect: str | None) -> TypeEngine:
+    """Numeric with precision/scale from value, Float for Infinity/NaN."""
+    precision, scale = TypeInference._calculate_decimal_precision(value)
+    if precision is None:  # Infinity/NaN
+        return Float()
+    return Numeric(precision=precision, scale=scale)
+
+
+def _infer_json(value: Any, dialect: str | None) -> TypeEngine:
+    """JSONB for PostgreSQL, JSON for others."""
+    if dialect == 'postgresql':
+        return JSONB()
+    return JSON()
+
+
+# Python type -> handler(value, dialect) returning SQLAlchemy type
+_TYPE_HANDLERS: dict[type, Callable[[Any, str | None], TypeEngine]] = {
+    # None values default to Text (nullable)
+    type(None): lambda value, dialect: Text(),
+    bool: lambda value, dialect: Boolean(),
+    int: lambda value, dialect: Integer(),
+    Decimal: _infer_decimal,
+    float: lambda value, dialect: Float(),
+    datetime: lambda value, dialect: DateTime(),
+    date: lambda value, dialect: Date(),
+    # String types - always use Text for maximum flexibility
+    str: lambda value, dialect: Text(),
+    # Bytes - store as Text (can be enhanced later for binary types)
+    bytes: lambda value, dialect: Text(),
+    dict: _infer_json,
+    list: _infer_json,
+}
+
+
+def _resolve_handler(value_type: type) -> Callable[[Any, str | None], TypeEngine]:
+    """
+    Find handler for a subclass of a supported type by walking its MRO.
+
+    The result is cached in _TYPE_HANDLERS so each subclass is resolved once.
+
+    Raises:
+        TypeInferenceError: If no base class is supported
+    """
+    for base in value_type.__mro__:
+        handler = _TYPE_HANDLERS.get(base)
+        if handler is not None:
+            _TYPE_HANDLERS[value_type] = handler
+            return handler
+
+    raise TypeInferenceError(
+        f"Cannot infer SQLAlchemy type for Python type: {value_type.__name__}"
+    )
+
+
 class TypeInference:
     """
     Infers SQLAlchemy column types from Python values.
@@ -68,52 +123,13 @@ class TypeInference:
             >>> TypeInference.infer_type([1, 2, 3], dialect='sqlite')
             JSON()
         """
-        # None values default to Text (nullable)
-        if value is None:
-            return Text()
-
-        # Boolean must be checked before int (bool is subclass of int in Python)
-        if isinstance(value, bool):
-            return Boolean()
-
-        # Numeric types
-        if isinstance(value, int):
-            return Integer()
-
-        if isinstance(value, Decimal):
-            precision, scale = TypeInference._calculate_decimal_precision(value)
-            if precision is None:  # Infinity/NaN
-                return Float()
-            return Numeric(precision=precision, scale=scale)
-
-        if isinstance(value, float):
-            return Float()
-
-        # Date/time types
-        if isinstance(value, datetime):
-            return DateTime()
-
-        if isinstance(value, date):
-            return Date()
-
-        # String types - always use Text for maximum flexibility
-        if isinstance(value, str):
-            return Text()
-
-        # Bytes - store as Text (can be enhanced later for binary types)
-        if isinstance(value, bytes):
-            return Text()
-
-        # JSON types (dict, list) - use JSONB for PostgreSQL, JSON for others
-        if isinstance(value, (dict, list)):
-            if dialect == 'postgresql':
-                return JSONB()
-            return JSON()
-
-        # Unknown type
-        raise TypeInferenceError(
-            f"Cannot infer SQLAlchemy type for Python type: {type(value).__name__}"
-        )
+        # Exact type hit first, then walk the MRO for subclasses
+        # (bool/datetime resolve before int/date since they come first)
+        value_type = type(value)
+        handler = _TYPE_HANDLERS.get(value_type)
+        if handler is None:
+            handler = _resolve_handler(value_type)
+        return handler(value, dialect)
 
     @staticmethod
     def _calculate_decimal_precision(value: Decimal) -> tuple[int | None, int | None]:
@@ -196,6 +212,54 @@ class TypeInference:
             )
         return types
 
+    @staticmethod
+    def infer_types_from_rows(
+        rows: list[dict[str, Any]],
+        dialect: str | None = None,
+    ) -> dict[str, TypeEngine]:
+        """
+        Infer types for all columns in several rows, merging types per column.
+
+        None values are skipped, so a column that is NULL in the first row
+        gets the type of later values (Text only if it is NULL everywhere).
+        Each Python type is inferred once per column, except Decimal whose
+        precision depends on the value.
+
+        Args:
+            rows: List of dictionaries (column_name -> value)
+            dialect: Database dialect name (e.g., 'postgresql', 'sqlite')
+
+        Returns:
+            Dictionary of column_name -> SQLAlchemy type (see merge_types)
+
+        Examples:
+            >>> TypeInference.infer_types_from_rows([
+            ...     {'name': 'John', 'score': None},
+            ...     {'name': 'Jane', 'score': 1},
+            ...     {'name': 'Bob', 'score': 2.5},
+            ... ])
+            {'name': Text(), 'score': Float()}
+        """
+        types: dict[str, TypeEngine] = {}
+        seen: dict[str, set[type]] = {}
+        for row in rows:
+            for column_name, value in row.items():
+                column_seen = seen.setdefault(column_name, set())
+                value_type = type(value)
+                if value is None or (value_type in column_seen and value_type is not Decimal):
+                    continue
+                column_seen.add(value_type)
+
+                value_sql_type = TypeInference.infer_type(value, dialect=dialect)
+                current = types.get(column_name)
+                types[column_name] = (
+                    value_sql_type if current is None
+                    else TypeInference.merge_types(current, value_sql_type)
+                )
+
+        # Columns that are NULL in every row default to Text
+        return {column_name: types.get(column_name, Text()) for column_name in seen}
+
     @staticmethod
     def merge_types(type1: TypeEngine, type2: TypeEngine) -> TypeEngine:
         """
@@ -343,6 +407,8 @@ class PrimaryKeyConfig:
         ... )
     """
 
+    __slots__ = ('pk_type', 'column_name', 'generator', 'sqlalchemy_type', 'autoincrement')
+
     def __init__(
         self,
         pk_type: PrimaryKeyType | str = PrimaryKeyType.INTEGER,
@@ -429,3 +495,36 @@ class PrimaryKeyConfig:
         if self.generator:
             return self.generator()
         return None  # Integer uses DB autoincrement
+
+
+def default_pk_config(
+    pk_type: PrimaryKeyType | str = PrimaryKeyType.INTEGER,
+    column_name: str = 'id',
+) -> PrimaryKeyConfig:
+    """
+    Get shared PrimaryKeyConfig for a built-in key type and column name.
+
+    Configs without a custom generator are never modified after creation,
+    so connections using the same settings share one instance instead of
+    building a new config each time.
+
+    Args:
+        pk_type: Type of primary key (INTEGER or UUID)
+        column_name: Name of primary key column (default: 'id')
+
+    Returns:
+        Shared PrimaryKeyConfig instance
+
+    Examples:
+        >>> default_pk_config() is default_pk_config('integer', 'id')
+        True
+    """
+    if isinstance(pk_type, str):
+        pk_type = PrimaryKeyType(pk_type.lower())
+    return _shared_pk_config(pk_type, column_name)
+
+
+@lru_cache(maxsize=None)
+def _shared_pk_config(pk_type: PrimaryKeyType, column_name: str) -> PrimaryKeyConfig:
+    """Build and cache PrimaryKeyConfig, keyed by normalized arguments."""
+    return PrimaryKeyConfig(pk_type=pk_type, column_name=column_name)
@@ -0,0 +1,197 @@
+"""Native upsert - INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE builders."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from sqlalchemy import Table, UniqueConstraint
+
+
+def has_unique_key(table: Table, keys: list[str]) -> bool:
+    """
+    Check if keys are covered exactly by the primary key or a unique index.
+
+    ON CONFLICT needs a unique index or constraint on the conflict columns.
+    A plain index, like the one upsert() creates automatically, is not
+    enough.
+
+    Args:
+        table: SQLAlchemy Table object (reflected, with indexes)
+        keys: Key column names
+
+    Returns:
+        True if a unique index, unique constraint or primary key has
+        exactly these columns
+
+    Examples:
+        >>> await table.create_index(['email'], unique=True)
+        >>> has_unique_key(await table.table, ['email'])
+        True
+    """
+    key_set = set(keys)
+    if {col.name for col in table.primary_key.columns} == key_set:
+        return True
+
+    for index in table.indexes:
+        if index.unique and {col.name for col in index.columns} == key_set:
+            return True
+
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            if {col.name for col in constraint.columns} == key_set:
+                return True
+
+    return False
+
+
+def build_upsert(
+    table: Table,
+    keys: list[str],
+    columns: tuple[str, ...],
+    dialect: str,
+) -> Any | None:
+    """
+    Build dialect-native upsert statement for rows with the given columns.
+
+    Non-key columns are overwritten with the inserted values on conflict;
+    if there are none, conflicting rows are left unchanged.
+
+    Args:
+        table: SQLAlchemy Table object
+        keys: Conflict (key) column names
+        columns: Column names present in every row
+        dialect: Database dialect name
+
+    Returns:
+        INSERT statement to execute with a list of row dicts, or None if
+        the dialect has no native upsert
+
+    Examples:
+        >>> stmt = build_upsert(table, ['email'], ('email', 'name'), 'postgresql')
+        >>> await conn.execute(stmt, rows)
+    """
+    update_columns = [col_name for col_name in columns if col_name not in keys]
+
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(table)
+        if not update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=keys)
+        return stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={col_name: stmt.excluded[col_name] for col_name in update_columns},
+        )
+
+    if dialect in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(table)
+        # Key-only rows get a no-op update of the keys: INSERT IGNORE would
+        # also turn truncation, NOT NULL and foreign key errors into warnings
+        return stmt.on_duplicate_key_update(
+            {col_name: stmt.inserted[col_name] for col_name in update_columns or keys}
+        )
+
+    return None
+
+
+def dedupe_rows(rows: list[dict[str, Any]], keys: list[str]) -> list[dict[str, Any]]:
+    """
+    Keep only the last row for each key, as sequential upserts would.
+
+    A single INSERT ... ON CONFLICT statement cannot touch the same row
+    twice (PostgreSQL rejects it), so duplicates are merged up front.
+
+    Args:
+        rows: List of dictionaries
+        keys: Key column names
+
+    Returns:
+        Rows with unique keys, in order of first appearance
+    """
+    by_key = {}
+    for row in rows:
+        by_key[tuple(row[k] for k in keys)] = row
+    return list(by_key.values())
+
+
+def prepare_upsert(
+    table: Table,
+    rows: list[dict[str, Any]],
+    keys: list[str],
+    dialect: str,
+    pk_config: Any = None,
+    cached_stmt: Callable[[Any, Callable[[], Any]], Any] | None = None,
+) -> tuple[Any, list[dict[str, Any]]] | None:
+    """
+    Prepare native upsert for a batch, if the batch and table allow it.
+
+    Requirements: the dialect supports it, the keys have a unique index
+    (see has_unique_key), every row has the same columns including all
+    keys, and no key value is NULL (NULLs never conflict, whereas
+    upsert() matches them with IS NULL).
+
+    Args:
+        table: SQLAlchemy Table object
+        rows: List of dictionaries (rows to upsert)
+        keys: Key column names
+        dialect: Database dialect name
+        pk_config: PrimaryKeyConfig used to generate UUID/custom keys
+        cached_stmt: Optional (key, build) -> statement cache, so the
+                     statement is built once per key/column set
+
+    Returns:
+        Tuple of (statement, rows to execute it with), or None to fall
+        back to row-by-row upsert()
+    """
+    columns = tuple(rows[0])
+    first_keys = rows[0].keys()
+    if not keys or not set(keys).issubset(first_keys) or not set(columns).issubset(table.c.keys()):
+        return None
+    if any(row.keys() != first_keys for row in rows):
+        return None
+    if any(row[k] is None for row in rows for k in keys):
+        return None
+    if not has_unique_key(table, keys):
+        return None
+
+    if cached_stmt is None:
+        stmt = build_upsert(table, keys, columns, dialect)
+    else:
+        stmt = cached_stmt(
+            ('upsert', tuple(keys), columns),
+            lambda: build_upsert(table, keys, columns, dialect),
+        )
+    if stmt is None:
+        return None
+
+    try:
+        rows = dedupe_rows(rows, keys)
+    except TypeError:
+        return None  # Unhashable key values
+
+    # Generate primary keys for rows that end up inserted (UUID/CUSTOM);
+    # the key column is not part of the UPDATE, so existing rows keep theirs
+    if pk_config is not None and pk_config.generator and pk_config.column_name not in columns:
+        pk_col = pk_config.column_name
+        rows = [{**row, pk_col: pk_config.generate_value()} for row in rows]
+
+    return stmt, rows
+
+
+def returning_column(table: Table) -> Any | None:
+    """
+    Get the single primary key column to return from upserts.
+
+    Args:
+        table: SQLAlchemy Table object
+
+    Returns:
+        Primary key Column, or None for tables without a single-column
+        primary key
+    """
+    pk_columns = list(table.primary_key.columns)
+    return pk_columns[0] if len(pk_columns) == 1 else None
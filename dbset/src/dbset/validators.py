@@ -1,6 +1,8 @@
 """SQL validation for read-only mode - integrates with TriggerAI sql_validator."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 from dbset.sql_validator import (
     SQLValidationError,
     extract_table_names,
@@ -10,6 +12,19 @@ from dbset.sql_validator import (
 
 from .exceptions import ReadOnlyError, ValidationError
 
+# Number of distinct SQL strings whose read-only verdict is remembered
+VALIDATION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _readonly_violation(sql: str) -> str | None:
+    """Get reason the SQL is not read-only, or None (cached per string)."""
+    try:
+        validate_readonly(sql)
+    except SQLValidationError as e:
+        return str(e)
+    return None
+
 
 class ReadOnlyValidator:
     """
@@ -24,6 +39,9 @@ class ReadOnlyValidator:
         """
         Validate that SQL query is read-only (SELECT only).
 
+        The verdict is cached per SQL string, so applications that run the
+        same queries repeatedly only scan each one once.
+
         Args:
             sql: SQL query to validate
 
@@ -37,10 +55,9 @@ class ReadOnlyValidator:
             >>> ReadOnlyValidator.validate_sql("DELETE FROM users")
             ReadOnlyError: Forbidden keyword detected: DELETE
         """
-        try:
-            validate_readonly(sql)
-        except SQLValidationError as e:
-            raise ReadOnlyError(str(e))
+        violation = _readonly_violation(sql)
+        if violation is not None:
+            raise ReadOnlyError(violation)
 
     @staticmethod
     def validate_operation(operation: str) -> None:
@@ -30,6 +30,29 @@ async def test_table_access():
     await db.close()
 
 
+async def test_table_access_cached():
+    """Test repeated table access returns the same wrapper."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    assert db['users'] is db['users']
+    assert not hasattr(db['users'], '__dict__')
+    await db.close()
+
+
+async def test_table_preloaded_from_reflection(tmp_path):
+    """Test tables reflected at connect time need no reflection on access."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    db = await async_connect(url)
+    await db['users'].insert({'name': 'John'})
+    await db.close()
+
+    db = await async_connect(url)
+    users = db['users']
+    assert users._table is not None
+    assert (await users.table) is users._table
+    assert db['orders']._table is None
+    await db.close()
+
+
 async def test_insert_and_find():
     """Test basic insert and find operations."""
     db = await async_connect('sqlite+aiosqlite:///:memory:')
@@ -453,6 +476,363 @@ async def test_insert_many():
     await db.close()
 
 
+async def test_insert_many_use_copy_falls_back():
+    """Test COPY fast-path falls back to INSERT on non-PostgreSQL databases."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+
+    rows = [{'name': f'User{i}', 'age': i} for i in range(250)]
+
+    count = await users.insert_many(rows, use_copy=True)
+    assert count == 250
+    assert await users.count() == 250
+
+    await db.close()
+
+
+async def test_upsert_skips_select(monkeypatch):
+    """Test upsert() writes with RETURNING instead of SELECT-then-write."""
+    from dbset import AsyncTable
+
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    pk = await users.insert({'email': 'a@example.com', 'age': 1})
+
+    async def fail(*args, **kwargs):
+        raise AssertionError('SELECT issued')
+
+    monkeypatch.setattr(AsyncTable, 'find_one', fail)
+    assert await users.upsert({'email': 'a@example.com', 'age': 2}, keys=['email']) == pk
+    assert await users.upsert({'email': 'b@example.com', 'age': 3}, keys=['email']) != pk
+    monkeypatch.undo()
+
+    assert await users.count() == 2
+    assert (await users.find_one(email='a@example.com'))['age'] == 2
+
+    await db.close()
+
+
+async def test_upsert_many_native(monkeypatch):
+    """Test upsert_many uses ON CONFLICT when keys have a unique index."""
+    from dbset import AsyncTable
+
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    await users.insert_many([{'email': f'u{i}@example.com', 'age': i} for i in range(3)])
+    await users.create_index(['email'], unique=True)
+
+    async def fail(*args, **kwargs):
+        raise AssertionError('row-by-row upsert used')
+
+    monkeypatch.setattr(AsyncTable, 'upsert', fail)
+
+    rows = [
+        {'email': 'u1@example.com', 'age': 10},
+        {'email': 'new@example.com', 'age': 20},
+    ]
+    assert await users.upsert_many(rows, keys=['email']) == 2
+    assert await users.count() == 4
+    assert (await users.find_one(email='u1@example.com'))['age'] == 10
+
+    await db.close()
+
+
+async def test_query_streams_raw_sql():
+    """Test query() streams raw SQL results in batches."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    await db['users'].insert_many([{'name': f'User{i}', 'age': i} for i in range(2500)])
+
+    ages = [row['age'] async for row in db.query("SELECT age FROM users WHERE age >= :age", age=10)]
+    assert len(ages) == 2490
+
+    await db.close()
+
+
+async def test_query_update_returning_not_streamed():
+    """Test query() streams only SELECTs, and not with _stream=False."""
+    from sqlalchemy import event, update
+
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    await db['users'].insert_many([{'name': f'User{i}', 'age': i} for i in range(3)])
+    streamed = []
+    event.listen(
+        db.engine.sync_engine, 'before_execute',
+        lambda conn, stmt, multiparams, params, options: streamed.append('yield_per' in options),
+    )
+
+    table = await db['users'].table
+    stmt = update(table).where(table.c.age >= 1).values(age=table.c.age + 10).returning(table.c.age)
+    assert sorted([row['age'] async for row in db.query(stmt)]) == [11, 12]
+    assert await db['users'].count(age=11) == 1
+
+    rows = [row async for row in db.query("SELECT name FROM users WHERE age = :age", _stream=False, age=0)]
+    assert rows == [{'name': 'User0'}]
+    rows = [row async for row in db.query("UPDATE users SET age = 20 WHERE age = :age RETURNING age", age=0)]
+    assert rows == [{'age': 20}]
+    assert [row async for row in db.query("  select count(*) AS n FROM users")] == [{'n': 3}]
+    assert streamed == [False, False, False, False, True]
+
+    await db.close()
+
+
+async def test_counts():
+    """Test counting several tables in one query."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    await db['users'].insert_many([{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 17}])
+    await db['orders'].insert({'total': 10})
+
+    counts = await db.counts('orders', ('users', {'age': {'<': 18}}))
+    assert counts == {'orders': 1, 'users': 1}
+
+    await db.close()
+
+
+async def test_execute_many():
+    """Test executing one statement for many parameter sets."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    await users.insert_many([{'name': 'John', 'score': 0}, {'name': 'Jane', 'score': 0}])
+
+    count = await db.execute_many(
+        "UPDATE users SET score = :score WHERE name = :name",
+        [{'name': 'John', 'score': 10}, {'name': 'Jane', 'score': 20}],
+    )
+    assert count == 2
+    assert (await users.find_one(name='John'))['score'] == 10
+
+    await db.close()
+
+
+async def test_bulk_inserter():
+    """Test buffered bulk inserts flush per chunk and on exit."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+
+    async with db.bulk(chunk_size=10) as bulk:
+        for i in range(25):
+            await bulk.insert('users', {'name': f'User{i}', 'age': i})
+        await bulk.insert('orders', {'total': 100})
+        # Two full chunks of users written, remainder still buffered
+        assert bulk.count == 20
+
+    assert bulk.count == 26
+    assert await db['users'].count() == 25
+    assert await db['orders'].count() == 1
+
+    # Pending rows are discarded when the block raises
+    with pytest.raises(RuntimeError):
+        async with db.bulk(chunk_size=10) as bulk:
+            await bulk.insert('users', {'name': 'Lost'})
+            raise RuntimeError('boom')
+
+    assert await db['users'].count() == 25
+
+    await db.close()
+
+
+async def test_gather_queries():
+    """Test running several queries in one call."""
+    from sqlalchemy import select
+
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    await users.insert_many([{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 25}])
+    table = await users.table
+
+    by_age, named = await db.gather_queries([
+        select(table).where(table.c.age > 26),
+        "SELECT name FROM users ORDER BY name",
+    ])
+    assert [r['name'] for r in by_age] == ['John']
+    assert named == [{'name': 'Jane'}, {'name': 'John'}]
+
+    await db.close()
+
+
+async def test_gather_queries_read_only():
+    """Test gather_queries() validates raw SQL in read-only mode."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:', read_only=True)
+
+    with pytest.raises(ReadOnlyError):
+        await db.gather_queries(["SELECT 1", "DELETE FROM users"])
+
+    await db.close()
+
+
+async def test_bulk_inserter_mixed_keys():
+    """Test buffered rows with different keys are all written."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:', force_new=True)
+
+    async with db.bulk() as bulk:
+        await bulk.insert('v', {'a': 1})
+        await bulk.insert('v', {'b': 2})
+        await bulk.insert('v', {'a': 3, 'b': 4})
+
+    assert bulk.count == 3
+    assert await db['v'].count(a=3, b=4) == 1
+    assert await db['v'].count(b=2) == 1
+
+    await db.close()
+
+
+async def test_transaction(tmp_path):
+    """Test table operations inside transaction() share its connection."""
+    db = await async_connect(f'sqlite+aiosqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+    await users.insert({'name': 'John'})
+
+    async with db.transaction() as conn:
+        await users.insert({'name': 'Jane', 'age': 25})
+        assert db._pool.current is conn
+        assert await users.count() == 2
+    assert db._pool.current is None
+    assert (await users.find_one(name='Jane'))['age'] == 25
+
+    with pytest.raises(Exception):
+        async with db.transaction():
+            await users.insert({'name': 'Bob'})
+            raise ValueError('rollback')
+    assert await users.count() == 2
+
+    await db.close()
+
+
+async def test_transaction_batch_mixed_keys(tmp_path):
+    """Test transaction(batch=True) writes rows with different keys."""
+    db = await async_connect(f'sqlite+aiosqlite:///{tmp_path}/test.db', force_new=True)
+
+    async with db.transaction(batch=True) as tx:
+        await tx.insert('v', {'a': 1})
+        await tx.insert('v', {'b': 2})
+        await tx.insert('v', {'a': 3, 'b': 4})
+
+    assert await db['v'].count() == 3
+    assert await db['v'].count(a=3, b=4) == 1
+
+    await db.close()
+
+
+async def test_transaction_batch(tmp_path):
+    """Test transaction(batch=True) buffers inserts and writes them on commit."""
+    db = await async_connect(f'sqlite+aiosqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+
+    async with db.transaction(batch=True, chunk_size=2) as tx:
+        for i in range(3):
+            await tx.insert('users', {'name': f'user{i}'})
+        assert tx.count == 2  # First chunk written, last row buffered
+    assert await users.count() == 3
+
+    with pytest.raises(Exception):
+        async with db.transaction(batch=True, chunk_size=2) as tx:
+            for i in range(3):
+                await tx.insert('users', {'name': f'other{i}'})
+            raise ValueError('rollback')
+    assert await users.count() == 3
+
+    await db.close()
+
+
+async def test_async_connect_shares_engine(tmp_path):
+    """Test repeated async_connect() calls reuse one database and pool."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}"
+    db = await async_connect(url)
+    assert await async_connect(url) is db
+    assert await async_connect(url, read_only=True) is not db
+    assert await async_connect(url, force_new=True) is not db
+
+    # In-memory databases are never shared
+    memory = await async_connect('sqlite+aiosqlite:///:memory:')
+    assert await async_connect('sqlite+aiosqlite:///:memory:') is not memory
+
+    await db['t'].insert({'a': 1})
+    await db.close()
+
+    # A closed database is not handed out again
+    (tmp_path / 'shared.db').unlink()
+    db2 = await async_connect(url)
+    assert db2 is not db
+    await db2['t'].insert({'a': 1})
+    assert await db2['t'].count() == 1
+    await db2.close()
+
+
+async def test_async_pool_defaults(monkeypatch):
+    """Test AsyncDatabase.connect() builds the pool from ASYNC_POOL_DEFAULTS."""
+    from dbset import AsyncDatabase, async_core
+    from dbset.connection import ASYNC_POOL_DEFAULTS
+
+    captured = {}
+
+    def fake_engine(url, **kwargs):
+        captured.update(kwargs)
+        raise RuntimeError('stop')
+
+    monkeypatch.setattr(async_core, 'create_async_engine', fake_engine)
+
+    with pytest.raises(RuntimeError):
+        await AsyncDatabase.connect('postgresql+asyncpg://localhost/mydb')
+    for key, value in ASYNC_POOL_DEFAULTS.items():
+        assert captured[key] == value
+
+
+async def test_async_connect_pool_defaults(monkeypatch):
+    """Test async_connect() fills in pool defaults and asyncpg connect_args."""
+    from dbset import AsyncDatabase
+
+    captured = {}
+
+    async def fake_connect(**kwargs):
+        captured.update(kwargs)
+
+    monkeypatch.setattr(AsyncDatabase, 'connect', fake_connect)
+
+    await async_connect('postgresql+asyncpg://localhost/mydb')
+    assert 'pool_size' not in captured  # AsyncDatabase.connect() defaults apply
+    assert captured['connect_args']['statement_cache_size'] == 1024
+    assert captured['connect_args']['prepared_statement_cache_size'] == 256
+
+    # User-supplied values win and are merged with the defaults
+    captured.clear()
+    await async_connect(
+        'postgresql+asyncpg://localhost/mydb',
+        pool_size=3,
+        connect_args={'statement_cache_size': 0},
+    )
+    assert captured['pool_size'] == 3
+    assert captured['connect_args']['statement_cache_size'] == 0
+    assert captured['connect_args']['command_timeout'] == 60
+
+    # connect_args are asyncpg-specific
+    captured.clear()
+    await async_connect('sqlite+aiosqlite:///:memory:')
+    assert 'connect_args' not in captured
+
+
+async def test_find_streams_in_batches():
+    """Test find() returns all rows when streaming in small batches."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+
+    await users.insert_many([{'name': f'User{i}', 'age': i} for i in range(25)])
+
+    results = [row async for row in users.find(_stream_size=10, _order_by='age')]
+    assert len(results) == 25
+    assert [row['age'] for row in results] == list(range(25))
+
+    await db.close()
+
+
+async def test_async_connect_without_uvloop(monkeypatch):
+    """Test async_connect() works when uvloop is not installed."""
+    import sys
+
+    monkeypatch.setitem(sys.modules, 'uvloop', None)  # Makes import fail
+
+    db = await async_connect('sqlite+aiosqlite:///:memory:', install_uvloop=True)
+    assert db is not None
+    await db.close()
+
+
 async def test_order_by():
     """Test ordering results."""
     db = await async_connect('sqlite+aiosqlite:///:memory:')
@@ -524,6 +904,35 @@ async def test_distinct():
     await db.close()
 
 
+async def test_distinct_streams_in_batches():
+    """Test distinct values are complete when fetched in small batches."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    items = db['items']
+
+    await items.insert_many([{'group': i % 5} for i in range(20)])
+
+    groups = [row['group'] async for row in items.distinct('group', _stream_size=2)]
+
+    assert sorted(groups) == [0, 1, 2, 3, 4]
+
+    await db.close()
+
+
+async def test_distinct_as_rows():
+    """Test distinct(_as_dict=False) yields Row objects."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    items = db['items']
+
+    await items.insert_many([{'group': i % 2} for i in range(4)])
+
+    rows = [row async for row in items.distinct('group', _as_dict=False)]
+
+    assert sorted(row.group for row in rows) == [0, 1]
+    assert sorted(row[0] for row in rows) == [0, 1]
+
+    await db.close()
+
+
 async def test_insert_with_decimal_values():
     """Test Decimal round-trip - insert and retrieve with precision preserved."""
     db = await async_connect('sqlite+aiosqlite:///:memory:')
@@ -614,3 +1023,175 @@ async def test_decimal_query_filtering():
     assert cheap['name'] == 'Cheap'
 
     await db.close()
+
+
+async def test_concurrent_reflect_runs_once(tmp_path, monkeypatch):
+    """Test concurrent reflect() calls share one reflection of the schema."""
+    import asyncio
+
+    db = await async_connect(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await db['users'].insert({'name': 'John'})
+    db._schema.invalidate()
+
+    calls = []
+    clear = db._schema._metadata.clear
+    monkeypatch.setattr(db._schema._metadata, 'clear', lambda: calls.append(1) or clear())
+    await asyncio.gather(*(db._schema.reflect() for _ in range(10)))
+
+    assert calls == [1]
+    assert db._schema.reflected_table('users') is not None
+
+    await db.close()
+
+
+async def test_reflect_tables_in_parallel(tmp_path):
+    """Test file-based SQLite schema is reflected table by table, concurrently."""
+    from sqlalchemy import text
+
+    db = await async_connect(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    assert db._schema._reflect_concurrency() > 1
+    async with db._pool.transaction() as conn:
+        await conn.execute(text('CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT)'))
+        await conn.execute(text(
+            'CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, '
+            'author_id INTEGER REFERENCES authors (id))'
+        ))
+        await conn.execute(text('CREATE INDEX ix_books_title ON books (title)'))
+        assert db._schema._reflect_concurrency() == 1  # inside a transaction
+    db._schema.invalidate()
+    await db._schema.reflect()
+
+    books = db._schema.reflected_table('books')
+    assert [c.name for c in books.columns] == ['id', 'title', 'author_id']
+    assert [i.name for i in books.indexes] == ['ix_books_title']
+    fk = next(iter(books.foreign_keys))
+    assert fk.column is db._schema.reflected_table('authors').c.id
+
+    await db.close()
+
+
+async def test_cached_find_sees_new_columns():
+    """Test statements reused per filter shape pick up columns added later."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    await users.insert({'name': 'John'})
+    assert await users.find_one(name='John') == {'id': 1, 'name': 'John'}
+
+    await users.insert({'name': 'Jane', 'city': 'Paris'})
+    assert await users.find_one(name='John') == {'id': 1, 'name': 'John', 'city': None}
+    assert (await users.find_one(name='Jane'))['city'] == 'Paris'
+
+    await db.close()
+
+
+async def test_find_as_rows():
+    """Test find(_as_dict=False) yields Row objects."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:')
+    users = db['users']
+    await users.insert_many([{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 25}])
+
+    rows = [row async for row in users.find(_order_by='age', _as_dict=False)]
+
+    assert [row.name for row in rows] == ['Jane', 'John']
+    assert rows[0]._mapping['age'] == 25
+
+    await db.close()
+
+
+async def test_transaction_rollback_forgets_new_table(tmp_path):
+    """Test tables and columns created in a rolled back transaction are forgotten."""
+    db = await async_connect(f'sqlite+aiosqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+    await users.insert({'name': 'John'})
+
+    with pytest.raises(ValueError):
+        async with db.transaction():
+            await db['fresh'].insert({'name': 'Jane'})
+            await users.insert({'name': 'Bob', 'age': 30})
+            raise ValueError('rollback')
+
+    await db['fresh'].insert({'name': 'Jane'})
+    assert await db['fresh'].count() == 1
+    await users.insert({'name': 'Bob', 'age': 30})
+    assert (await users.find_one(name='Bob'))['age'] == 30
+
+    await db.close()
+
+
+async def test_find_one_order_and_offset():
+    """Test find_one() applies _order_by and _offset."""
+    db = await async_connect('sqlite+aiosqlite:///:memory:', force_new=True)
+    users = db['users']
+    await users.insert_many([
+        {'name': 'John', 'age': 30},
+        {'name': 'Jane', 'age': 25},
+        {'name': 'Bob', 'age': 35},
+    ])
+
+    assert (await users.find_one(_order_by='-age'))['name'] == 'Bob'
+    assert (await users.find_one(_order_by='age', _offset=1))['name'] == 'John'
+    assert (await users.find_one(_order_by='age', age={'>': 25}))['name'] == 'John'
+
+    await db.close()
+
+
+async def test_table_created_externally_after_miss(tmp_path):
+    """Test a table missing once is found after it is created elsewhere."""
+    from sqlalchemy import text
+    from dbset import TableNotFoundError
+
+    db = await async_connect(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await db['seed'].insert({'a': 1})
+    with pytest.raises(TableNotFoundError):
+        await db['x'].insert({'a': 'q'}, ensure=False)
+
+    async with db._pool.transaction() as conn:
+        await conn.execute(text('CREATE TABLE x (id INTEGER PRIMARY KEY, a TEXT)'))
+        await conn.execute(text("INSERT INTO x (a) VALUES ('e')"))
+        await conn.execute(text('CREATE TABLE y (id INTEGER PRIMARY KEY, b TEXT)'))
+
+    await db['x'].insert({'a': 'w'})
+    assert [row['a'] async for row in db['x'].all()] == ['e', 'w']
+
+    # CREATE TABLE IF NOT EXISTS is a no-op here - columns come from the database
+    table = await db._schema.create_table('y')
+    assert 'b' in table.c
+
+    await db.close()
+
+
+async def test_two_databases_add_columns(tmp_path):
+    """Test columns added by another Database are picked up on write and filter."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    db_a = await async_connect(url, force_new=True)
+    db_b = await async_connect(url, force_new=True)
+    await db_a['t'].insert({'x': 1})
+    await db_b['t'].insert({'x': 1})
+
+    await db_a['t'].insert({'x': 2, 'y': 5})
+    assert await db_b['t'].insert({'x': 3, 'y': 6}) == 4
+    assert [row['x'] async for row in db_b['t'].find(y=5)] == [2]
+
+    await db_a['t'].insert({'x': 4, 'z': 7})
+    assert await db_b['t'].count(z=7) == 1
+
+    await db_a.close()
+    await db_b.close()
+
+
+async def test_invalidate_reloads_schema(tmp_path):
+    """Test db.invalidate() picks up DDL made outside the Database."""
+    from sqlalchemy import text
+
+    db = await async_connect(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    users = db['users']
+    await users.insert({'name': 'John'})
+
+    async with db._pool.transaction() as conn:
+        await conn.execute(text('ALTER TABLE users ADD COLUMN city TEXT'))
+    assert 'city' not in (await users.table).c
+
+    db.invalidate()
+    assert 'city' in (await users.table).c
+
+    await db.close()
@@ -4,7 +4,7 @@ import pytest
 from sqlalchemy import Column, Integer, MetaData, String, Table
 
 from dbset.exceptions import QueryError
-from dbset.query import FilterBuilder
+from dbset.query import FilterBuilder, text_clause
 
 
 # Helper to create test table
@@ -232,3 +232,65 @@ def test_parse_order_by_unknown_column():
     table = create_test_table()
     with pytest.raises(QueryError, match="not found"):
         FilterBuilder.parse_order_by(table, 'unknown_column')
+
+
+def test_filter_shape():
+    """Test filters differing only in values share a shape."""
+    assert FilterBuilder.shape({'age': {'>=': 18}, 'name': 'John'}) == \
+        FilterBuilder.shape({'age': {'>=': 65}, 'name': 'Jane'})
+    assert FilterBuilder.shape({'age': 18}) != FilterBuilder.shape({'age': {'>': 18}})
+
+    # SQL depends on the value for NULL checks
+    assert FilterBuilder.shape({'age': None}) is None
+    assert FilterBuilder.shape({'age': {'is': None}}) is None
+    assert FilterBuilder.shape({'age': {'unknown': 1}}) is None
+
+
+def test_build_bound_matches_build():
+    """Test bound clause renders the same SQL as the literal one."""
+    table = create_test_table()
+    filters = {
+        'age': {'between': [18, 65]},
+        'email': {'endswith': '@gmail.com'},
+        'status': {'in': ['active', 'pending']},
+        'name': 'John',
+    }
+
+    bound = FilterBuilder.build_bound(table, filters)
+    params = FilterBuilder.bind_params(filters)
+    sql = str(bound.compile())
+    assert 'BETWEEN' in sql and 'LIKE' in sql and 'IN' in sql
+    assert params['dbset_w1_0'] == '%@gmail.com'
+    assert params['dbset_w2_0'] == ['active', 'pending']
+    assert (params['dbset_w0_0_lo'], params['dbset_w0_0_hi']) == (18, 65)
+    assert params['dbset_w3'] == 'John'
+
+
+def test_build_bound_postgresql_in_uses_array():
+    """Test IN lists bind one array on PostgreSQL, so SQL text is stable."""
+    from sqlalchemy.dialects import postgresql
+
+    table = create_test_table()
+    filters = {'status': {'in': ['active']}, 'age': {'not_in': [1, 2, 3]}}
+
+    bound = FilterBuilder.build_bound(table, filters, dialect='postgresql')
+    sql = str(bound.compile(dialect=postgresql.dialect()))
+    assert 'ANY (' in sql and 'ALL (' in sql
+    assert 'POSTCOMPILE' not in sql
+    assert FilterBuilder.bind_params(filters)['dbset_w1_0'] == [1, 2, 3]
+
+
+def test_bind_params_validates_values():
+    """Test bind_params() applies the same checks as build()."""
+    with pytest.raises(QueryError):
+        FilterBuilder.bind_params({'age': {'between': [18]}})
+    with pytest.raises(QueryError):
+        FilterBuilder.bind_params({'status': {'in': 'active'}})
+
+
+def test_text_clause_cached():
+    """Test raw SQL strings are parsed once and reused."""
+    sql = "SELECT * FROM users WHERE age > :age"
+    stmt = text_clause(sql)
+    assert stmt is text_clause(sql)
+    assert str(stmt) == sql
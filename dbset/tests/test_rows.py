@@ -0,0 +1,28 @@
+"""Unit tests for rows.py - row materialization."""
+
+from sqlalchemy import create_engine, text
+
+from dbset.rows import iter_dicts
+
+
+def test_iter_dicts():
+    """Test rows are converted to dicts keyed by column name."""
+    engine = create_engine('sqlite:///:memory:')
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT 1 AS id, 'John' AS name UNION ALL SELECT 2, 'Jane'"))
+        rows = list(iter_dicts(result))
+
+    assert rows == [
+        {'id': 1, 'name': 'John'},
+        {'id': 2, 'name': 'Jane'},
+    ]
+    engine.dispose()
+
+
+def test_iter_dicts_empty_result():
+    """Test empty result yields nothing."""
+    engine = create_engine('sqlite:///:memory:')
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT 1 AS id WHERE 1 = 0"))
+        assert list(iter_dicts(result)) == []
+    engine.dispose()
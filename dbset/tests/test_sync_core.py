@@ -30,6 +30,14 @@ def test_table_access():
     db.close()
 
 
+def test_table_access_cached():
+    """Test repeated table access returns the same wrapper."""
+    db = connect('sqlite:///:memory:')
+    assert db['users'] is db['users']
+    assert not hasattr(db['users'], '__dict__')
+    db.close()
+
+
 def test_insert_and_find():
     """Test basic insert and find operations."""
     db = connect('sqlite:///:memory:')
@@ -447,6 +455,557 @@ def test_insert_many():
     db.close()
 
 
+def test_insert_many_multi_values(monkeypatch):
+    """Test multi-row VALUES path used for network databases."""
+    from dbset import Table
+
+    monkeypatch.setattr(Table, '_use_multi_values', property(lambda self: True))
+
+    from sqlalchemy import event
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    executemany = []
+
+    @event.listens_for(db.engine, 'before_execute')
+    def record(conn, stmt, multiparams, params, options):
+        if getattr(stmt, 'is_insert', False):
+            executemany.append(bool(multiparams))
+
+    # One multi-row VALUES statement per chunk
+    rows = [{'name': f'User{i}', 'age': i} for i in range(5)]
+    assert users.insert_many(rows, chunk_size=2) == 5
+    assert users.count() == 5
+    assert executemany == [False, False, False]
+
+    # Rows with different keys go through executemany, so missing values
+    # are not padded with NULL
+    executemany.clear()
+    assert users.insert_many([{'name': 'A', 'age': 1}, {'age': 2, 'name': 'B'}, {'name': 'C', 'age': 3}]) == 3
+    assert executemany == [False]
+    users.insert_many([{'name': 'D', 'age': 4}, {'name': 'E', 'age': 5, 'city': 'X'}])
+    assert executemany[-1] is True
+
+    db.close()
+
+
+def test_statements_reused_per_filter_shape():
+    """Test queries with the same filter shape reuse one statement."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'name': f'User{i}', 'age': i} for i in range(10)])
+
+    assert [r['age'] for r in users.find(age={'>=': 7}, _order_by='age')] == [7, 8, 9]
+    stmt = next(v for k, v in users._stmt_cache.items() if k[0][0] == 'find')
+    assert [r['age'] for r in users.find(age={'>=': 8}, _order_by='age')] == [8, 9]
+    assert sum(1 for k in users._stmt_cache if k[0][0] == 'find') == 1
+    assert next(v for k, v in users._stmt_cache.items() if k[0][0] == 'find') is stmt
+
+    assert users.count(age={'<': 3}) == 3
+    assert users.count(age={'<': 5}) == 5
+    assert users.update({'name': 'Nine'}, age=9) == 1
+    assert users.delete(name={'startswith': 'User'}) == 9
+    assert users.count() == 1
+
+    db.close()
+
+
+def test_column_map_follows_new_columns():
+    """Test cached column map picks up columns added after it was built."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John'})
+    assert users.find_one(name=None) is None
+
+    users.insert({'name': None, 'city': 'Paris'})
+    assert users.find_one(city='Paris', name=None)['city'] == 'Paris'
+
+    db.close()
+
+
+def test_distinct_auto_index():
+    """Test distinct(_auto_index=True) creates an index on the columns once."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'city': f'City{i % 3}'} for i in range(10)])
+
+    assert not users.has_index(['city'])
+    assert len(list(users.distinct('city', _auto_index=True))) == 3
+    assert users.has_index(['city'])
+    assert len(list(users.distinct('city', _auto_index=True))) == 3
+
+    db.close()
+
+
+def test_distinct_auto_index_read_only(tmp_path):
+    """Test distinct(_auto_index=True) runs no DDL in read-only mode."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    db['users'].insert_many([{'city': f'City{i % 3}'} for i in range(10)])
+
+    ro = connect(url, read_only=True)
+    assert len(list(ro['users'].distinct('city', _auto_index=True))) == 3
+    assert not ro['users'].has_index(['city'])
+
+    ro.close()
+    db.close()
+
+
+def test_distinct_reuses_statement_per_filter_shape():
+    """Test distinct() with different filter values reuses one statement."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'city': f'City{i % 3}', 'age': i} for i in range(10)])
+
+    assert len(list(users.distinct('city', age={'>=': 0}))) == 3
+    assert [r['city'] for r in users.distinct('city', age={'>=': 9})] == ['City0']
+    assert sum(1 for k in users._stmt_cache if k[0][0] == 'distinct') == 1
+
+    db.close()
+
+
+def test_upsert_skips_select(monkeypatch):
+    """Test upsert() writes with RETURNING instead of SELECT-then-write."""
+    from dbset import Table
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    pk = users.insert({'email': 'a@example.com', 'age': 1})
+
+    def fail(*args, **kwargs):
+        raise AssertionError('SELECT issued')
+
+    monkeypatch.setattr(Table, 'find_one', fail)
+
+    # UPDATE ... RETURNING (plain index on keys)
+    assert users.upsert({'email': 'a@example.com', 'age': 2}, keys=['email']) == pk
+    new_pk = users.upsert({'email': 'b@example.com', 'age': 3}, keys=['email'])
+    assert new_pk != pk
+
+    # INSERT ... ON CONFLICT DO UPDATE ... RETURNING (unique index on keys)
+    users.create_index(['age'], unique=True)
+    assert users.upsert({'age': 3, 'email': 'c@example.com'}, keys=['age']) == new_pk
+    monkeypatch.undo()
+
+    assert users.count() == 2
+    assert users.find_one(age=3)['email'] == 'c@example.com'
+    assert users.find_one(email='a@example.com')['age'] == 2
+
+    db.close()
+
+
+def test_upsert_many_native(monkeypatch):
+    """Test upsert_many uses ON CONFLICT when keys have a unique index."""
+    from dbset import Table
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'email': f'u{i}@example.com', 'age': i} for i in range(3)])
+    users.create_index(['email'], unique=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('row-by-row upsert used')
+
+    monkeypatch.setattr(Table, 'upsert', fail)
+
+    rows = [
+        {'email': 'u1@example.com', 'age': 10},
+        {'email': 'new@example.com', 'age': 20},
+        {'email': 'new@example.com', 'age': 21},  # Last one wins
+    ]
+    assert users.upsert_many(rows, keys=['email']) == 3
+    assert users.count() == 4
+    assert users.find_one(email='u1@example.com')['age'] == 10
+    assert users.find_one(email='new@example.com')['age'] == 21
+
+    db.close()
+
+
+def test_upsert_many_falls_back_without_unique_index():
+    """Test upsert_many keeps per-row semantics for non-unique keys."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+
+    rows = [{'email': 'a@example.com', 'age': 1}, {'email': 'a@example.com', 'age': 2}]
+    assert users.upsert_many(rows, keys=['email']) == 2
+    assert users.count() == 1
+    assert users.find_one(email='a@example.com')['age'] == 2
+
+    db.close()
+
+
+def test_query_raw_sql_and_statement():
+    """Test query() accepts raw SQL strings and SQLAlchemy statements."""
+    from sqlalchemy import select
+
+    db = connect('sqlite:///:memory:')
+    db['users'].insert_many([{'name': f'User{i}', 'age': i} for i in range(5)])
+
+    rows = list(db.query("SELECT name FROM users WHERE age >= :age ORDER BY age", age=3))
+    assert rows == [{'name': 'User3'}, {'name': 'User4'}]
+
+    table = db['users'].table
+    rows = list(db.query(select(table.c.age).where(table.c.age < 2)))
+    assert rows == [{'age': 0}, {'age': 1}]
+
+    db.close()
+
+
+def test_query_update_returning_not_streamed():
+    """Test query() streams only SELECTs, and not with _stream=False."""
+    from sqlalchemy import event, update
+
+    db = connect('sqlite:///:memory:')
+    db['users'].insert_many([{'name': f'User{i}', 'age': i} for i in range(3)])
+    streamed = []
+    event.listen(
+        db.engine, 'before_execute',
+        lambda conn, stmt, multiparams, params, options: streamed.append('yield_per' in options),
+    )
+
+    table = db['users'].table
+    stmt = update(table).where(table.c.age >= 1).values(age=table.c.age + 10).returning(table.c.age)
+    assert sorted(row['age'] for row in db.query(stmt)) == [11, 12]
+    assert db['users'].count(age=11) == 1
+
+    rows = list(db.query("SELECT name FROM users WHERE age = :age", _stream=False, age=0))
+    assert rows == [{'name': 'User0'}]
+    rows = list(db.query("UPDATE users SET age = 20 WHERE age = :age RETURNING age", age=0))
+    assert rows == [{'age': 20}]
+    assert list(db.query("  select count(*) AS n FROM users")) == [{'n': 3}]
+    assert streamed == [False, False, False, False, True]
+
+    db.close()
+
+
+def test_new_columns_patch_cached_table():
+    """Test auto-added columns extend the Table object in place."""
+    from sqlalchemy import Integer
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John'})
+    table = users.table
+
+    assert db._schema.ensure_columns(table, {'age': Integer()}) is table
+    assert 'age' in table.c
+    users.insert({'name': 'Jane', 'age': 25})
+    assert users.find_one(name='Jane')['age'] == 25
+
+    db.close()
+
+
+def test_schema_reflected_once(tmp_path, monkeypatch):
+    """Test writes reuse the reflected schema, finding new tables on demand."""
+    from sqlalchemy import create_engine, text
+
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    users = db['users']
+    users.insert({'name': 'John'})
+
+    calls = []
+    monkeypatch.setattr(db._schema._metadata, 'clear', lambda: calls.append(1))
+    users.insert({'name': 'Jane', 'age': 25})
+    users.create_index('name')
+    assert calls == []
+
+    # Table created outside this Database is reflected on first access
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE external (id INTEGER PRIMARY KEY, title TEXT)'))
+        conn.execute(text("INSERT INTO external (title) VALUES ('x')"))
+    engine.dispose()
+    assert db['external'].find_one(title='x')['id'] == 1
+    assert calls == []
+
+    db.close()
+
+
+def test_reflection_cache(tmp_path, monkeypatch):
+    """Test reflected schema is stored on disk and reused by new connections."""
+    from sqlalchemy import MetaData
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    db['users'].insert({'name': 'John'})
+    db.close()
+
+    db = connect(url, force_new=True, reflection_cache_ttl=60)  # Reflects, stores
+    db.close()
+    assert len(list((tmp_path / 'cache' / 'dbset').glob('*.pickle'))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError('schema should come from the cache')
+
+    monkeypatch.setattr(MetaData, 'reflect', fail)
+    db = connect(url, force_new=True, reflection_cache_ttl=60)
+    assert db['users'].find_one(name='John')['name'] == 'John'
+
+    # Schema changes discard the cached copy
+    db['users'].insert({'name': 'Jane', 'age': 30})
+    assert list((tmp_path / 'cache' / 'dbset').glob('*.pickle')) == []
+    db.close()
+
+
+def test_tables_follow_ddl():
+    """Test cached table listing is refreshed by table creation and drop."""
+    db = connect('sqlite:///:memory:')
+    assert db.tables == []
+
+    db['users'].insert({'name': 'John'})
+    db['orders'].insert({'total': 5})
+    assert sorted(db.tables) == ['orders', 'users']
+
+    db._schema.drop_table('orders')
+    assert db.tables == ['users']
+
+    db.close()
+
+
+def test_insert_skips_type_inference_for_known_columns(monkeypatch):
+    """Test only keys that are not columns yet go through type inference."""
+    from dbset.types import TypeInference
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John'})
+
+    inferred = []
+    infer = TypeInference.infer_types_from_rows
+    monkeypatch.setattr(
+        TypeInference, 'infer_types_from_rows',
+        lambda rows, **kw: inferred.append(set(rows[0])) or infer(rows, **kw),
+    )
+    users.insert({'name': 'Jane'})
+    users.insert({'name': 'Bob', 'age': 30})
+    assert inferred == [{'age'}]
+    assert users.find_one(name='Bob')['age'] == 30
+
+    db.close()
+
+
+def test_upsert_creates_key_index_once(monkeypatch):
+    """Test repeated upserts do not re-check the key index."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+
+    calls = []
+    create_index = db._schema.create_index
+    monkeypatch.setattr(
+        db._schema, 'create_index',
+        lambda *args, **kw: calls.append(args[1]) or create_index(*args, **kw),
+    )
+    users.upsert({'email': 'a@example.com', 'name': 'A'}, keys=['email'])
+    users.upsert({'email': 'a@example.com', 'name': 'B'}, keys=['email'])
+    users.upsert_many([{'email': 'b@example.com', 'name': 'C'}], keys=['email'])
+    assert calls == [['email']]
+    assert users.has_index('email')
+    assert users.count() == 2
+
+    db.close()
+
+
+def test_counts():
+    """Test counting several tables in one query."""
+    db = connect('sqlite:///:memory:')
+    db['users'].insert_many([{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 17}])
+    db['orders'].insert({'total': 10})
+
+    assert db.counts('orders', ('users', {'age': {'>=': 18}})) == {'orders': 1, 'users': 1}
+    assert db.counts() == {}
+
+    db.close()
+
+
+def test_insert_many_infers_types_from_all_rows():
+    """Test a column NULL in the first row gets the type of later rows."""
+    from sqlalchemy import Integer
+
+    db = connect('sqlite:///:memory:')
+    items = db['items']
+    items.insert_many([{'name': 'a', 'qty': None}, {'name': 'b', 'qty': 3}])
+
+    assert isinstance(items.table.c.qty.type, Integer)
+
+    db.close()
+
+
+def test_execute_many():
+    """Test executing one statement for many parameter sets."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'name': 'John', 'score': 0}, {'name': 'Jane', 'score': 0}])
+
+    count = db.execute_many(
+        "UPDATE users SET score = :score WHERE name = :name",
+        [{'name': 'John', 'score': 10}, {'name': 'Jane', 'score': 20}],
+    )
+    assert count == 2
+    assert users.find_one(name='Jane')['score'] == 20
+    assert db.execute_many("DELETE FROM users", []) == 0
+
+    db.close()
+
+    db = connect('sqlite:///:memory:', read_only=True)
+    with pytest.raises(ReadOnlyError):
+        db.execute_many("DELETE FROM users WHERE id = :id", [{'id': 1}])
+    db.close()
+
+
+def test_bulk_inserter():
+    """Test buffered bulk inserts flush per chunk and on exit."""
+    db = connect('sqlite:///:memory:')
+
+    with db.bulk(chunk_size=10) as bulk:
+        for i in range(25):
+            bulk.insert('users', {'name': f'User{i}', 'age': i})
+        assert bulk.count == 20
+
+    assert bulk.count == 25
+    assert db['users'].count() == 25
+
+    with pytest.raises(RuntimeError):
+        with db.bulk() as bulk:
+            bulk.insert('users', {'name': 'Lost'})
+            raise RuntimeError('boom')
+
+    assert db['users'].count() == 25
+
+    db.close()
+
+
+def test_bulk_inserter_mixed_keys():
+    """Test buffered rows with different keys are all written."""
+    db = connect('sqlite:///:memory:')
+
+    with db.bulk() as bulk:
+        bulk.insert('v', {'a': 1})
+        bulk.insert('v', {'b': 2})
+        bulk.insert('v', {'a': 3, 'b': 4})
+
+    assert bulk.count == 3
+    assert db['v'].count(a=3, b=4) == 1
+    assert db['v'].count(b=2) == 1
+
+    db.close()
+
+
+def test_transaction(tmp_path):
+    """Test table operations inside transaction() share its connection."""
+    db = connect(f'sqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+    users.insert({'name': 'John'})
+
+    with db.transaction() as conn:
+        users.insert({'name': 'Jane', 'age': 25})
+        assert db._pool.current is conn
+        assert users.count() == 2
+    assert db._pool.current is None
+    assert users.find_one(name='Jane')['age'] == 25
+
+    with pytest.raises(Exception):
+        with db.transaction():
+            users.insert({'name': 'Bob'})
+            raise ValueError('rollback')
+    assert users.count() == 2
+
+    db.close()
+
+
+def test_transaction_batch_mixed_keys(tmp_path):
+    """Test transaction(batch=True) writes rows with different keys."""
+    db = connect(f'sqlite:///{tmp_path}/test.db', force_new=True)
+
+    with db.transaction(batch=True) as tx:
+        tx.insert('v', {'a': 1})
+        tx.insert('v', {'b': 2})
+        tx.insert('v', {'a': 3, 'b': 4})
+
+    assert db['v'].count() == 3
+    assert db['v'].count(a=3, b=4) == 1
+
+    db.close()
+
+
+def test_transaction_batch(tmp_path):
+    """Test transaction(batch=True) buffers inserts and writes them on commit."""
+    db = connect(f'sqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+
+    with db.transaction(batch=True, chunk_size=2) as tx:
+        for i in range(3):
+            tx.insert('users', {'name': f'user{i}'})
+        assert tx.count == 2  # First chunk written, last row buffered
+    assert users.count() == 3
+
+    with pytest.raises(Exception):
+        with db.transaction(batch=True, chunk_size=2) as tx:
+            for i in range(3):
+                tx.insert('users', {'name': f'other{i}'})
+            raise ValueError('rollback')
+    assert users.count() == 3
+
+    db.close()
+
+
+def test_connect_shares_engine(tmp_path):
+    """Test repeated connect() calls reuse one database and pool."""
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    db = connect(url)
+    assert connect(url) is db
+    assert connect(url, pool_recycle=60) is not db
+    assert connect(url, force_new=True) is not db
+    assert connect('sqlite:///:memory:') is not connect('sqlite:///:memory:')
+    db['t'].insert({'a': 1})
+    db.close()
+
+    # A closed database is not handed out again
+    (tmp_path / 'shared.db').unlink()
+    db2 = connect(url)
+    assert db2 is not db
+    db2['t'].insert({'a': 1})
+    assert db2['t'].count() == 1
+    db2.close()
+
+
+def test_connect_enables_psycopg2_batch_mode(monkeypatch):
+    """Test connect() turns on psycopg2 batch executemany for PostgreSQL URLs."""
+    from dbset import Database
+
+    captured = {}
+    monkeypatch.setattr(Database, 'connect', lambda **kwargs: captured.update(kwargs))
+
+    connect('postgresql://localhost/mydb')
+    assert captured['executemany_mode'] == 'values_plus_batch'
+    assert captured['insertmanyvalues_page_size'] == 1000
+
+    # User-supplied values win
+    captured.clear()
+    connect('postgresql://localhost/mydb', executemany_mode='values_only')
+    assert captured['executemany_mode'] == 'values_only'
+
+    # Not applied to other dialects
+    captured.clear()
+    connect('sqlite:///:memory:')
+    assert 'executemany_mode' not in captured
+
+
+def test_find_streams_in_batches():
+    """Test find() returns all rows when streaming in small batches."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+
+    users.insert_many([{'name': f'User{i}', 'age': i} for i in range(25)])
+
+    results = list(users.find(_stream_size=10, _order_by='age'))
+    assert len(results) == 25
+    assert [row['age'] for row in results] == list(range(25))
+
+    db.close()
+
+
 def test_order_by():
     """Test ordering results."""
     db = connect('sqlite:///:memory:')
@@ -595,3 +1154,309 @@ def test_decimal_query_filtering():
     assert cheap['name'] == 'Cheap'
 
     db.close()
+
+
+def test_new_columns_added_in_order():
+    """Test several new columns are added in one go, in row order."""
+    from sqlalchemy import Column, Integer, MetaData, Table, Text
+    from sqlalchemy.dialects import postgresql, sqlite
+    from dbset.schema import add_columns_sql
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John'})
+    users.insert({'name': 'Jane', 'zeta': 'z', 'alpha': 1, 'mid': 'm'})
+    assert [c.name for c in users.table.columns][-3:] == ['zeta', 'alpha', 'mid']
+    assert users.find_one(alpha=1)['zeta'] == 'z'
+    db.close()
+
+    table = Table('t', MetaData(), Column('id', Integer))
+    new = [Column('a', Text), Column('b', Integer)]
+    assert add_columns_sql(postgresql.dialect(), table, new) == [
+        'ALTER TABLE t ADD COLUMN a TEXT, ADD COLUMN b INTEGER'
+    ]
+    assert add_columns_sql(sqlite.dialect(), table, new) == [
+        'ALTER TABLE t ADD COLUMN a TEXT',
+        'ALTER TABLE t ADD COLUMN b INTEGER',
+    ]
+
+    cache = {}
+    add_columns_sql(sqlite.dialect(), table, new, cache)
+    assert cache[(Text, 'Text()')] == 'TEXT'
+    cache[(Text, 'Text()')] = 'CLOB'
+    assert add_columns_sql(sqlite.dialect(), table, new[:1], cache) == [
+        'ALTER TABLE t ADD COLUMN a CLOB'
+    ]
+
+
+def test_table_exists_without_reflect():
+    """Test table_exists answers with a has_table probe, not a reflect."""
+    db = connect('sqlite:///:memory:')
+    db['users'].insert({'name': 'John'})
+    db._schema.invalidate()
+
+    assert db._schema.table_exists('users')
+    assert not db._schema.table_exists('missing')
+    assert db._schema._reflected is False
+
+    db.close()
+
+
+def test_has_index_sees_external_index(tmp_path):
+    """Test has_index queries the database instead of reflecting metadata."""
+    from sqlalchemy import create_engine, text
+
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    users = db['users']
+    users.insert({'name': 'John', 'city': 'Paris'})
+    assert not users.has_index('city')
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text('CREATE INDEX ext_city ON users (city)'))
+    engine.dispose()
+    db._schema.invalidate_cache()
+
+    assert users.has_index('city')
+    assert not users.has_index(['city', 'name'])
+    assert db._schema._reflected is True
+
+    db.close()
+
+
+def test_table_created_externally_after_miss(tmp_path):
+    """Test a table missing once is found after it is created elsewhere."""
+    from sqlalchemy import create_engine, text
+    from dbset import TableNotFoundError
+
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    db['seed'].insert({'a': 1})
+    with pytest.raises(TableNotFoundError):
+        db['x'].insert({'a': 'q'}, ensure=False)
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE x (id INTEGER PRIMARY KEY, a TEXT)'))
+        conn.execute(text("INSERT INTO x (a) VALUES ('e')"))
+        conn.execute(text('CREATE TABLE y (id INTEGER PRIMARY KEY, b TEXT)'))
+    engine.dispose()
+
+    db['x'].insert({'a': 'w'})
+    assert [row['a'] for row in db['x'].all()] == ['e', 'w']
+
+    # CREATE TABLE IF NOT EXISTS is a no-op here - columns come from the database
+    table = db._schema.create_table('y')
+    assert 'b' in table.c
+
+    db.close()
+
+
+def test_two_databases_add_columns(tmp_path):
+    """Test columns added by another Database are picked up on write and filter."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db_a = connect(url, force_new=True)
+    db_b = connect(url, force_new=True)
+    db_a['t'].insert({'x': 1})
+    db_b['t'].insert({'x': 1})
+
+    db_a['t'].insert({'x': 2, 'y': 5})
+    assert db_b['t'].insert({'x': 3, 'y': 6}) == 4
+    assert [row['x'] for row in db_b['t'].find(y=5)] == [2]
+
+    db_a['t'].insert({'x': 4, 'z': 7})
+    assert db_b['t'].count(z=7) == 1
+
+    db_a.close()
+    db_b.close()
+
+
+def test_invalidate_reloads_schema(tmp_path):
+    """Test db.invalidate() picks up DDL made outside the Database."""
+    from sqlalchemy import create_engine, text
+
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    db = connect(url)
+    users = db['users']
+    users.insert({'name': 'John'})
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text('ALTER TABLE users ADD COLUMN city TEXT'))
+    engine.dispose()
+    assert 'city' not in users.table.c
+
+    db.invalidate()
+    assert 'city' in users.table.c
+    assert db['users'] is users
+
+    db.close()
+
+
+def test_create_table_sql_template():
+    """Test the precompiled CREATE TABLE is reused and names are quoted."""
+    from sqlalchemy import MetaData, Table
+    from sqlalchemy.dialects import postgresql
+    from dbset.schema import _create_table_template, create_table_sql
+    from dbset.types import default_pk_config
+
+    dialect = postgresql.dialect()
+    pk_config = default_pk_config()
+    table = Table('my-table', MetaData(), pk_config.get_column(), schema='app')
+
+    sql = create_table_sql(dialect, table, pk_config)
+    assert 'CREATE TABLE IF NOT EXISTS app."my-table" (' in sql
+    assert 'id SERIAL NOT NULL' in sql
+    hits = _create_table_template.cache_info().hits
+    create_table_sql(dialect, table, pk_config)
+    assert _create_table_template.cache_info().hits == hits + 1
+
+    db = connect('sqlite:///:memory:')
+    db['100%'].insert({'name': 'John'})
+    assert db['100%'].find_one(name='John')['id'] == 1
+    db.close()
+
+
+def test_cached_find_sees_new_columns():
+    """Test statements reused per filter shape pick up columns added later."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John'})
+    assert users.find_one(name='John') == {'id': 1, 'name': 'John'}
+
+    users.insert({'name': 'Jane', 'city': 'Paris'})
+    assert users.find_one(name='John') == {'id': 1, 'name': 'John', 'city': None}
+    assert users.find_one(name='Jane')['city'] == 'Paris'
+
+    db.close()
+
+
+def test_find_as_rows():
+    """Test find(_as_dict=False) yields Row objects."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 25}])
+
+    rows = list(users.find(_order_by='age', _as_dict=False))
+
+    assert [row.name for row in rows] == ['Jane', 'John']
+    assert rows[0]._mapping['age'] == 25
+
+    db.close()
+
+
+def test_upsert_many_fallback_single_transaction():
+    """Test row-by-row upsert_many runs in one transaction."""
+    from sqlalchemy import event
+
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert({'name': 'John', 'age': 30})
+
+    begins = []
+    event.listen(db.engine, 'begin', lambda conn: begins.append(1))
+    # 'name' has no unique index, so rows go through upsert() one by one
+    users.upsert_many(
+        [{'name': 'John', 'age': 31}, {'name': 'Jane', 'age': 25}],
+        keys=['name'],
+        ensure=False,
+    )
+
+    assert len(begins) == 1
+    assert users.find_one(name='John')['age'] == 31
+    assert users.find_one(name='Jane')['age'] == 25
+
+    db.close()
+
+
+def test_find_one_by_pk_reuses_statement():
+    """Test single equality lookups share one cached statement."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    first = users.insert({'name': 'John'})
+    second = users.insert({'name': 'Jane'})
+
+    assert users.find_one(id=first)['name'] == 'John'
+    cached = dict(users._stmt_cache)
+    assert users.find_one(id=second)['name'] == 'Jane'
+    assert users.find_one(id=-1) is None
+    assert users._stmt_cache == cached
+
+    db.close()
+
+
+def test_compiled_cache_size():
+    """Test engine compiled cache size default and override."""
+    from dbset.sync_core import QUERY_CACHE_SIZE
+
+    db = connect('sqlite:///:memory:')
+    assert db.engine._compiled_cache.capacity == QUERY_CACHE_SIZE
+    db.close()
+
+    db = connect('sqlite:///:memory:', query_cache_size=10)
+    assert db.engine._compiled_cache.capacity == 10
+    db.close()
+
+
+def test_transaction_rollback_forgets_new_table(tmp_path):
+    """Test tables and columns created in a rolled back transaction are forgotten."""
+    db = connect(f'sqlite:///{tmp_path}/test.db', force_new=True)
+    users = db['users']
+    users.insert({'name': 'John'})
+
+    with pytest.raises(ValueError):
+        with db.transaction():
+            db['fresh'].insert({'name': 'Jane'})
+            users.insert({'name': 'Bob', 'age': 30})
+            raise ValueError('rollback')
+
+    db['fresh'].insert({'name': 'Jane'})
+    assert db['fresh'].count() == 1
+    users.insert({'name': 'Bob', 'age': 30})
+    assert users.find_one(name='Bob')['age'] == 30
+
+    db.close()
+
+
+def test_find_one_order_and_offset():
+    """Test find_one() applies _order_by and _offset."""
+    db = connect('sqlite:///:memory:')
+    users = db['users']
+    users.insert_many([
+        {'name': 'John', 'age': 30},
+        {'name': 'Jane', 'age': 25},
+        {'name': 'Bob', 'age': 35},
+    ])
+
+    assert users.find_one(_order_by='-age')['name'] == 'Bob'
+    assert users.find_one(_order_by='age', _offset=1)['name'] == 'John'
+    assert users.find_one(_order_by='age', age={'>': 25})['name'] == 'John'
+
+    db.close()
+
+
+def test_exceptions_pickle():
+    """Test exceptions keep their attributes across a pickle round trip."""
+    import pickle
+
+    from dbset.exceptions import (
+        ColumnNotFoundError,
+        ReadOnlyError,
+        SchemaError,
+        TableNotFoundError,
+    )
+
+    error = pickle.loads(pickle.dumps(TableNotFoundError('users')))
+    assert error.table_name == 'users'
+    assert str(error) == "Table 'users' does not exist"
+
+    error = pickle.loads(pickle.dumps(ColumnNotFoundError('age', 'users')))
+    assert (error.column_name, error.table_name) == ('age', 'users')
+
+    error = pickle.loads(pickle.dumps(ReadOnlyError('insert')))
+    assert error.operation == 'insert'
+
+    error = pickle.loads(pickle.dumps(SchemaError('failed', 'users')))
+    assert error.table_name == 'users'
+    assert str(error) == 'failed'
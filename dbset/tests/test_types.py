@@ -85,6 +85,27 @@ def test_infer_unknown_type():
         TypeInference.infer_type(object())
 
 
+def test_infer_subclasses():
+    """Test subclasses of supported types resolve via their base type."""
+    from enum import IntEnum
+
+    class Priority(IntEnum):
+        LOW = 1
+
+    class MyDateTime(datetime):
+        pass
+
+    class MyDict(dict):
+        pass
+
+    assert isinstance(TypeInference.infer_type(Priority.LOW), Integer)
+    assert isinstance(TypeInference.infer_type(MyDateTime(2024, 1, 1)), DateTime)
+    assert isinstance(TypeInference.infer_type(MyDict(), dialect='postgresql'), JSONB)
+
+    # Second lookup uses the cached handler
+    assert isinstance(TypeInference.infer_type(Priority.LOW), Integer)
+
+
 def test_infer_types_from_row():
     """Test inferring types for entire row."""
     row = {
@@ -104,6 +125,24 @@ def test_infer_types_from_row():
     assert isinstance(types['created_at'], DateTime)
 
 
+def test_infer_types_from_rows():
+    """Test inferring types over several rows, merging per column."""
+    rows = [
+        {'name': 'John', 'score': None, 'price': Decimal('1.5'), 'note': None},
+        {'name': 'Jane', 'score': 1, 'price': Decimal('123.456'), 'note': None},
+        {'name': 'Bob', 'score': 2.5, 'price': Decimal('2'), 'note': None},
+    ]
+
+    types = TypeInference.infer_types_from_rows(rows)
+
+    assert list(types) == ['name', 'score', 'price', 'note']
+    assert isinstance(types['name'], Text)
+    assert isinstance(types['score'], Float)
+    assert isinstance(types['price'], Numeric)
+    assert (types['price'].precision, types['price'].scale) == (6, 3)
+    assert isinstance(types['note'], Text)
+
+
 def test_merge_same_types():
     """Test merging identical types."""
     type1 = Integer()
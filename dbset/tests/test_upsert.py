@@ -0,0 +1,97 @@
+"""Unit tests for upsert.py - native upsert statements."""
+
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table
+from sqlalchemy.dialects import mysql, postgresql
+
+from dbset.upsert import build_upsert, dedupe_rows, has_unique_key, prepare_upsert
+
+
+def create_test_table():
+    """Create a test SQLAlchemy table with a unique email index."""
+    metadata = MetaData()
+    table = Table(
+        'users',
+        metadata,
+        Column('id', Integer, primary_key=True),
+        Column('email', String(255)),
+        Column('name', String(255)),
+        Column('city', String(255)),
+    )
+    Index('idx_users_email', table.c.email, unique=True)
+    Index('idx_users_city', table.c.city)
+    return table
+
+
+def test_has_unique_key():
+    """Test only unique indexes and the primary key count as conflict targets."""
+    table = create_test_table()
+    assert has_unique_key(table, ['email'])
+    assert has_unique_key(table, ['id'])
+    assert not has_unique_key(table, ['city'])
+    assert not has_unique_key(table, ['email', 'name'])
+
+
+def test_build_upsert_postgresql():
+    """Test ON CONFLICT statement updates non-key columns."""
+    table = create_test_table()
+    stmt = build_upsert(table, ['email'], ('email', 'name'), 'postgresql')
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert 'ON CONFLICT (email) DO UPDATE SET name = excluded.name' in sql
+
+    stmt = build_upsert(table, ['email'], ('email',), 'postgresql')
+    assert 'DO NOTHING' in str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_build_upsert_mysql():
+    """Test ON DUPLICATE KEY UPDATE statement for MySQL."""
+    table = create_test_table()
+    stmt = build_upsert(table, ['email'], ('email', 'name'), 'mysql')
+    assert 'ON DUPLICATE KEY UPDATE' in str(stmt.compile(dialect=mysql.dialect()))
+
+    # Key-only rows: no-op update instead of INSERT IGNORE
+    stmt = build_upsert(table, ['email'], ('email',), 'mysql')
+    sql = str(stmt.compile(dialect=mysql.dialect()))
+    assert 'IGNORE' not in sql
+    assert 'ON DUPLICATE KEY UPDATE email = VALUES(email)' in sql
+
+
+def test_build_upsert_unsupported_dialect():
+    """Test dialects without native upsert return None."""
+    assert build_upsert(create_test_table(), ['email'], ('email',), 'mssql') is None
+
+
+def test_dedupe_rows_keeps_last():
+    """Test duplicate keys keep the last row."""
+    rows = [{'email': 'a', 'name': 'A1'}, {'email': 'b', 'name': 'B'}, {'email': 'a', 'name': 'A2'}]
+    assert dedupe_rows(rows, ['email']) == [{'email': 'a', 'name': 'A2'}, {'email': 'b', 'name': 'B'}]
+
+
+def test_prepare_upsert_requirements():
+    """Test batches that need per-row semantics are rejected."""
+    table = create_test_table()
+    rows = [{'email': 'a', 'name': 'A'}]
+    assert prepare_upsert(table, rows, ['email'], 'sqlite') is not None
+
+    # Non-unique key, NULL key, mixed columns, unknown column
+    assert prepare_upsert(table, rows, ['city'], 'sqlite') is None
+    assert prepare_upsert(table, [{'email': None, 'name': 'A'}], ['email'], 'sqlite') is None
+    assert prepare_upsert(table, rows + [{'email': 'b'}], ['email'], 'sqlite') is None
+    assert prepare_upsert(table, [{'email': 'a', 'extra': 1}], ['email'], 'sqlite') is None
+
+
+def test_prepare_upsert_uses_statement_cache():
+    """Test the statement is built once per key and column set."""
+    table = create_test_table()
+    cache = {}
+
+    def cached_stmt(key, build):
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+
+    first, _ = prepare_upsert(table, [{'email': 'a', 'name': 'A'}], ['email'], 'postgresql',
+                              cached_stmt=cached_stmt)
+    second, _ = prepare_upsert(table, [{'email': 'b', 'name': 'B'}], ['email'], 'postgresql',
+                               cached_stmt=cached_stmt)
+    assert first is second
+    assert list(cache) == [('upsert', ('email',), ('email', 'name'))]
@@ -362,6 +362,19 @@ class TestPrimaryKeyConfig:
         value = pk_config.generate_value()
         assert value is None  # Integer uses DB autoincrement
 
+    def test_default_pk_config_shared(self):
+        """Test default configs are shared between connections."""
+        from dbset.types import default_pk_config
+
+        db1 = connect('sqlite:///:memory:')
+        db2 = connect('sqlite:///:memory:')
+        assert db1._pk_config is db2._pk_config
+        assert db1._pk_config is default_pk_config()
+        assert default_pk_config('uuid', 'user_id').column_name == 'user_id'
+        assert not hasattr(db1._pk_config, '__dict__')
+        db1.close()
+        db2.close()
+
     def test_primary_key_config_uuid(self):
         """Test PrimaryKeyConfig for UUID type."""
         pk_config = PrimaryKeyConfig(pk_type='uuid')